@@ -1,8 +1,7 @@
 from app import create_app
 import logging
 
-# Configure logging
-logging.basicConfig(level=logging.DEBUG)
+# Logging is configured by create_app() (LOG_LEVEL / LOG_LEVELS / LOG_FORMAT)
 logger = logging.getLogger(__name__)
 
 app = create_app()
@@ -0,0 +1,56 @@
+import os
+from a2wsgi import WSGIMiddleware
+from quart import Quart
+from werkzeug.exceptions import HTTPException
+
+from app.aio.database import async_session_manager
+
+def create_async_app():
+    """Quart app serving the read-heavy endpoints on an AsyncSession."""
+    from app import DEFAULT_DATABASE_URL
+
+    app = Quart(__name__)
+    app.config['SQLALCHEMY_DATABASE_URI'] = os.getenv('DATABASE_URL', DEFAULT_DATABASE_URL)
+    async_session_manager.init_app(app)
+
+    @app.after_request
+    async def allow_cors(response):
+        # Same default policy as flask_cors.CORS(app) on the sync app
+        response.headers.setdefault('Access-Control-Allow-Origin', '*')
+        return response
+
+    from app.aio.routes import account_bp, auth_bp, transaction_bp, user_bp
+
+    app.register_blueprint(account_bp)
+    app.register_blueprint(auth_bp)
+    app.register_blueprint(transaction_bp)
+    app.register_blueprint(user_bp)
+
+    return app
+
+def create_asgi_app(flask_app=None):
+    """ASGI entry point exposing every endpoint of the Flask blueprints.
+
+    Requests that match an async route are served by the Quart app, so one
+    process can keep hundreds of slow reads in flight. Everything else
+    (writes, less frequent endpoints) runs on the Flask app in a bounded
+    thread pool.
+    """
+    from app import create_app
+
+    async_app = create_async_app()
+    wsgi_app = WSGIMiddleware(
+        flask_app or create_app(),
+        workers=int(os.getenv('ASGI_WSGI_WORKERS', 10))
+    )
+    url_adapter = async_app.url_map.bind('localhost')
+
+    async def application(scope, receive, send):
+        if scope['type'] == 'http':
+            try:
+                url_adapter.match(scope['path'], method=scope['method'])
+            except HTTPException:
+                return await wsgi_app(scope, receive, send)
+        return await async_app(scope, receive, send)
+
+    return application
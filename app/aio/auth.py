@@ -0,0 +1,63 @@
+import time
+from functools import wraps
+
+import jwt
+from quart import g, jsonify, request
+
+from app.aio.database import async_session_manager
+from app.aio.repositories import AsyncUserRepository
+from app.utils.auth import decode_token
+from app.utils.cache import principal_cache
+
+def token_required(f):
+    """Async counterpart of app.utils.auth.token_required (shares the principal cache)."""
+    @wraps(f)
+    async def decorated(*args, **kwargs):
+        token = None
+        auth_header = request.headers.get('Authorization', '')
+        if auth_header.startswith('Bearer '):
+            token = auth_header.split(' ')[1]
+
+        if not token:
+            return jsonify({'message': 'Token is missing!'}), 401
+
+        try:
+            data = decode_token(token)
+        except jwt.ExpiredSignatureError:
+            return jsonify({'message': 'Token has expired!'}), 401
+        except jwt.InvalidTokenError:
+            return jsonify({'message': 'Invalid token!'}), 401
+
+        cache_key = (str(data['user_id']), data.get('iat'))
+        current_user = principal_cache.get(cache_key)
+        if current_user is None:
+            # Taken before the read, so an invalidation racing with it still wins
+            loaded_at = time.time()
+            async with async_session_manager.session_scope() as session:
+                user = await AsyncUserRepository(session).find_by_id(data['user_id'])
+            if not user:
+                return jsonify({'message': 'User not found!'}), 401
+            current_user = user.to_dict()
+            principal_cache.set(cache_key, current_user, loaded_at)
+
+        g.current_user = dict(current_user)
+        return await f(*args, **kwargs)
+    return decorated
+
+def admin_required(f):
+    @wraps(f)
+    async def decorated(*args, **kwargs):
+        current_user = getattr(g, 'current_user', None)
+        if current_user is None:
+            return jsonify({'message': 'Authentication required!'}), 401
+        if not current_user.get('is_admin', False):
+            return jsonify({'message': 'Admin access required!'}), 403
+        return await f(*args, **kwargs)
+    return decorated
+
+def current_user_id() -> int:
+    current_user = g.current_user
+    return int(current_user['id']) if isinstance(current_user['id'], str) else current_user['id']
+
+def is_admin() -> bool:
+    return g.current_user.get('is_admin', False)
@@ -0,0 +1,51 @@
+from contextlib import asynccontextmanager
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.utils.database_session_manager import pool_options_from_env
+
+# Sync driver URL prefix -> asyncio driver URL prefix
+ASYNC_DRIVERS = {
+    'postgresql://': 'postgresql+asyncpg://',
+    'postgresql+psycopg2://': 'postgresql+asyncpg://',
+    'sqlite://': 'sqlite+aiosqlite://',
+}
+
+def async_database_url(database_uri: str) -> str:
+    """Translate the app's sync database URL to its asyncio driver."""
+    for sync_prefix, async_prefix in ASYNC_DRIVERS.items():
+        if database_uri.startswith(sync_prefix):
+            return async_prefix + database_uri[len(sync_prefix):]
+    return database_uri
+
+class AsyncDatabaseSessionManager:
+    def __init__(self):
+        self.engine = None
+        self.SessionLocal = None
+
+    def init_app(self, app):
+        database_uri = app.config.get('SQLALCHEMY_DATABASE_URI')
+        if not database_uri:
+            raise ValueError("SQLALCHEMY_DATABASE_URI must be set in app configuration")
+
+        url = async_database_url(database_uri)
+        # SQLite stand-ins use a single-connection pool without sizing options
+        options = {} if url.startswith('sqlite') else pool_options_from_env()
+        self.engine = create_async_engine(url, **options)
+        self.SessionLocal = async_sessionmaker(self.engine, expire_on_commit=False)
+
+        app.after_serving(self.dispose)
+
+    @asynccontextmanager
+    async def session_scope(self):
+        """Provide an AsyncSession that is closed when the block exits."""
+        if self.SessionLocal is None:
+            raise RuntimeError("Async database session not initialized. Call init_app first.")
+        async with self.SessionLocal() as session:
+            yield session
+
+    async def dispose(self):
+        if self.engine is not None:
+            await self.engine.dispose()
+
+# Create a global instance
+async_session_manager = AsyncDatabaseSessionManager()
@@ -0,0 +1,133 @@
+from datetime import datetime
+from typing import List, Optional, Tuple
+from sqlalchemy import exists, literal, or_, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Select
+
+from app.models.account import Account
+from app.models.transaction import Transaction
+from app.models.user import User
+from app.partitions import transaction_number_window, utc
+from app.repositories.transaction import STREAM_BATCH_SIZE
+
+class AsyncAccountRepository:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def find_by_id(self, account_id) -> Optional[Account]:
+        try:
+            return await self.db.get(Account, int(account_id))
+        except (TypeError, ValueError):
+            return None
+
+    async def find_by_account_number(self, account_number: str) -> Optional[Account]:
+        result = await self.db.scalars(select(Account).where(Account.account_number == account_number))
+        return result.first()
+
+    async def find_by_user_id(self, user_id: int) -> List[Account]:
+        result = await self.db.scalars(select(Account).where(Account.user_id == user_id))
+        return result.all()
+
+    async def find_all_accounts(self) -> List[Account]:
+        result = await self.db.scalars(select(Account))
+        return result.all()
+
+class AsyncUserRepository:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def find_by_id(self, user_id) -> Optional[User]:
+        try:
+            return await self.db.get(User, int(user_id))
+        except (TypeError, ValueError):
+            return None
+
+    async def find_all(self) -> List[User]:
+        result = await self.db.scalars(select(User))
+        return result.all()
+
+class AsyncTransactionRepository:
+    """Read-side mirror of TransactionRepository for the asyncio serving mode."""
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def find_with_visibility(
+        self,
+        user_id: Optional[int],
+        transaction_id: Optional[int] = None,
+        transaction_number: Optional[str] = None
+    ) -> Optional[Tuple[Transaction, bool]]:
+        if user_id is None:
+            visible = literal(True)
+        else:
+            visible = exists().where(
+                Account.user_id == user_id,
+                or_(
+                    Account.id == Transaction.from_account_id,
+                    Account.id == Transaction.to_account_id
+                )
+            )
+        statement = select(Transaction, visible.label('visible'))
+        if transaction_number is not None:
+            statement = statement.where(Transaction.transaction_number == transaction_number)
+            window = transaction_number_window(transaction_number)
+            if window is not None:
+                statement = statement.where(Transaction.created_at >= window[0],
+                                            Transaction.created_at < window[1])
+        else:
+            statement = statement.where(Transaction.id == transaction_id)
+        row = (await self.db.execute(statement)).first()
+        return (row[0], bool(row[1])) if row else None
+
+    async def find_by_user_id(self, user_id, account_id=None, start_date=None, end_date=None,
+                              cursor=None, limit=None, stream=False):
+        # Semi-join on the user's accounts, as in TransactionRepository.find_by_user_id
+        owned_accounts = select(Account.id).where(Account.user_id == int(user_id))
+        statement = select(Transaction).where(or_(
+            Transaction.from_account_id.in_(owned_accounts),
+            Transaction.to_account_id.in_(owned_accounts)
+        ))
+        if account_id:
+            statement = statement.where(
+                or_(
+                    Transaction.from_account_id == int(account_id),
+                    Transaction.to_account_id == int(account_id)
+                )
+            )
+        statement = self._filter_dates(statement, start_date, end_date)
+        return await self._paginate(statement, cursor, limit, stream)
+
+    async def find_by_account_id(self, account_id, start_date=None, end_date=None,
+                                 cursor=None, limit=None, stream=False):
+        statement = select(Transaction).where(
+            (Transaction.from_account_id == account_id) |
+            (Transaction.to_account_id == account_id)
+        )
+        statement = self._filter_dates(statement, start_date, end_date)
+        return await self._paginate(statement, cursor, limit, stream)
+
+    async def get_all_transactions(self, start_date=None, end_date=None,
+                                   cursor=None, limit=None, stream=False):
+        statement = self._filter_dates(select(Transaction), start_date, end_date)
+        return await self._paginate(statement, cursor, limit, stream)
+
+    def _filter_dates(self, statement: Select, start_date: Optional[datetime], end_date: Optional[datetime]) -> Select:
+        if start_date:
+            statement = statement.where(Transaction.created_at >= utc(start_date))
+        if end_date:
+            statement = statement.where(Transaction.created_at <= utc(end_date))
+        return statement
+
+    async def _paginate(self, statement: Select, cursor=None, limit=None, stream=False):
+        """Same keyset ordering as TransactionRepository._paginate."""
+        statement = statement.order_by(Transaction.created_at.desc(), Transaction.id.desc())
+        if cursor:
+            statement = statement.where(
+                Transaction.created_at <= utc(cursor[0]),
+                tuple_(Transaction.created_at, Transaction.id) < tuple_(utc(cursor[0]), cursor[1])
+            )
+        if limit:
+            statement = statement.limit(limit)
+        if stream:
+            return await self.db.stream_scalars(statement.execution_options(yield_per=STREAM_BATCH_SIZE))
+        return (await self.db.scalars(statement)).all()
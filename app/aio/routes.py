@@ -0,0 +1,227 @@
+import json
+from datetime import datetime, timedelta
+from quart import Blueprint, Response, jsonify, request
+
+from app.aio.auth import admin_required, current_user_id, is_admin, token_required
+from app.aio.database import async_session_manager
+from app.aio.repositories import AsyncAccountRepository, AsyncTransactionRepository, AsyncUserRepository
+from app.utils import helpers
+
+# Read-heavy GET endpoints served natively on asyncio. Every other route falls
+# through to the Flask app (see app.aio.create_asgi_app).
+account_bp = Blueprint('account_bp', __name__, url_prefix='/revoubank/accounts')
+auth_bp = Blueprint('auth_bp', __name__, url_prefix='/revoubank')
+transaction_bp = Blueprint('transaction_bp', __name__, url_prefix='/revoubank/transactions')
+user_bp = Blueprint('user_bp', __name__, url_prefix='/revoubank/users')
+
+def _parse_day(value, end=False):
+    """Parse YYYY-MM-DD; end dates are made exclusive of the following day."""
+    if not value:
+        return None
+    parsed = datetime.strptime(value, "%Y-%m-%d")
+    return parsed + timedelta(days=1) if end else parsed
+
+def _ndjson_response(fetch, limit=None):
+    """Stream rows from ``fetch(session)`` as NDJSON on a dedicated session.
+
+    Same page format as helpers.ndjson_response: at most ``limit`` rows, then
+    a ``{"next_cursor": ...}`` line when more rows exist.
+    """
+    async def generate():
+        async with async_session_manager.session_scope() as session:
+            rows = await fetch(session)
+            last = None
+            count = 0
+            async for row in rows:
+                if limit is not None and count == limit:
+                    yield (json.dumps({'next_cursor': helpers.row_cursor(last)}) + "\n").encode()
+                    break
+                yield (json.dumps(row.to_dict()) + "\n").encode()
+                last = row
+                count += 1
+    return Response(generate(), mimetype='application/x-ndjson')
+
+async def _transaction_list_response(fetch, limit, stream):
+    if stream:
+        return _ndjson_response(fetch, limit)
+    async with async_session_manager.session_scope() as session:
+        transactions = await fetch(session)
+        transaction_list = [transaction.to_dict() for transaction in transactions]
+    if limit:
+        return jsonify(helpers.build_page(transaction_list, limit))
+    return jsonify(transaction_list)
+
+async def _check_user_owner(session, user_id):
+    try:
+        user_id_int = int(user_id)
+    except ValueError:
+        return jsonify({'message': 'Invalid User ID format!'}), 400
+    user = await AsyncUserRepository(session).find_by_id(user_id_int)
+    if not user:
+        return "User not found!", 404
+    if not is_admin() and current_user_id() != user_id_int:
+        return "Unauthorized access to this user account!", 403
+    return None
+
+async def _load_owned_account(session, identifier):
+    """Return (account, error_response) for an account id or number."""
+    repository = AsyncAccountRepository(session)
+    if helpers.is_account_number_format(identifier):
+        account = await repository.find_by_account_number(identifier)
+    else:
+        try:
+            int(identifier)
+        except ValueError:
+            return None, (jsonify({'message': 'Invalid Account ID format!'}), 400)
+        account = await repository.find_by_id(identifier)
+    if not account:
+        return None, (jsonify({'message': 'Account not found!'}), 404)
+    if not is_admin() and account.user_id != current_user_id():
+        return None, (jsonify({'message': 'Unauthorized access to this account!'}), 403)
+    return account, None
+
+@auth_bp.route('/ping', methods=['GET'])
+async def ping():
+    return jsonify({'message': 'pong'}), 200
+
+@account_bp.route('/all', methods=['GET'])
+@token_required
+@admin_required
+async def get_all_accounts_all_users():
+    async with async_session_manager.session_scope() as session:
+        accounts = await AsyncAccountRepository(session).find_all_accounts()
+        return jsonify([account.to_dict() for account in accounts]), 200
+
+@account_bp.route('/<string:user_id>', methods=['GET'])
+@token_required
+async def get_all_accounts_by_user(user_id):
+    async with async_session_manager.session_scope() as session:
+        error = await _check_user_owner(session, user_id)
+        if error:
+            return error
+        accounts = await AsyncAccountRepository(session).find_by_user_id(int(user_id))
+        return jsonify([account.to_dict() for account in accounts]), 200
+
+@account_bp.route('/<string:identifier>/info', methods=['GET'])
+@token_required
+async def get_account_details_by_identifier(identifier):
+    async with async_session_manager.session_scope() as session:
+        account, error = await _load_owned_account(session, identifier)
+        if error:
+            return error
+        return jsonify(account.to_dict()), 200
+
+@user_bp.route('/all', methods=['GET'])
+@token_required
+@admin_required
+async def get_all_users():
+    async with async_session_manager.session_scope() as session:
+        users = await AsyncUserRepository(session).find_all()
+        return jsonify({"users": [{
+            'id': user.id,
+            'username': user.username,
+            'email': user.email
+        } for user in users]})
+
+@user_bp.route('/<int:user_id>', methods=['GET'])
+@token_required
+async def get_user_profile(user_id):
+    async with async_session_manager.session_scope() as session:
+        error = await _check_user_owner(session, user_id)
+        if error:
+            return error
+        user = await AsyncUserRepository(session).find_by_id(user_id)
+        return jsonify({
+            'id': user.id,
+            'username': user.username,
+            'email': user.email,
+        }), 200
+
+@transaction_bp.route('/all', methods=['GET'])
+@token_required
+@admin_required
+async def get_all_transactions_all_users():
+    try:
+        cursor, limit, stream = helpers.parse_pagination_args(request.args)
+    except ValueError as e:
+        return jsonify({'message': str(e)}), 400
+    try:
+        start_date = datetime.fromisoformat(request.args['start_date']) if request.args.get('start_date') else None
+        end_date = datetime.fromisoformat(request.args['end_date']) if request.args.get('end_date') else None
+    except ValueError as e:
+        return jsonify({'message': f"Invalid date format: {str(e)}"}), 400
+
+    async def fetch(session):
+        return await AsyncTransactionRepository(session).get_all_transactions(
+            start_date, end_date, cursor=cursor, limit=limit + 1 if limit else None, stream=stream)
+    return await _transaction_list_response(fetch, limit, stream)
+
+@transaction_bp.route('/userid/<string:user_id>', methods=['GET'])
+@token_required
+async def get_all_transactions_by_account_id(user_id):
+    async with async_session_manager.session_scope() as session:
+        error = await _check_user_owner(session, user_id)
+        if error:
+            return error
+    try:
+        cursor, limit, stream = helpers.parse_pagination_args(request.args)
+    except ValueError as e:
+        return jsonify({'message': str(e)}), 400
+    # Invalid dates are ignored, as in the sync endpoint
+    try:
+        start_date = _parse_day(request.args.get('start_date'))
+    except ValueError:
+        start_date = None
+    try:
+        end_date = _parse_day(request.args.get('end_date'), end=True)
+    except ValueError:
+        end_date = None
+    account_id = request.args.get('account_id')
+
+    async def fetch(session):
+        return await AsyncTransactionRepository(session).find_by_user_id(
+            user_id, account_id=account_id, start_date=start_date, end_date=end_date,
+            cursor=cursor, limit=limit + 1 if limit else None, stream=stream)
+    return await _transaction_list_response(fetch, limit, stream)
+
+@transaction_bp.route('/account/<string:account_identifier>', methods=['GET'])
+@token_required
+async def get_transactions_by_account_identifier(account_identifier):
+    async with async_session_manager.session_scope() as session:
+        account, error = await _load_owned_account(session, account_identifier)
+        if error:
+            return error
+        account_id = account.id
+    try:
+        cursor, limit, stream = helpers.parse_pagination_args(request.args)
+        start_date = _parse_day(request.args.get('start_date'))
+        end_date = _parse_day(request.args.get('end_date'), end=True)
+    except ValueError as e:
+        return jsonify({'message': str(e)}), 400
+
+    async def fetch(session):
+        return await AsyncTransactionRepository(session).find_by_account_id(
+            account_id, start_date=start_date, end_date=end_date,
+            cursor=cursor, limit=limit + 1 if limit else None, stream=stream)
+    return await _transaction_list_response(fetch, limit, stream)
+
+@transaction_bp.route('/<string:identifier>/info', methods=['GET'])
+@token_required
+async def get_transaction_info_by_identifier(identifier):
+    visible_to_user_id = None if is_admin() else current_user_id()
+    async with async_session_manager.session_scope() as session:
+        repository = AsyncTransactionRepository(session)
+        if helpers.is_valid_transaction_number(identifier):
+            result = await repository.find_with_visibility(visible_to_user_id, transaction_number=identifier)
+        else:
+            try:
+                transaction_id = int(identifier)
+            except ValueError:
+                return jsonify({'message': 'Invalid Transaction ID format!'}), 400
+            result = await repository.find_with_visibility(visible_to_user_id, transaction_id=transaction_id)
+    if not result:
+        return jsonify({'message': 'Transaction not found!'}), 404
+    transaction, visible = result
+    if not visible:
+        return jsonify({'message': 'Unauthorized access to this transaction!'}), 403
+    return jsonify(transaction.to_dict()), 200
@@ -0,0 +1,131 @@
+import sys
+from sqlalchemy import event, text
+from sqlalchemy.orm import Session
+from app import create_app, db
+from app.partitions import PARENT_TABLE, partition_month
+from app.repositories.account import AccountRepository
+from app.repositories.transaction import TransactionRepository
+from app.repositories.user import UserRepository
+
+# Size of the throwaway dataset seeded before planning the queries
+SEED_USERS = 2000
+SEED_ACCOUNTS_PER_USER = 3
+SEED_TRANSACTIONS = 500000
+PAGE_SIZE = 101
+
+# Tables that must never be read with a sequential scan
+WATCHED_TABLES = {'transactions', 'accounts', 'users'}
+
+
+def seed(connection):
+    connection.execute(text("""
+        INSERT INTO users (username, email, password, phone, is_admin)
+        SELECT 'planuser' || g, 'planuser' || g || '@example.com', 'x', '0', false
+        FROM generate_series(1, :users) g
+    """), {'users': SEED_USERS})
+    connection.execute(text("""
+        INSERT INTO accounts (user_id, account_name, account_type, account_number, currency, balance)
+        SELECT u.id, 'plan', 'checking', 'ACC-' || u.id || '-' || g, 'USD', 0
+        FROM users u CROSS JOIN generate_series(1, :per_user) g
+        WHERE u.username LIKE 'planuser%'
+    """), {'per_user': SEED_ACCOUNTS_PER_USER})
+    connection.execute(text("""
+        INSERT INTO transactions (transaction_number, from_account_id, to_account_id,
+                                  amount, transaction_type, created_at)
+        SELECT 'PLN-' || g, a.min_id + (g % a.cnt), a.min_id + ((g * 7) % a.cnt),
+               1, 'transfer', now() - (g || ' seconds')::interval
+        FROM generate_series(1, :transactions) g,
+             (SELECT min(id) AS min_id, count(*) AS cnt FROM accounts
+              WHERE account_number LIKE 'ACC-%' AND account_name = 'plan') a
+    """), {'transactions': SEED_TRANSACTIONS})
+    connection.execute(text("ANALYZE users"))
+    connection.execute(text("ANALYZE accounts"))
+    connection.execute(text("ANALYZE transactions"))
+
+
+def find_seq_scans(plan):
+    """Yield the relation names of every Seq Scan node in a JSON plan."""
+    relation = plan.get('Relation Name')
+    # A scan of one monthly partition counts as a scan of the parent
+    if relation and partition_month(relation) is not None:
+        relation = PARENT_TABLE
+    if plan.get('Node Type') == 'Seq Scan' and relation in WATCHED_TABLES:
+        yield relation
+    for child in plan.get('Plans', []):
+        yield from find_seq_scans(child)
+
+
+def run_repository_queries(session):
+    """Exercise the hot repository reads; returns (label, callable) pairs."""
+    sample = session.execute(text("""
+        SELECT a.user_id, a.id, a.account_number FROM accounts a
+        WHERE a.account_name = 'plan' ORDER BY a.id LIMIT 1
+    """)).one()
+    user_id, account_id, account_number = sample
+    accounts = AccountRepository(session)
+    transactions = TransactionRepository(session)
+    users = UserRepository(session)
+    return [
+        ('AccountRepository.find_by_id', lambda: accounts.find_by_id(account_id)),
+        ('AccountRepository.find_by_user_id', lambda: accounts.find_by_user_id(user_id)),
+        ('AccountRepository.find_by_account_number', lambda: accounts.find_by_account_number(account_number)),
+        ('UserRepository.find_by_id', lambda: users.find_by_id(user_id)),
+        ('TransactionRepository.find_by_transaction_number',
+         lambda: transactions.find_by_transaction_number('PLN-1')),
+        ('TransactionRepository.find_by_user_id',
+         lambda: transactions.find_by_user_id(user_id, limit=PAGE_SIZE)),
+        ('TransactionRepository.find_by_account_id',
+         lambda: transactions.find_by_account_id(account_id, limit=PAGE_SIZE)),
+        ('TransactionRepository.get_all_transactions',
+         lambda: transactions.get_all_transactions(limit=PAGE_SIZE)),
+    ]
+
+
+def check_query_plans() -> bool:
+    app = create_app()
+    failures = []
+
+    with app.app_context():
+        connection = db.engine.connect()
+        outer = connection.begin()
+        try:
+            print(f"Seeding {SEED_TRANSACTIONS} transactions (rolled back afterwards)...")
+            seed(connection)
+            session = Session(bind=connection)
+
+            for label, run in run_repository_queries(session):
+                statements = []
+
+                def capture(conn, cursor, statement, parameters, context, executemany):
+                    statements.append((statement, parameters))
+
+                event.listen(connection, 'before_cursor_execute', capture)
+                try:
+                    run()
+                finally:
+                    event.remove(connection, 'before_cursor_execute', capture)
+
+                for statement, parameters in statements:
+                    plan = connection.exec_driver_sql(
+                        "EXPLAIN (FORMAT JSON) " + statement, parameters
+                    ).scalar()
+                    seq_scans = sorted(set(find_seq_scans(plan[0]['Plan'])))
+                    if seq_scans:
+                        failures.append((label, seq_scans))
+                        print(f"FAIL {label}: sequential scan on {', '.join(seq_scans)}")
+                    else:
+                        print(f"ok   {label}")
+            session.close()
+        finally:
+            outer.rollback()
+            connection.close()
+
+    if failures:
+        print(f"{len(failures)} repository queries fall back to a sequential scan")
+        return False
+    print("All repository queries use indexes")
+    return True
+
+
+if __name__ == '__main__':
+    sys.exit(0 if check_query_plans() else 1)
@@ -1,8 +1,27 @@
+import os
+from alembic import command
+from alembic.config import Config
 from app import create_app, db
 import sqlalchemy as sa
 from app.models.user import User
 from app.models.transaction import Transaction
 from app.models.account import Account
+from app.models.transaction_counter import TransactionNumberCounter
+from app.models.account_number_counter import AccountNumberCounter
+from app.models.transaction_summary import TransactionDailySummary
+from app.models.idempotency_key import IdempotencyKey
+from app.models.partition_carry_forward import PartitionCarryForward
+from app.partitions import create_partitions
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def stamp_head(database_url):
+    """Record the latest migration, since create_all() already built that schema."""
+    config = Config(os.path.join(PROJECT_ROOT, 'alembic.ini'))
+    config.set_main_option('script_location', os.path.join(PROJECT_ROOT, 'migrations'))
+    config.set_main_option('sqlalchemy.url', database_url.replace('%', '%%'))
+    command.stamp(config, 'head')
 
 
 def initialize_database():
@@ -18,11 +37,27 @@ def initialize_database():
         existing_tables = inspector.get_table_names()
         print(f"Existing tables: {existing_tables}")
         
+        # create_all() never alters existing tables, and the tables it would add
+        # would make the migrations that create them fail; migrate instead
+        application_tables = sorted(set(existing_tables) & set(db.metadata.tables))
+        if application_tables:
+            print(f"Application tables already exist: {application_tables}")
+            print("Run `alembic upgrade head` to bring this database up to date.")
+            return
+        
         # Print models that should create tables
         print(f"Models to create tables for: {db.Model.__subclasses__()}")
         
         # Create all tables
         db.create_all()
+
+        # On PostgreSQL transactions is a partitioned parent; inserts need a partition
+        if db.engine.dialect.name == 'postgresql':
+            print(f"Partitions created: {create_partitions(db.engine)}")
+        
+        # The schema was built from the current models, so every migration is
+        # already reflected; later `alembic upgrade head` runs start from here
+        stamp_head(db.engine.url.render_as_string(hide_password=False))
         
         # Check tables after creation
         new_tables = inspector.get_table_names()
@@ -5,6 +5,11 @@ Base = db.Model
 from app.models.user import User
 from app.models.account import Account
 from app.models.transaction import Transaction
+from app.models.transaction_counter import TransactionNumberCounter
+from app.models.account_number_counter import AccountNumberCounter
+from app.models.transaction_summary import TransactionDailySummary
+from app.models.idempotency_key import IdempotencyKey
+from app.models.partition_carry_forward import PartitionCarryForward
 
 # This allows importing models directly from the models package
-__all__ = ['Base', 'User', 'Account', 'Transaction']
\ No newline at end of file
+__all__ = ['Base', 'User', 'Account', 'Transaction', 'TransactionNumberCounter', 'AccountNumberCounter', 'TransactionDailySummary', 'IdempotencyKey', 'PartitionCarryForward']
\ No newline at end of file
@@ -1,6 +1,9 @@
 from sqlalchemy import func
 from app import db
 
+# Source of collision-free account numbers (see AccountRepository.next_account_number)
+account_number_seq = db.Sequence('account_number_seq', metadata=db.Model.metadata)
+
 class Account(db.Model):
     __tablename__ = "accounts"
 
@@ -11,9 +14,17 @@ class Account(db.Model):
     account_number = db.Column(db.String(255), unique=True, nullable=False)
     currency = db.Column(db.String(255), nullable=False)
     balance = db.Column(db.Numeric(10, 2), default=0.00)
+    # Funds with no attached transaction row behind them: the initial balance plus
+    # the nets of detached partitions. Reconciliation starts from here
+    opening_balance = db.Column(db.Numeric(10, 2), nullable=False, default=0, server_default='0')
     created_at = db.Column(db.DateTime(timezone=True), server_default=func.now())
     updated_at = db.Column(db.DateTime(timezone=True), onupdate=func.now())
 
+    # Ownership lookups select account ids by user_id
+    __table_args__ = (
+        db.Index('ix_accounts_user_id_id', user_id, id),
+    )
+
     # Relationship with user
     user = db.relationship("User", back_populates="accounts")
 
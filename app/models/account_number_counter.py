@@ -0,0 +1,15 @@
+from app import db
+
+class AccountNumberCounter(db.Model):
+    __tablename__ = "account_number_counters"
+
+    # A single row (id 1) standing in for account_number_seq on databases without
+    # sequences; last_value is the highest account number sequence handed out
+    id = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    last_value = db.Column(db.BigInteger, nullable=False, default=0)
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'last_value': self.last_value
+        }
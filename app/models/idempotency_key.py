@@ -0,0 +1,26 @@
+from app import db
+
+class IdempotencyKey(db.Model):
+    __tablename__ = "idempotency_keys"
+
+    # Keys are scoped per user so clients cannot collide with each other
+    user_id = db.Column(db.Integer, primary_key=True)
+    key = db.Column(db.String(255), primary_key=True)
+    request_hash = db.Column(db.String(64), nullable=False)
+    # Committed together with the request's own writes, so a visible row always
+    # means the write happened: 'pending' until its response is stored, then 'completed'
+    status = db.Column(db.String(10), nullable=False, default='pending')
+    response_status = db.Column(db.Integer)
+    response_body = db.Column(db.Text)
+    created_at = db.Column(db.DateTime(timezone=True), nullable=False)
+    expires_at = db.Column(db.DateTime(timezone=True), nullable=False, index=True)
+
+    def to_dict(self):
+        return {
+            'user_id': self.user_id,
+            'key': self.key,
+            'status': self.status,
+            'response_status': self.response_status,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'expires_at': self.expires_at.isoformat() if self.expires_at else None
+        }
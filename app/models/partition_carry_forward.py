@@ -0,0 +1,19 @@
+from sqlalchemy import func
+from app import db
+
+class PartitionCarryForward(db.Model):
+    __tablename__ = "partition_carry_forwards"
+
+    # One row per monthly transactions partition whose per-account nets were added
+    # to accounts.opening_balance before it was detached (see app.partitions).
+    # Reconciliation skips transactions older than the latest carried_through.
+    partition_name = db.Column(db.String(63), primary_key=True)
+    carried_through = db.Column(db.DateTime(timezone=True), nullable=False)
+    created_at = db.Column(db.DateTime(timezone=True), nullable=False, server_default=func.now())
+
+    def to_dict(self):
+        return {
+            'partition_name': self.partition_name,
+            'carried_through': self.carried_through.isoformat() if self.carried_through else None,
+            'created_at': self.created_at.isoformat() if self.created_at else None
+        }
@@ -1,5 +1,6 @@
 import enum
-from sqlalchemy import func
+from sqlalchemy import PrimaryKeyConstraint, func
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import relationship
 from app import db
 
@@ -14,16 +15,35 @@ class TransactionType(enum.Enum):
     REVERSAL = "reversal"
 
 class Transaction(db.Model):
+    # Range-partitioned by month on created_at (migration a9c3e7d1f5b8,
+    # partitions maintained by app.partitions). Unique constraints on a
+    # partitioned table must include the partition key, so the primary key is
+    # (id, created_at) and transaction_number is unique per created_at. The
+    # database does not reject a repeated transaction_number on its own;
+    # TransactionNumberAllocator is the only guard.
     __tablename__ = "transactions"
 
-    id = db.Column(db.Integer, primary_key=True, autoincrement=True, index=True)
-    transaction_number = db.Column(db.String(50), unique=True, nullable=False, index=True)
+    id = db.Column(db.Integer, db.Sequence('transactions_id_seq'), primary_key=True, index=True)
+    transaction_number = db.Column(db.String(50), nullable=False)
     from_account_id = db.Column(db.Integer, db.ForeignKey('accounts.id'), nullable=True)
     to_account_id = db.Column(db.Integer, db.ForeignKey('accounts.id'), nullable=True)
     amount = db.Column(db.Numeric(10, 2), nullable=False)
     transaction_type = db.Column(db.String(50), nullable=False)
     description = db.Column(db.String(255))
-    created_at = db.Column(db.DateTime(timezone=True), server_default=func.now())
+    created_at = db.Column(db.DateTime(timezone=True), primary_key=True, server_default=func.now())
+
+    # Covering indexes for history queries ordered by (created_at, id)
+    __table_args__ = (
+        PrimaryKeyConstraint(id, created_at, name='transactions_pkey', info={'sqlite_columns': ['id']}),
+        db.UniqueConstraint(transaction_number, created_at,
+                            name='uq_transactions_transaction_number_created_at'),
+        db.Index('ix_transactions_from_account_id_created_at',
+                 from_account_id, created_at.desc(), id.desc()),
+        db.Index('ix_transactions_to_account_id_created_at',
+                 to_account_id, created_at.desc(), id.desc()),
+        db.Index('ix_transactions_created_at_id', created_at.desc(), id.desc()),
+        {'postgresql_partition_by': 'RANGE (created_at)'},
+    )
 
     from_account = relationship(
         "Account", 
@@ -46,4 +66,13 @@ class Transaction(db.Model):
             'transaction_type': self.transaction_type,
             'description': self.description,
             'created_at': self.created_at.isoformat() if self.created_at else None
-        }
\ No newline at end of file
+        }
+
+@compiles(PrimaryKeyConstraint, 'sqlite')
+def _sqlite_primary_key(constraint, compiler, **kw):
+    # SQLite only generates ids for a lone INTEGER PRIMARY KEY, so local SQLite
+    # databases key transactions on the columns named in info['sqlite_columns']
+    columns = constraint.info.get('sqlite_columns')
+    if not columns:
+        return compiler.visit_primary_key_constraint(constraint, **kw)
+    return f"PRIMARY KEY ({', '.join(compiler.preparer.quote(column) for column in columns)})"
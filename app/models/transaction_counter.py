@@ -0,0 +1,16 @@
+from app import db
+
+class TransactionNumberCounter(db.Model):
+    __tablename__ = "transaction_number_counters"
+
+    # One row per (prefix, day); last_value is the highest sequence handed out
+    prefix = db.Column(db.String(10), primary_key=True)
+    day = db.Column(db.String(8), primary_key=True)
+    last_value = db.Column(db.BigInteger, nullable=False, default=0)
+
+    def to_dict(self):
+        return {
+            'prefix': self.prefix,
+            'day': self.day,
+            'last_value': self.last_value
+        }
\ No newline at end of file
@@ -0,0 +1,23 @@
+from app import db
+
+class TransactionDailySummary(db.Model):
+    __tablename__ = "transaction_daily_summaries"
+
+    # One row per account, UTC day, transaction type and direction ('in' / 'out'),
+    # kept up to date by TransactionRepository on every write
+    account_id = db.Column(db.Integer, db.ForeignKey('accounts.id'), primary_key=True)
+    day = db.Column(db.Date, primary_key=True)
+    transaction_type = db.Column(db.String(50), primary_key=True)
+    direction = db.Column(db.String(3), primary_key=True)
+    transaction_count = db.Column(db.BigInteger, nullable=False, default=0)
+    total_amount = db.Column(db.Numeric(18, 2), nullable=False, default=0)
+
+    def to_dict(self):
+        return {
+            'account_id': self.account_id,
+            'day': self.day.isoformat() if self.day else None,
+            'transaction_type': self.transaction_type,
+            'direction': self.direction,
+            'transaction_count': self.transaction_count,
+            'total_amount': float(self.total_amount)
+        }
\ No newline at end of file
@@ -0,0 +1,226 @@
+"""Monthly partition maintenance for the ``transactions`` table.
+
+``transactions`` is range-partitioned on created_at, one partition per UTC
+month, named ``transactions_pYYYY_MM``. There is no default partition, so an
+insert for a month without a partition fails. This job creates partitions
+ahead of time. Schedule it daily; it is idempotent:
+
+    python -m app.partitions create --months-ahead 3
+
+Old months can be detached into standalone tables (for archiving or a cheap
+DROP) without blocking reads or writes on the parent:
+
+    python -m app.partitions detach --retain-months 24 [--drop]
+
+Detached months are no longer visible to the API or to statements. Before a
+month is detached, each account's net over it is added to
+accounts.opening_balance and the month is recorded in
+partition_carry_forwards, in one transaction. app.reconcile then starts from
+the carried balance and skips the carried months, so dropping them is safe
+for reconciliation. Archive them before dropping them.
+"""
+import argparse
+import json
+import re
+import sys
+from datetime import date, datetime, timedelta, timezone
+from typing import List, Optional, Tuple
+
+from sqlalchemy import bindparam, text
+from sqlalchemy.engine import Engine
+
+PARENT_TABLE = 'transactions'
+PARTITION_PATTERN = re.compile(r'^transactions_p(\d{4})_(\d{2})$')
+# PREFIX-YYYYMMDD-XXXXXX, see TransactionRepository._generate_transaction_number
+TRANSACTION_NUMBER_DATE = re.compile(r'^[A-Z]+-(\d{8})-\d+$')
+
+PARTITIONS_SQL = text("""
+    SELECT c.relname, i.inhdetachpending
+    FROM pg_inherits i
+    JOIN pg_class c ON c.oid = i.inhrelid
+    WHERE i.inhparent = CAST(:parent AS regclass)
+    ORDER BY c.relname
+""")
+
+# Marks a partition as carried forward; returns nothing when it already was
+CARRY_FORWARD_MARK_SQL = text("""
+    INSERT INTO partition_carry_forwards (partition_name, carried_through)
+    VALUES (:name, :carried_through)
+    ON CONFLICT (partition_name) DO NOTHING
+    RETURNING partition_name
+""")
+
+# Same legs as app.reconcile, summed per account over one partition
+CARRY_FORWARD_SQL = """
+    UPDATE accounts SET opening_balance = accounts.opening_balance + legs.net
+    FROM (
+        SELECT account_id, sum(amount) AS net
+        FROM (
+            SELECT from_account_id AS account_id, -amount AS amount
+            FROM {partition}
+            WHERE from_account_id IS NOT NULL AND transaction_type IN :debit_types
+            UNION ALL
+            SELECT to_account_id, amount
+            FROM {partition}
+            WHERE to_account_id IS NOT NULL AND transaction_type IN :credit_types
+        ) signed
+        GROUP BY account_id
+    ) legs
+    WHERE accounts.id = legs.account_id
+"""
+
+
+def month_start(value: date) -> date:
+    return value.replace(day=1)
+
+
+def add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    return f"{PARENT_TABLE}_p{month.year:04d}_{month.month:02d}"
+
+
+def partition_month(name: str) -> Optional[date]:
+    match = PARTITION_PATTERN.match(name)
+    return date(int(match.group(1)), int(match.group(2)), 1) if match else None
+
+
+def utc(value: Optional[datetime]) -> Optional[datetime]:
+    """Make a filter value timezone-aware (naive values are UTC).
+
+    created_at is timestamptz. A timestamptz parameter lets the planner prune
+    partitions at plan time. A naive one needs a TimeZone-dependent cast, so
+    pruning only happens when the executor starts.
+    """
+    if value is None or value.tzinfo is not None:
+        return value
+    return value.replace(tzinfo=timezone.utc)
+
+
+def transaction_number_window(transaction_number: str) -> Optional[Tuple[datetime, datetime]]:
+    """created_at bounds implied by the date inside a transaction number, or None.
+
+    The number carries the server's local date. The window is widened by a
+    day on each side so any timezone offset stays inside it.
+    """
+    match = TRANSACTION_NUMBER_DATE.match(transaction_number or '')
+    if not match:
+        return None
+    try:
+        day = datetime.strptime(match.group(1), '%Y%m%d').replace(tzinfo=timezone.utc)
+    except ValueError:
+        return None
+    return day - timedelta(days=1), day + timedelta(days=2)
+
+
+def create_partition_sql(month: date) -> str:
+    end = add_months(month, 1)
+    return (
+        f"CREATE TABLE IF NOT EXISTS {partition_name(month)} PARTITION OF {PARENT_TABLE} "
+        f"FOR VALUES FROM ('{month.isoformat()} 00:00:00+00') TO ('{end.isoformat()} 00:00:00+00')"
+    )
+
+
+def list_partitions(engine: Engine) -> List[Tuple[str, bool]]:
+    """(name, detach pending) for every partition attached to the parent."""
+    with engine.connect() as connection:
+        return [tuple(row) for row in connection.execute(PARTITIONS_SQL, {'parent': PARENT_TABLE})]
+
+
+def create_partitions(engine: Engine, months_ahead: int = 3, today: Optional[date] = None) -> List[str]:
+    """Ensure partitions exist from the current month through ``months_ahead``; returns those created."""
+    current = month_start(today or datetime.now(timezone.utc).date())
+    existing = {name for name, _ in list_partitions(engine)}
+    created = []
+    for offset in range(months_ahead + 1):
+        month = add_months(current, offset)
+        name = partition_name(month)
+        if name in existing:
+            continue
+        # Each partition in its own short transaction: it locks the parent
+        with engine.begin() as connection:
+            connection.execute(text(create_partition_sql(month)))
+        created.append(name)
+    return created
+
+
+def carry_forward_partition(engine: Engine, name: str) -> bool:
+    """Add each account's net over partition ``name`` to its opening balance, once.
+
+    Returns False when the partition was already carried forward. The marker
+    row and the balance update commit together, so a month is never counted
+    both in opening_balance and in the reconciled transactions.
+    """
+    from app.repositories.transaction import BALANCE_EFFECTS
+
+    month = partition_month(name)
+    if month is None:
+        raise ValueError(f'{name} is not a monthly transactions partition')
+    carried_through = datetime.combine(add_months(month, 1), datetime.min.time(), timezone.utc)
+    statement = text(CARRY_FORWARD_SQL.format(partition=name)).bindparams(
+        bindparam('debit_types', expanding=True),
+        bindparam('credit_types', expanding=True)
+    )
+    with engine.begin() as connection:
+        marked = connection.execute(
+            CARRY_FORWARD_MARK_SQL, {'name': name, 'carried_through': carried_through}
+        ).first()
+        if marked is None:
+            return False
+        connection.execute(statement, {
+            'debit_types': [t for t, (debits, _, _) in BALANCE_EFFECTS.items() if debits],
+            'credit_types': [t for t, (_, credits, _) in BALANCE_EFFECTS.items() if credits],
+        })
+    return True
+
+
+def detach_partitions(engine: Engine, retain_months: int, drop: bool = False,
+                      today: Optional[date] = None) -> List[str]:
+    """Detach partitions for months older than ``retain_months``; returns their names.
+
+    Each month is carried forward (see carry_forward_partition) before it is
+    detached. DETACH ... CONCURRENTLY (PostgreSQL 14+) only takes a SHARE UPDATE
+    EXCLUSIVE lock on the parent. A detach that was interrupted is completed
+    with FINALIZE.
+    """
+    if retain_months < 1:
+        raise ValueError('retain_months must be at least 1')
+    cutoff = add_months(month_start(today or datetime.now(timezone.utc).date()), -retain_months)
+    detached = []
+    # CONCURRENTLY cannot run inside a transaction block
+    with engine.connect().execution_options(isolation_level='AUTOCOMMIT') as connection:
+        for name, pending in list_partitions(engine):
+            month = partition_month(name)
+            if month is None or month >= cutoff:
+                continue
+            carry_forward_partition(engine, name)
+            mode = 'FINALIZE' if pending else 'CONCURRENTLY'
+            connection.execute(text(f"ALTER TABLE {PARENT_TABLE} DETACH PARTITION {name} {mode}"))
+            if drop:
+                connection.execute(text(f"DROP TABLE {name}"))
+            detached.append(name)
+    return detached
+
+
+if __name__ == '__main__':
+    from app import create_app, db
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest='command', required=True)
+    create_parser = commands.add_parser('create', help='create partitions ahead of time')
+    create_parser.add_argument('--months-ahead', type=int, default=3)
+    detach_parser = commands.add_parser('detach', help='detach old months')
+    detach_parser.add_argument('--retain-months', type=int, required=True)
+    detach_parser.add_argument('--drop', action='store_true', help='drop the detached tables')
+    args = parser.parse_args()
+
+    with create_app().app_context():
+        if args.command == 'create':
+            report = {'created': create_partitions(db.engine, args.months_ahead)}
+        else:
+            report = {'detached': detach_partitions(db.engine, args.retain_months, args.drop)}
+    print(json.dumps(report, indent=2))
+    sys.exit(0)
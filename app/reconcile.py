@@ -0,0 +1,173 @@
+"""Nightly balance reconciliation.
+
+Checks that every Account.balance equals the net of its transactions under
+BALANCE_EFFECTS. Account ids are split into ranges and each range is handled
+by a separate process. A worker streams (account_id, signed amount in cents)
+pairs in chunks from a server-side cursor and folds them into per-account
+nets with NumPy grouped sums. It then compares the nets with the balances
+read in the same snapshot.
+
+Each account's expected balance starts from Account.opening_balance: the
+initial balance it was opened with, plus the nets of months that
+app.partitions carried forward before detaching them. Accounts opened before
+the column existed got it from migration c6f1b8d3e2a9, as their balance less
+the net of their transactions at the time. Transactions older
+than the latest carried month are skipped, whether or not the partition is
+still attached.
+
+    python -m app.reconcile --workers 8 --shards 64
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime, timezone
+
+import numpy as np
+from sqlalchemy import bindparam, create_engine, text
+from sqlalchemy.pool import NullPool
+
+# Rows pulled from the server-side cursor per fetch
+CHUNK_SIZE = 500000
+
+# End of the newest month folded into accounts.opening_balance
+CARRIED_THROUGH_SQL = text("SELECT max(carried_through) FROM partition_carry_forwards")
+# Lower bound used when nothing has been carried forward
+NOTHING_CARRIED = datetime(1, 1, 1, tzinfo=timezone.utc)
+
+LEGS_SQL = text("""
+    SELECT from_account_id, -(amount * 100)::bigint
+    FROM transactions
+    WHERE from_account_id >= :low AND from_account_id < :high
+      AND transaction_type IN :debit_types
+      AND created_at >= :carried_through
+    UNION ALL
+    SELECT to_account_id, (amount * 100)::bigint
+    FROM transactions
+    WHERE to_account_id >= :low AND to_account_id < :high
+      AND transaction_type IN :credit_types
+      AND created_at >= :carried_through
+""")
+
+BALANCES_SQL = text("""
+    SELECT id, (balance * 100)::bigint, (opening_balance * 100)::bigint
+    FROM accounts
+    WHERE id >= :low AND id < :high
+""")
+
+
+def reconcile_shard(database_url, low, high, debit_types, credit_types, chunk_size=CHUNK_SIZE):
+    """Return (rows_scanned, accounts_checked, mismatches) for account ids in [low, high)."""
+    legs_sql = LEGS_SQL.bindparams(
+        bindparam('debit_types', expanding=True),
+        bindparam('credit_types', expanding=True)
+    )
+    # A single connection per shard; nothing to pool
+    engine = create_engine(database_url, poolclass=NullPool)
+    nets = np.zeros(high - low, dtype=np.float64)
+    rows_scanned = 0
+    try:
+        # One snapshot for legs and balances, so in-flight transfers cannot show up as drift
+        with engine.connect().execution_options(
+            isolation_level='REPEATABLE READ', stream_results=True
+        ) as connection:
+            with connection.begin():
+                carried_through = connection.execute(CARRIED_THROUGH_SQL).scalar() or NOTHING_CARRIED
+                result = connection.execute(legs_sql, {
+                    'low': low, 'high': high, 'carried_through': carried_through,
+                    'debit_types': list(debit_types), 'credit_types': list(credit_types)
+                })
+                for chunk in result.partitions(chunk_size):
+                    pairs = np.array(chunk, dtype=np.int64)
+                    # Grouped sum by account offset. Float64 weights are exact for
+                    # integer cents up to 2**53.
+                    nets += np.bincount(pairs[:, 0] - low, weights=pairs[:, 1], minlength=high - low)
+                    rows_scanned += len(pairs)
+
+                balances = np.array(
+                    connection.execute(BALANCES_SQL, {'low': low, 'high': high}).all(),
+                    dtype=np.int64
+                ).reshape(-1, 3)
+    finally:
+        engine.dispose()
+
+    if not len(balances):
+        return rows_scanned, 0, []
+    account_ids = balances[:, 0]
+    transactions_net = np.rint(nets[account_ids - low]).astype(np.int64)
+    drift = balances[:, 1] - balances[:, 2] - transactions_net
+    mismatches = [
+        {
+            'account_id': int(account_id),
+            'balance': int(balance) / 100,
+            'opening_balance': int(opening) / 100,
+            'transactions_net': int(net) / 100,
+            'difference': int(difference) / 100,
+        }
+        for account_id, balance, opening, net, difference in zip(
+            account_ids[drift != 0], balances[drift != 0, 1], balances[drift != 0, 2],
+            transactions_net[drift != 0], drift[drift != 0]
+        )
+    ]
+    return rows_scanned, len(account_ids), mismatches
+
+
+def shard_ranges(min_id, max_id, shards):
+    """Split [min_id, max_id] into at most ``shards`` contiguous half-open ranges."""
+    span = max_id - min_id + 1
+    size = max(1, -(-span // shards))
+    return [(low, min(low + size, max_id + 1)) for low in range(min_id, max_id + 1, size)]
+
+
+def reconcile(workers: int, shards: int, chunk_size: int) -> dict:
+    from app import create_app
+    from app.repositories.transaction import BALANCE_EFFECTS
+
+    database_url = create_app().config['SQLALCHEMY_DATABASE_URI']
+    debit_types = [t for t, (debits, _, _) in BALANCE_EFFECTS.items() if debits]
+    credit_types = [t for t, (_, credits, _) in BALANCE_EFFECTS.items() if credits]
+
+    engine = create_engine(database_url, poolclass=NullPool)
+    with engine.connect() as connection:
+        min_id, max_id = connection.execute(text("SELECT min(id), max(id) FROM accounts")).one()
+    engine.dispose()
+    if min_id is None:
+        return {'accounts_checked': 0, 'rows_scanned': 0, 'elapsed_seconds': 0.0,
+                'mismatch_count': 0, 'mismatches': []}
+
+    started = time.perf_counter()
+    rows_scanned = accounts_checked = 0
+    mismatches = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(reconcile_shard, database_url, low, high,
+                            debit_types, credit_types, chunk_size)
+            for low, high in shard_ranges(min_id, max_id, shards)
+        ]
+        for future in as_completed(futures):
+            scanned, checked, shard_mismatches = future.result()
+            rows_scanned += scanned
+            accounts_checked += checked
+            mismatches.extend(shard_mismatches)
+
+    mismatches.sort(key=lambda mismatch: mismatch['account_id'])
+    return {
+        'accounts_checked': accounts_checked,
+        'rows_scanned': rows_scanned,
+        'elapsed_seconds': round(time.perf_counter() - started, 3),
+        'mismatch_count': len(mismatches),
+        'mismatches': mismatches,
+    }
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 4)
+    parser.add_argument('--shards', type=int, default=None, help='account id ranges (default 4 per worker)')
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE)
+    args = parser.parse_args()
+    report = reconcile(args.workers, args.shards or args.workers * 4, args.chunk_size)
+    print(json.dumps(report, indent=2))
+    sys.exit(1 if report['mismatches'] else 0)
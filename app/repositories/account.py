@@ -1,10 +1,26 @@
 from datetime import datetime
 from typing import Any, Optional, Tuple, List, Dict
-from sqlalchemy import func
+from sqlalchemy import or_, select
+from sqlalchemy.dialects import sqlite
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 
-from app.models.account import Account
+from app.models.account import Account, account_number_seq
+from app.models.account_number_counter import AccountNumberCounter
+from app.repositories.read_models import ACCOUNT_COLUMNS, AccountRow, fetch_rows
+from app.utils.loader import get_request_loader
+
+def luhn_check_digit(digits: str) -> int:
+    """Luhn check digit so mistyped account numbers can be rejected offline."""
+    total = 0
+    for position, char in enumerate(reversed(digits)):
+        digit = int(char)
+        if position % 2 == 0:
+            digit *= 2
+            if digit > 9:
+                digit -= 9
+        total += digit
+    return (10 - total % 10) % 10
 
 class AccountRepository:
     def __init__(self, db: Session):
@@ -12,17 +28,37 @@ class AccountRepository:
         self.db = db if db is not None else get_db_session()
 
     def find_by_id(self, account_id: str) -> Optional[Account]:
+        loader = get_request_loader(self.db)
+        if loader is not None:
+            return loader.account(account_id)
         return self.db.query(Account).filter(Account.id == account_id).first()
     
-    def find_by_user_id(self, user_id: int) -> List[Account]:
+    def find_by_user_id(self, user_id: int, as_rows: bool = False) -> List[Account]:
+        if as_rows:
+            statement = select(*ACCOUNT_COLUMNS).where(Account.__table__.c.user_id == user_id)
+            return fetch_rows(self.db, statement, AccountRow)
         return self.db.query(Account).filter(Account.user_id == user_id).all()
     
-    def find_all_accounts(self) -> List[Account]:
+    def find_all_accounts(self, as_rows: bool = False) -> List[Account]:
+        # as_rows returns untracked AccountRow DTOs ready for jsonify
+        if as_rows:
+            return fetch_rows(self.db, select(*ACCOUNT_COLUMNS), AccountRow)
         return self.db.query(Account).all()
     
     def find_by_account_number(self, account_number: str) -> Optional[Account]:
+        loader = get_request_loader(self.db)
+        if loader is not None:
+            return loader.account_by_number(account_number)
         return self.db.query(Account).filter(Account.account_number == account_number).first()
     
+    def find_by_identifiers(self, account_ids: List[int], account_numbers: List[str]) -> List[Account]:
+        """Load every account matching any of the ids or account numbers in one query."""
+        if not account_ids and not account_numbers:
+            return []
+        return self.db.query(Account).filter(
+            or_(Account.id.in_(account_ids), Account.account_number.in_(account_numbers))
+        ).all()
+    
     def create(
         self, 
         user_id: str,
@@ -39,18 +75,15 @@ class AccountRepository:
             # Convert user_id to integer
             user_id_int = int(user_id)
             
-            # Get the next ID value
-            max_id = self.db.query(func.max(Account.id)).scalar() or 0
-            next_id = max_id + 1
-            
+            # The id is assigned by the database identity column
             new_account = Account(
-                id=next_id,  # Explicitly set the ID
                 user_id=user_id_int,
                 account_name=account_name,
                 account_type=account_type,
                 account_number=account_number,
                 currency=currency,
-                balance=initial_balance
+                balance=initial_balance,
+                opening_balance=initial_balance
             )
             
             self.db.add(new_account)
@@ -65,12 +98,32 @@ class AccountRepository:
             self.db.rollback()
             return False, f"An error occurred: {str(e)}", None
     
+    def next_account_number(self) -> str:
+        """Generate a unique account number: ACC-YYYYMMDD-<sequence><check digit>."""
+        if self.db.get_bind().dialect.supports_sequences:
+            sequence = self.db.execute(account_number_seq.next_value()).scalar()
+        else:
+            # Databases without sequences (e.g. SQLite) count in the account number
+            # counter row instead; the upsert holds the row until the account commits
+            table = AccountNumberCounter.__table__
+            statement = sqlite.insert(table).values(id=1, last_value=1)
+            statement = statement.on_conflict_do_update(
+                index_elements=[table.c.id],
+                set_={'last_value': table.c.last_value + 1}
+            ).returning(table.c.last_value)
+            sequence = self.db.execute(statement).scalar_one()
+        digits = f"{sequence:010d}"
+        return f"ACC-{datetime.now().strftime('%Y%m%d')}-{digits}{luhn_check_digit(digits)}"
+    
     def delete(self, account_id: str) -> Tuple[bool, str]:
         try:
             account = self.db.query(Account).filter(Account.id == account_id).first()
             if account:
                 self.db.delete(account)
                 self.db.commit()
+                loader = get_request_loader(self.db)
+                if loader is not None:
+                    loader.forget_account(account_id)
                 return True, "Account successfully deleted"
             return False, "Account not found"
         except SQLAlchemyError as e:
@@ -58,6 +58,19 @@ class AuthRepository:
             self.db.rollback()
             return False
 
+    def replace_password_hash(self, user_id: int, old_hash: str, new_hash: str) -> bool:
+        # Only swap the exact hash that was verified, so a concurrent password change wins
+        try:
+            updated = self.db.query(User).filter(
+                User.id == user_id,
+                User.password == old_hash
+            ).update({User.password: new_hash}, synchronize_session=False)
+            self.db.commit()
+            return updated == 1
+        except SQLAlchemyError:
+            self.db.rollback()
+            return False
+
     def authenticate_user(self, email: str, hashed_password: str) -> Optional[User]:
         user = self.find_user_by_email(email)
 
@@ -0,0 +1,141 @@
+import logging
+import os
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+from sqlalchemy import delete, select, text, tuple_, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from app.models.idempotency_key import IdempotencyKey
+
+logger = logging.getLogger(__name__)
+
+class IdempotencyStore:
+    """Shared (database-backed) store of idempotency keys and their responses.
+
+    claim() inserts the key in the request session's own transaction, so the
+    key commits or rolls back together with the request's writes. A visible
+    row therefore always means the first request's write committed, and a
+    duplicate that races the first request blocks on the uncommitted key
+    instead of running the write again. The response is stored by complete()
+    right after the handler returns. Rows live for ``ttl`` seconds and are
+    deleted in batches by a background thread, never on the request path.
+    """
+    def __init__(self, ttl: float = 86400, cleanup_interval: float = 300, cleanup_batch_size: int = 1000):
+        self.ttl = ttl
+        self.cleanup_interval = cleanup_interval
+        self.cleanup_batch_size = cleanup_batch_size
+        self._lock = threading.Lock()
+        self._cleanup_thread = None
+        self._pid = None
+
+    def claim(self, session: Session, user_id: int, key: str, request_hash: str,
+              lock_timeout: float = None) -> bool:
+        """Insert the key in the session's transaction; True when this request owns it.
+
+        Waits up to ``lock_timeout`` seconds for a concurrent request holding the
+        same key to finish (PostgreSQL raises OperationalError after that).
+        """
+        self._ensure_cleanup(session.get_bind().engine)
+        table = IdempotencyKey.__table__
+        now = datetime.now(timezone.utc)
+        postgres = session.get_bind().dialect.name == 'postgresql'
+        if postgres and lock_timeout:
+            session.execute(text(f"SET LOCAL lock_timeout = '{int(lock_timeout * 1000)}ms'"))
+        # Keys past their TTL no longer count
+        session.execute(
+            delete(table).where(table.c.user_id == user_id, table.c.key == key, table.c.expires_at < now)
+        )
+        dialect_insert = postgresql.insert if postgres else sqlite.insert
+        claimed = session.execute(
+            dialect_insert(table).values(
+                user_id=user_id, key=key, request_hash=request_hash, status='pending',
+                created_at=now, expires_at=now + timedelta(seconds=self.ttl)
+            ).on_conflict_do_nothing(index_elements=[table.c.user_id, table.c.key])
+        ).rowcount == 1
+        if postgres and lock_timeout:
+            session.execute(text("SET LOCAL lock_timeout TO DEFAULT"))
+        return claimed
+
+    def get(self, session: Session, user_id: int, key: str) -> Optional[dict]:
+        table = IdempotencyKey.__table__
+        row = session.execute(
+            select(table.c.request_hash, table.c.status, table.c.response_status,
+                   table.c.response_body, table.c.expires_at)
+            .where(table.c.user_id == user_id, table.c.key == key)
+        ).mappings().first()
+        return dict(row) if row else None
+
+    def wait_for_completion(self, session: Session, user_id: int, key: str, timeout: float) -> Optional[dict]:
+        """Poll with backoff until the response is stored; returns the row, or None when it vanished."""
+        deadline = time.monotonic() + timeout
+        delay = 0.025
+        while True:
+            row = self.get(session, user_id, key)
+            # End the read so the next poll sees newly committed data
+            session.rollback()
+            if row is None or row['status'] == 'completed' or time.monotonic() >= deadline:
+                return row
+            time.sleep(delay)
+            delay = min(delay * 2, 0.25)
+
+    def complete(self, session: Session, user_id: int, key: str, status_code: int, body: str) -> bool:
+        """Store the response and commit; False when the key was rolled back with the request."""
+        table = IdempotencyKey.__table__
+        stored = session.execute(
+            update(table)
+            .where(table.c.user_id == user_id, table.c.key == key)
+            .values(status='completed', response_status=status_code, response_body=body)
+        ).rowcount == 1
+        session.commit()
+        return stored
+
+    def purge_expired(self, engine: Engine) -> int:
+        """Delete expired rows in batches; returns the number removed."""
+        table = IdempotencyKey.__table__
+        removed = 0
+        while True:
+            now = datetime.now(timezone.utc)
+            batch = (
+                select(table.c.user_id, table.c.key)
+                .where(table.c.expires_at < now)
+                .limit(self.cleanup_batch_size)
+            )
+            with engine.begin() as connection:
+                deleted = connection.execute(
+                    delete(table).where(tuple_(table.c.user_id, table.c.key).in_(batch))
+                ).rowcount
+            removed += deleted
+            if deleted < self.cleanup_batch_size:
+                return removed
+
+    def _ensure_cleanup(self, engine: Engine):
+        # One cleanup thread per process, started lazily so forked workers get their own
+        with self._lock:
+            if self._cleanup_thread is not None and self._pid == os.getpid():
+                return
+            self._pid = os.getpid()
+            self._cleanup_thread = threading.Thread(
+                target=self._cleanup_loop, args=(engine,), name='idempotency-cleanup', daemon=True
+            )
+            self._cleanup_thread.start()
+
+    def _cleanup_loop(self, engine: Engine):
+        while True:
+            time.sleep(self.cleanup_interval)
+            try:
+                removed = self.purge_expired(engine)
+                if removed:
+                    logger.info("Purged expired idempotency keys", extra={'removed': removed})
+            except Exception:
+                logger.exception("Idempotency key cleanup failed")
+
+# Create a global instance
+idempotency_store = IdempotencyStore(
+    ttl=float(os.getenv('IDEMPOTENCY_TTL', 86400)),
+    cleanup_interval=float(os.getenv('IDEMPOTENCY_CLEANUP_INTERVAL', 300)),
+    cleanup_batch_size=int(os.getenv('IDEMPOTENCY_CLEANUP_BATCH_SIZE', 1000))
+)
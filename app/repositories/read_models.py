@@ -0,0 +1,107 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Iterable, Optional, Type
+from sqlalchemy import Float, cast
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Select
+
+from app.models.account import Account
+from app.models.transaction import Transaction
+from app.models.user import User
+
+# Read-only DTOs for the GET list endpoints. They are filled straight from Core
+# result rows, so there is no identity map, no attribute instrumentation and
+# nothing is ever added to the session. Field order matches the column tuples
+# below; the JSON provider encodes them like the models' to_dict().
+
+# Rows fetched per round trip when streaming through a server-side cursor
+READ_BATCH_SIZE = 1000
+
+@dataclass(slots=True)
+class AccountRow:
+    id: int
+    user_id: int
+    account_name: str
+    account_type: str
+    account_number: str
+    currency: str
+    balance: float
+    created_at: Optional[datetime]
+    updated_at: Optional[datetime]
+
+@dataclass(slots=True)
+class TransactionRow:
+    id: int
+    transaction_number: str
+    from_account_id: Optional[int]
+    to_account_id: Optional[int]
+    amount: float
+    transaction_type: str
+    description: Optional[str]
+    created_at: Optional[datetime]
+
+@dataclass(slots=True)
+class StatementRow:
+    """One statement line; ``amount`` is signed for the account, ``balance`` is after the line."""
+    created_at: Optional[datetime]
+    transaction_number: str
+    transaction_type: str
+    description: Optional[str]
+    from_account_id: Optional[int]
+    to_account_id: Optional[int]
+    amount: float
+    balance: float
+
+@dataclass(slots=True)
+class UserRow:
+    id: int
+    username: str
+    email: str
+
+_accounts = Account.__table__.c
+_transactions = Transaction.__table__.c
+_users = User.__table__.c
+
+# Table columns (not ORM attributes) so the statements stay plain Core; money
+# is cast in SQL so no Decimal is built per row
+ACCOUNT_COLUMNS = (
+    _accounts.id,
+    _accounts.user_id,
+    _accounts.account_name,
+    _accounts.account_type,
+    _accounts.account_number,
+    _accounts.currency,
+    cast(_accounts.balance, Float).label('balance'),
+    _accounts.created_at,
+    _accounts.updated_at,
+)
+
+TRANSACTION_COLUMNS = (
+    _transactions.id,
+    _transactions.transaction_number,
+    _transactions.from_account_id,
+    _transactions.to_account_id,
+    cast(_transactions.amount, Float).label('amount'),
+    _transactions.transaction_type,
+    _transactions.description,
+    _transactions.created_at,
+)
+
+USER_COLUMNS = (
+    _users.id,
+    _users.username,
+    _users.email,
+)
+
+def fetch_rows(session: Session, statement: Select, row_type: Type, stream: bool = False) -> Iterable:
+    """Execute ``statement`` on the session's connection and map rows to ``row_type``.
+
+    Runs below the ORM (Connection.execute), so results are never tracked by
+    the session. With ``stream`` rows are mapped lazily from a server-side
+    cursor; otherwise a list is returned.
+    """
+    connection = session.connection()
+    if stream:
+        result = connection.execute(statement.execution_options(yield_per=READ_BATCH_SIZE))
+        return (row_type(*row) for row in result)
+    return [row_type(*row) for row in connection.execute(statement)]
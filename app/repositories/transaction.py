@@ -1,11 +1,34 @@
-from datetime import datetime
+import logging
+from datetime import date, datetime, timezone
 from decimal import Decimal
-from typing import Dict, List, Optional
-from sqlalchemy.orm import Session
+from typing import Dict, Iterable, List, Optional, Tuple
+from sqlalchemy.orm import Query, Session
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy import or_
+from sqlalchemy import Float, and_, case, cast, exists, func, literal, or_, select, tuple_, update
+from sqlalchemy.dialects import postgresql, sqlite
 from app.models.transaction import Transaction
+from app.models.transaction_summary import TransactionDailySummary
 from app.models.account import Account
+from app.partitions import transaction_number_window, utc
+from app.repositories.read_models import TRANSACTION_COLUMNS, StatementRow, TransactionRow, fetch_rows
+from app.repositories.transaction_number import transaction_number_allocator
+
+logger = logging.getLogger(__name__)
+
+# Rows fetched per round trip when streaming through a server-side cursor
+STREAM_BATCH_SIZE = 1000
+
+# transaction type -> (debits source, credits destination, source must cover amount)
+BALANCE_EFFECTS = {
+    "deposit": (False, True, False),
+    "withdrawal": (True, False, True),
+    "transfer": (True, True, True),
+    "payment": (True, False, True),
+    "refund": (False, True, False),
+    "fee": (True, False, True),
+    "interest": (False, True, False),
+    "reversal": (True, True, False),
+}
 
 class TransactionRepository:
     def __init__(self, db: Session = None):
@@ -20,47 +43,61 @@ class TransactionRepository:
         return transaction.to_dict() if transaction else None
     
     def find_by_transaction_number(self, transaction_number: str) -> Optional[Transaction]:
-        return self.db.query(Transaction).filter(Transaction.transaction_number == transaction_number).first()
+        query = self.db.query(Transaction).filter(Transaction.transaction_number == transaction_number)
+        return self._filter_number_window(query, transaction_number).first()
     
-    def find_by_account_id(
-        self, 
-        account_id: str, 
-        start_date: Optional[datetime] = None, 
-        end_date: Optional[datetime] = None
-    ) -> List[Transaction]:
-        query = self.db.query(Transaction).filter(Transaction.account_id == account_id)
-        
-        if start_date:
-            query = query.filter(Transaction.transaction_date >= start_date)
-        
-        if end_date:
-            query = query.filter(Transaction.transaction_date <= end_date)
-        
-        return query.order_by(Transaction.transaction_date.desc()).all()
+    def find_with_visibility(
+        self,
+        user_id: Optional[int],
+        transaction_id: Optional[int] = None,
+        transaction_number: Optional[str] = None
+    ) -> Optional[Tuple[Transaction, bool]]:
+        """Fetch a transaction with whether ``user_id`` owns either of its accounts.
+
+        The ownership test is an EXISTS in the same statement, so one round trip
+        answers both "does it exist" and "may this user see it". ``user_id``
+        None means no restriction (admin).
+        """
+        if user_id is None:
+            visible = literal(True)
+        else:
+            visible = exists().where(
+                Account.user_id == user_id,
+                or_(
+                    Account.id == Transaction.from_account_id,
+                    Account.id == Transaction.to_account_id
+                )
+            )
+        query = self.db.query(Transaction, visible.label('visible'))
+        if transaction_number is not None:
+            query = query.filter(Transaction.transaction_number == transaction_number)
+            query = self._filter_number_window(query, transaction_number)
+        else:
+            query = query.filter(Transaction.id == transaction_id)
+        row = query.first()
+        return (row[0], bool(row[1])) if row else None
 
     def find_by_user_id(
             self, 
             user_id: str, 
             account_id: Optional[str] = None, 
             start_date: Optional[datetime] = None, 
-            end_date: Optional[datetime] = None
-        ) -> List[Transaction]:
-        # Start with base query
-        query = self.db.query(Transaction)
-        
-        # Find all accounts belonging to the user
-        user_accounts = self.db.query(Account.id).filter(Account.user_id == user_id).all()
-        account_ids = [acc.id for acc in user_accounts]
-        
-        if not account_ids:
-            return []  # No accounts found for user
-        
-        # Filter transactions where user is sender or receiver
-        query = query.filter(
-            or_(
-                Transaction.from_account_id.in_(account_ids),
-                Transaction.to_account_id.in_(account_ids)
-            )
+            end_date: Optional[datetime] = None,
+            cursor: Optional[Tuple[datetime, int]] = None,
+            limit: Optional[int] = None,
+            stream: bool = False,
+            as_rows: bool = False
+        ) -> Iterable[Transaction]:
+        # Transactions where one of the user's accounts is sender or receiver.
+        # A semi-join never duplicates a row, so no DISTINCT is needed and the
+        # (created_at, id) order can come straight from the index under LIMIT.
+        owned_accounts = select(Account.id).where(Account.user_id == user_id)
+        query = (
+            (self.db.query(*TRANSACTION_COLUMNS) if as_rows else self.db.query(Transaction))
+            .filter(or_(
+                Transaction.from_account_id.in_(owned_accounts),
+                Transaction.to_account_id.in_(owned_accounts)
+            ))
         )
         
         # Filter by specific account if provided
@@ -74,13 +111,12 @@ class TransactionRepository:
         
         # Add date filters
         if start_date:
-            query = query.filter(Transaction.created_at >= start_date)
+            query = query.filter(Transaction.created_at >= utc(start_date))
         
         if end_date:
-            query = query.filter(Transaction.created_at <= end_date)
+            query = query.filter(Transaction.created_at <= utc(end_date))
         
-        # Order by most recent first
-        return query.order_by(Transaction.created_at.desc()).all()
+        return self._paginate(query, cursor, limit, stream, as_rows)
 
     def create(
         self, 
@@ -102,86 +138,19 @@ class TransactionRepository:
                 to_account_id=to_account_id,
                 amount=decimal_amount,
                 transaction_type=transaction_type,
-                description=description
+                description=description,
+                created_at=datetime.now(timezone.utc)
             )
             
             self.db.add(new_transaction)
             self.db.flush()  # This assigns an ID without committing
             
             # Update account balances based on transaction type
-            if transaction_type == "deposit":
-                if to_account_id:
-                    to_account = self.db.query(Account).filter(Account.id == to_account_id).first()
-                    if to_account:
-                        to_account.balance += decimal_amount
-            
-            elif transaction_type == "withdrawal":
-                if from_account_id:
-                    from_account = self.db.query(Account).filter(Account.id == from_account_id).first()
-                    if from_account:
-                        # Check if there's enough balance
-                        if from_account.balance >= decimal_amount:
-                            from_account.balance -= decimal_amount
-                        else:
-                            self.db.rollback()
-                            raise ValueError("Insufficient funds for withdrawal")
-            
-            elif transaction_type == "transfer":
-                if from_account_id and to_account_id:
-                    from_account = self.db.query(Account).filter(Account.id == from_account_id).first()
-                    to_account = self.db.query(Account).filter(Account.id == to_account_id).first()
-                    
-                    if from_account and to_account:
-                        # Check if there's enough balance
-                        if from_account.balance >= decimal_amount:
-                            from_account.balance -= decimal_amount
-                            to_account.balance += decimal_amount
-                        else:
-                            self.db.rollback()
-                            raise ValueError("Insufficient funds for transfer")
-            
-            elif transaction_type == "payment":
-                if from_account_id:
-                    from_account = self.db.query(Account).filter(Account.id == from_account_id).first()
-                    if from_account and from_account.balance >= decimal_amount:
-                        from_account.balance -= decimal_amount
-                    else:
-                        self.db.rollback()
-                        raise ValueError("Insufficient funds for payment")
-            
-            elif transaction_type == "refund":
-                if to_account_id:
-                    to_account = self.db.query(Account).filter(Account.id == to_account_id).first()
-                    if to_account:
-                        to_account.balance += decimal_amount
-            
-            elif transaction_type == "fee":
-                if from_account_id:
-                    from_account = self.db.query(Account).filter(Account.id == from_account_id).first()
-                    if from_account and from_account.balance >= decimal_amount:
-                        from_account.balance -= decimal_amount
-                    else:
-                        self.db.rollback()
-                        raise ValueError("Insufficient funds for fee")
-            
-            elif transaction_type == "interest":
-                if to_account_id:
-                    to_account = self.db.query(Account).filter(Account.id == to_account_id).first()
-                    if to_account:
-                        to_account.balance += decimal_amount
-            
-            elif transaction_type == "reversal":
-                # For reversals, you need to handle according to your business logic
-                # This is a simplified example - you'd want to reference the original transaction
-                if from_account_id:
-                    from_account = self.db.query(Account).filter(Account.id == from_account_id).first()
-                    if from_account:
-                        from_account.balance -= decimal_amount
-                
-                if to_account_id:
-                    to_account = self.db.query(Account).filter(Account.id == to_account_id).first()
-                    if to_account:
-                        to_account.balance += decimal_amount
+            self._apply_balance_changes(
+                self._balance_changes(transaction_type, from_account_id, to_account_id, decimal_amount),
+                transaction_type
+            )
+            self._record_rollup([new_transaction])
             
             # Commit the transaction and balance updates together
             self.db.commit()
@@ -189,9 +158,166 @@ class TransactionRepository:
         
         except Exception as e:
             self.db.rollback()
-            print(f"Transaction creation failed: {str(e)}")
+            # Expected rejections (ValueError) are logged by the service at DEBUG
+            if not isinstance(e, ValueError):
+                logger.exception("Transaction creation failed")
             raise e  # Re-raise to handle in the service layer
 
+    def create_batch(self, items: List[dict]) -> List[dict]:
+        """Insert many transactions and apply their balance changes in one commit.
+
+        ``items`` carry resolved account ids and Decimal amounts. Transaction
+        numbers are reserved first, then every involved account is locked once
+        in id order, as in create(). Funds are checked against a running
+        balance, and each account then receives a single UPDATE with its summed
+        delta. Returns one result dict per item, in input order.
+        """
+        results = [None] * len(items)
+        # Numbers first: a block reservation locks its counter row until commit,
+        # and create() takes that lock before the account locks too. Numbers of
+        # rejected items are skipped, like any unused part of a block.
+        numbers = [self._generate_transaction_number(item['transaction_type']) for item in items]
+        account_ids = {
+            account_id
+            for item in items
+            for account_id in (item.get('from_account_id'), item.get('to_account_id'))
+            if account_id
+        }
+        balances = dict(
+            self.db.query(Account.id, Account.balance)
+            .filter(Account.id.in_(account_ids))
+            .order_by(Account.id)
+            .with_for_update()
+            .all()
+        ) if account_ids else {}
+
+        deltas = {}
+        accepted = []
+        created_at = datetime.now(timezone.utc)
+        for index, item in enumerate(items):
+            changes = self._balance_changes(
+                item['transaction_type'], item.get('from_account_id'),
+                item.get('to_account_id'), item['amount'])
+            if any(account_id not in balances for account_id, _, _ in changes):
+                results[index] = {'index': index, 'success': False, 'message': 'Account not found!'}
+                continue
+            item_deltas = {}
+            for account_id, delta, _ in changes:
+                item_deltas[account_id] = item_deltas.get(account_id, 0) + delta
+            if self._overdraws(balances, deltas, changes, item_deltas):
+                results[index] = self._insufficient_funds(index, item['transaction_type'])
+                continue
+            for account_id, delta in item_deltas.items():
+                deltas[account_id] = deltas.get(account_id, 0) + delta
+            new_transaction = Transaction(
+                transaction_number=numbers[index],
+                from_account_id=item.get('from_account_id'),
+                to_account_id=item.get('to_account_id'),
+                amount=item['amount'],
+                transaction_type=item['transaction_type'],
+                description=item.get('description'),
+                created_at=created_at
+            )
+            accepted.append((index, new_transaction, changes, item_deltas))
+
+        try:
+            # Insert all accepted rows in one flush (batched INSERT ... RETURNING)
+            with self.db.begin_nested():
+                self.db.add_all([new_transaction for _, new_transaction, _, _ in accepted])
+                self.db.flush()
+            inserted = accepted
+        except SQLAlchemyError:
+            # Fall back to one savepoint per row so a bad row only rejects itself.
+            # A rejected credit can leave a later debit unfunded, so the running
+            # balance is rebuilt from the rows that actually insert.
+            inserted = []
+            deltas = {}
+            for index, new_transaction, changes, item_deltas in accepted:
+                if self._overdraws(balances, deltas, changes, item_deltas):
+                    results[index] = self._insufficient_funds(index, new_transaction.transaction_type)
+                    continue
+                try:
+                    with self.db.begin_nested():
+                        self.db.add(new_transaction)
+                        self.db.flush()
+                except SQLAlchemyError as e:
+                    results[index] = {'index': index, 'success': False, 'message': f'Database error: {str(e)}'}
+                    continue
+                inserted.append((index, new_transaction, changes, item_deltas))
+                for account_id, delta in item_deltas.items():
+                    deltas[account_id] = deltas.get(account_id, 0) + delta
+
+        for index, new_transaction, _, _ in inserted:
+            results[index] = {'index': index, 'success': True, 'transaction': new_transaction.to_dict()}
+
+        # One UPDATE per account with the summed delta; rows are already locked
+        for account_id in sorted(deltas):
+            if deltas[account_id]:
+                self.db.execute(
+                    update(Account)
+                    .where(Account.id == account_id)
+                    .values(balance=Account.balance + deltas[account_id])
+                    .execution_options(synchronize_session=False)
+                )
+        self._record_rollup([new_transaction for _, new_transaction, _, _ in inserted])
+
+        self.db.commit()
+        return results
+
+    @staticmethod
+    def _overdraws(balances: dict, deltas: dict, changes: list, item_deltas: dict) -> bool:
+        """True when applying ``item_deltas`` on top of ``deltas`` takes a funded leg below zero."""
+        return any(
+            requires_funds
+            and balances[account_id] + deltas.get(account_id, 0) + item_deltas[account_id] < 0
+            for account_id, _, requires_funds in changes
+        )
+
+    @staticmethod
+    def _insufficient_funds(index: int, transaction_type: str) -> dict:
+        return {'index': index, 'success': False, 'message': f"Insufficient funds for {transaction_type}"}
+
+    def _balance_changes(
+        self,
+        transaction_type: str,
+        from_account_id: Optional[int],
+        to_account_id: Optional[int],
+        amount: Decimal
+    ) -> List[Tuple[int, Decimal, bool]]:
+        """Return (account_id, delta, requires_funds) for each balance leg."""
+        debits_source, credits_destination, requires_funds = BALANCE_EFFECTS.get(
+            transaction_type, (False, False, False))
+        if transaction_type == "transfer" and not (from_account_id and to_account_id):
+            return []
+        changes = []
+        if debits_source and from_account_id:
+            changes.append((int(from_account_id), -amount, requires_funds))
+        if credits_destination and to_account_id:
+            changes.append((int(to_account_id), amount, False))
+        return changes
+
+    def _apply_balance_changes(self, changes: List[Tuple[int, Decimal, bool]], transaction_type: str):
+        """Apply each leg as one conditional UPDATE, locking rows in account id order.
+
+        Debits that require funds only match while ``balance >= amount``, so the
+        check and the write are a single statement and concurrent transfers
+        cannot both spend the same balance. Taking the row locks in a fixed
+        order keeps two opposite transfers from deadlocking.
+        """
+        for account_id, delta, requires_funds in sorted(changes, key=lambda change: change[0]):
+            statement = (
+                update(Account)
+                .where(Account.id == account_id)
+                .values(balance=Account.balance + delta)
+            )
+            if requires_funds:
+                statement = statement.where(Account.balance >= -delta)
+            updated = self.db.execute(
+                statement.returning(Account.id).execution_options(synchronize_session=False)
+            ).first()
+            if updated is None and requires_funds:
+                raise ValueError(f"Insufficient funds for {transaction_type}")
+
     def _generate_transaction_number(self, transaction_type: str) -> str:
         """Generate a unique transaction number based on transaction type."""
         # Create prefix based on transaction type
@@ -212,19 +338,8 @@ class TransactionRepository:
         # Format: PREFIX-YYYYMMDD-XXXXXX
         date_part = datetime.now().strftime("%Y%m%d")
         
-        # Get the last transaction number for this type today
-        last_transaction = self.db.query(Transaction)\
-            .filter(Transaction.transaction_number.like(f"{prefix}-{date_part}-%"))\
-            .order_by(Transaction.id.desc())\
-            .first()
-        
-        if last_transaction:
-            # Extract sequence number and increment
-            last_seq = int(last_transaction.transaction_number.split('-')[-1])
-            new_seq = last_seq + 1
-        else:
-            # First transaction of this type today
-            new_seq = 1
+        # Take the next sequence number from the per-day counter (no table scan)
+        new_seq = transaction_number_allocator.next_value(self.db, prefix, date_part)
         
         # Format with 6-digit sequence number
         return f"{prefix}-{date_part}-{new_seq:06d}"
@@ -245,78 +360,237 @@ class TransactionRepository:
             transaction.linked_transaction_id = linked_transaction_id
             self.db.commit()
             return True
-        except SQLAlchemyError as e:
+        except SQLAlchemyError:
             self.db.rollback()
-            print(f"Linked transaction update failed: {str(e)}")
+            logger.exception("Linked transaction update failed", extra={'transaction_id': transaction_id})
             return False
 
     def get_transaction_summary(
         self, 
         user_id: str, 
-        start_date: Optional[datetime] = None, 
-        end_date: Optional[datetime] = None
+        start_date: Optional[date] = None, 
+        end_date: Optional[date] = None,
+        account_id: Optional[int] = None
     ) -> dict:
+        """Summarize a user's transactions from the daily rollup table.
+
+        Each account leg is counted once, so a transfer between two of the
+        user's own accounts appears as both outgoing and incoming.
+        """
         query = (
-            self.db.query(Transaction)
-            .join(Transaction.account)
+            self.db.query(
+                TransactionDailySummary.transaction_type,
+                TransactionDailySummary.direction,
+                func.sum(TransactionDailySummary.transaction_count),
+                func.sum(TransactionDailySummary.total_amount)
+            )
+            .join(Account, Account.id == TransactionDailySummary.account_id)
             .filter(Account.user_id == user_id)
         )
         
+        if account_id:
+            query = query.filter(TransactionDailySummary.account_id == account_id)
+        
         if start_date:
-            query = query.filter(Transaction.transaction_date >= start_date)
+            query = query.filter(TransactionDailySummary.day >= start_date)
         
         if end_date:
-            query = query.filter(Transaction.transaction_date <= end_date)
+            query = query.filter(TransactionDailySummary.day <= end_date)
         
-        # Calculate summary
-        transactions = query.all()
+        rows = query.group_by(
+            TransactionDailySummary.transaction_type,
+            TransactionDailySummary.direction
+        ).all()
         
-        return {
-            'total_transactions': len(transactions),
-            'total_amount': sum(t.amount for t in transactions),
-            'transactions_by_type': self._summarize_by_type(transactions)
+        summary = {
+            'total_transactions': 0,
+            'total_amount': 0.0,
+            'total_in': 0.0,
+            'total_out': 0.0,
+            'transactions_by_type': {}
         }
+        for transaction_type, direction, count, total in rows:
+            by_type = summary['transactions_by_type'].setdefault(
+                transaction_type, {'count': 0, 'total_amount': 0.0})
+            by_type['count'] += int(count)
+            by_type['total_amount'] += float(total)
+            summary['total_transactions'] += int(count)
+            summary['total_amount'] += float(total)
+            summary['total_in' if direction == 'in' else 'total_out'] += float(total)
+        return summary
+
+    def _record_rollup(self, transactions: List[Transaction]):
+        """Add transactions to the per-account, per-day, per-type rollup.
 
-    def _summarize_by_type(self, transactions: List[Transaction]) -> dict:
-        summary = {}
+        Entries are pre-aggregated and upserted in key order, one statement
+        per distinct (account, day, type, direction).
+        """
+        entries = {}
         for transaction in transactions:
-            if transaction.transaction_type not in summary:
-                summary[transaction.transaction_type] = {
-                    'count': 0,
-                    'total_amount': 0
-                }
-            
-            summary[transaction.transaction_type]['count'] += 1
-            summary[transaction.transaction_type]['total_amount'] += transaction.amount
+            day = transaction.created_at.astimezone(timezone.utc).date()
+            for account_id, direction in (
+                (transaction.from_account_id, 'out'),
+                (transaction.to_account_id, 'in')
+            ):
+                if not account_id:
+                    continue
+                key = (account_id, day, transaction.transaction_type, direction)
+                count, total = entries.get(key, (0, Decimal('0')))
+                entries[key] = (count + 1, total + transaction.amount)
         
-        return summary
+        if not entries:
+            return
+        
+        table = TransactionDailySummary.__table__
+        bind = self.db.get_bind()
+        dialect_insert = sqlite.insert if bind.dialect.name == 'sqlite' else postgresql.insert
+        for (account_id, day, transaction_type, direction), (count, total) in sorted(entries.items()):
+            statement = dialect_insert(table).values(
+                account_id=account_id,
+                day=day,
+                transaction_type=transaction_type,
+                direction=direction,
+                transaction_count=count,
+                total_amount=total
+            )
+            statement = statement.on_conflict_do_update(
+                index_elements=[table.c.account_id, table.c.day, table.c.transaction_type, table.c.direction],
+                set_={
+                    'transaction_count': table.c.transaction_count + statement.excluded.transaction_count,
+                    'total_amount': table.c.total_amount + statement.excluded.total_amount
+                }
+            )
+            self.db.execute(statement)
     
     def get_all_transactions(
         self,
         start_date: Optional[datetime] = None,
-        end_date: Optional[datetime] = None
-    ) -> List[Transaction]:
-        query = self.db.query(Transaction)
+        end_date: Optional[datetime] = None,
+        cursor: Optional[Tuple[datetime, int]] = None,
+        limit: Optional[int] = None,
+        stream: bool = False,
+        as_rows: bool = False
+    ) -> Iterable[Transaction]:
+        # as_rows returns untracked TransactionRow DTOs ready for jsonify
+        query = self.db.query(*TRANSACTION_COLUMNS) if as_rows else self.db.query(Transaction)
         
         if start_date:
-            query = query.filter(Transaction.created_at >= start_date)
+            query = query.filter(Transaction.created_at >= utc(start_date))
         
         if end_date:
-            query = query.filter(Transaction.created_at <= end_date)
+            query = query.filter(Transaction.created_at <= utc(end_date))
         
-        return query.order_by(Transaction.created_at.desc()).all()
+        return self._paginate(query, cursor, limit, stream, as_rows)
     
-    def find_by_account_id(self, account_id, start_date=None, end_date=None):
-        from app.models.transaction import Transaction
-        
-        query = self.db.query(Transaction).filter(
+    def find_by_account_id(self, account_id, start_date=None, end_date=None,
+                           cursor=None, limit=None, stream=False, as_rows=False):
+        query = (self.db.query(*TRANSACTION_COLUMNS) if as_rows else self.db.query(Transaction)).filter(
             # Account is either source OR destination
             ((Transaction.from_account_id == account_id) | 
             (Transaction.to_account_id == account_id))
         )
         if start_date:
-            query = query.filter(Transaction.created_at >= start_date)
+            query = query.filter(Transaction.created_at >= utc(start_date))
         if end_date:
-            query = query.filter(Transaction.created_at <= end_date)
-        query = query.order_by(Transaction.created_at.desc())
+            query = query.filter(Transaction.created_at <= utc(end_date))
+        return self._paginate(query, cursor, limit, stream, as_rows)
+
+    def find_statement_rows(
+        self,
+        account_id: int,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> Iterable[StatementRow]:
+        """Stream an account statement, oldest first, with a running balance.
+
+        The balance is computed in SQL: the opening balance is the account's
+        current balance minus every signed amount since ``start_date``, and each
+        line adds a window SUM over (created_at, id). Rows come through a
+        server-side cursor, so memory stays flat for multi-year ranges.
+        ``end_date`` is exclusive.
+        """
+        credit_types = [t for t, (_, credits, _) in BALANCE_EFFECTS.items() if credits]
+        debit_types = [t for t, (debits, _, _) in BALANCE_EFFECTS.items() if debits]
+        signed_amount = (
+            case(
+                (and_(Transaction.to_account_id == account_id,
+                      Transaction.transaction_type.in_(credit_types)), Transaction.amount),
+                else_=0
+            )
+            - case(
+                (and_(Transaction.from_account_id == account_id,
+                      Transaction.transaction_type.in_(debit_types)), Transaction.amount),
+                else_=0
+            )
+        )
+        involves_account = or_(
+            Transaction.from_account_id == account_id,
+            Transaction.to_account_id == account_id
+        )
+
+        since_start = select(func.coalesce(func.sum(signed_amount), 0)).where(involves_account)
+        if start_date:
+            since_start = since_start.where(Transaction.created_at >= utc(start_date))
+        opening_balance = (
+            select(Account.balance - since_start.scalar_subquery())
+            .where(Account.id == account_id)
+            .scalar_subquery()
+        )
+        running_total = func.sum(signed_amount).over(
+            order_by=(Transaction.created_at, Transaction.id)
+        )
+
+        statement = select(
+            Transaction.created_at,
+            Transaction.transaction_number,
+            Transaction.transaction_type,
+            Transaction.description,
+            Transaction.from_account_id,
+            Transaction.to_account_id,
+            cast(signed_amount, Float).label('amount'),
+            cast(opening_balance + running_total, Float).label('balance'),
+        ).where(involves_account)
+        if start_date:
+            statement = statement.where(Transaction.created_at >= utc(start_date))
+        if end_date:
+            statement = statement.where(Transaction.created_at < utc(end_date))
+        statement = statement.order_by(Transaction.created_at, Transaction.id)
+        return fetch_rows(self.db, statement, StatementRow, stream=True)
+
+    def _filter_number_window(self, query: Query, transaction_number: str) -> Query:
+        # The date inside the number bounds created_at, so only one or two
+        # monthly partitions are searched instead of all of them
+        window = transaction_number_window(transaction_number)
+        if window is None:
+            return query
+        return query.filter(Transaction.created_at >= window[0], Transaction.created_at < window[1])
+
+    def _paginate(
+        self,
+        query: Query,
+        cursor: Optional[Tuple[datetime, int]] = None,
+        limit: Optional[int] = None,
+        stream: bool = False,
+        as_rows: bool = False
+    ) -> Iterable[Transaction]:
+        """Apply keyset ordering on (created_at, id), most recent first.
+
+        ``cursor`` is the (created_at, id) of the last row already returned.
+        The row comparison alone does not prune partitions, so the cursor's
+        created_at is also applied as a plain upper bound.
+        With ``stream`` the rows are pulled lazily through a server-side cursor.
+        With ``as_rows`` the query runs as Core and yields TransactionRow DTOs.
+        """
+        query = query.order_by(Transaction.created_at.desc(), Transaction.id.desc())
+        if cursor:
+            query = query.filter(
+                Transaction.created_at <= utc(cursor[0]),
+                tuple_(Transaction.created_at, Transaction.id) < tuple_(utc(cursor[0]), cursor[1])
+            )
+        if limit:
+            query = query.limit(limit)
+        if as_rows:
+            return fetch_rows(self.db, query.statement, TransactionRow, stream)
+        if stream:
+            return query.yield_per(STREAM_BATCH_SIZE)
         return query.all()
\ No newline at end of file
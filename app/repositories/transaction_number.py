@@ -0,0 +1,88 @@
+import os
+import threading
+from sqlalchemy import event
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from app.models.transaction_counter import TransactionNumberCounter
+
+# session.info key for blocks reserved in a transaction that has not committed yet
+_PENDING_BLOCKS = 'transaction_number_blocks'
+
+class TransactionNumberAllocator:
+    """Hands out per-prefix, per-day sequence numbers without scanning transactions.
+
+    Each process reserves a block of numbers with a single upsert on
+    transaction_number_counters and serves the block from memory, so
+    concurrent workers never receive the same number. Unused numbers in a
+    block are skipped, which leaves gaps but never duplicates.
+
+    The upsert runs in the caller's transaction, so no second pooled
+    connection is taken while the request holds one. A block only becomes
+    shared with other sessions once that transaction commits; if it rolls
+    back, the counter bump is undone and the block is dropped with it.
+    """
+    def __init__(self, block_size: int = None):
+        self.block_size = block_size or int(os.getenv('TXN_NUMBER_BLOCK_SIZE', 50))
+        self._lock = threading.Lock()
+        self._blocks = {}
+        self._pid = os.getpid()
+
+    def next_value(self, session: Session, prefix: str, day: str) -> int:
+        key = (prefix, day)
+        with self._lock:
+            # Blocks inherited from a parent process must not be reused after fork
+            if self._pid != os.getpid():
+                self._blocks.clear()
+                self._pid = os.getpid()
+            # Forget blocks from previous days
+            for stale in [stale for stale in self._blocks if stale[1] != day]:
+                del self._blocks[stale]
+
+            pending = session.info.get(_PENDING_BLOCKS, {})
+            for block in (pending.get(key), self._blocks.get(key)):
+                if block is not None and block[0] <= block[1]:
+                    value = block[0]
+                    block[0] += 1
+                    return value
+
+        block = self._reserve_block(session, prefix, day)
+        value = block[0]
+        block[0] += 1
+        return value
+
+    def _reserve_block(self, session: Session, prefix: str, day: str) -> list:
+        """Bump the counter by block_size in the session's transaction and return [first, last]."""
+        dialect_insert = sqlite.insert if session.get_bind().dialect.name == 'sqlite' else postgresql.insert
+        table = TransactionNumberCounter.__table__
+        statement = dialect_insert(table).values(
+            prefix=prefix, day=day, last_value=self.block_size
+        )
+        statement = statement.on_conflict_do_update(
+            index_elements=[table.c.prefix, table.c.day],
+            set_={'last_value': table.c.last_value + self.block_size}
+        ).returning(table.c.last_value)
+
+        last_value = session.execute(statement).scalar_one()
+        block = [last_value - self.block_size + 1, last_value]
+        if _PENDING_BLOCKS not in session.info:
+            event.listen(session, 'after_commit', self._share_pending)
+            event.listen(session, 'after_transaction_end', self._drop_pending)
+        session.info.setdefault(_PENDING_BLOCKS, {})[(prefix, day)] = block
+        return block
+
+    def _share_pending(self, session: Session):
+        # Committed: the remainder of each block is safe for other sessions to use
+        with self._lock:
+            for key, block in session.info.get(_PENDING_BLOCKS, {}).items():
+                if block[0] <= block[1]:
+                    self._blocks[key] = block
+        session.info.get(_PENDING_BLOCKS, {}).clear()
+
+    def _drop_pending(self, session: Session, transaction):
+        # Rolled back or closed without commit: the counter bump was undone
+        if transaction.parent is None:
+            session.info.get(_PENDING_BLOCKS, {}).clear()
+
+# Create a global instance
+transaction_number_allocator = TransactionNumberAllocator()
@@ -1,6 +1,12 @@
+import logging
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 from app.models.user import User
+from app.repositories.read_models import USER_COLUMNS, UserRow, fetch_rows
+from app.utils.loader import get_request_loader
+
+logger = logging.getLogger(__name__)
 
 class UserRepository:
     def __init__(self, db: Session = None):
@@ -8,6 +14,9 @@ class UserRepository:
         self.db = db if db is not None else get_db_session()
 
     def find_by_id(self, user_id: int):
+        loader = get_request_loader(self.db)
+        if loader is not None:
+            return loader.user(user_id)
         return self.db.query(User).filter(User.id == user_id).first()
 
     def find_by_username(self, username: str):
@@ -35,35 +44,30 @@ class UserRepository:
 
     def update(self, user_id: int, updates: dict):
         try:
-            print(f"Updating user {user_id} with changes: {updates}")
+            logger.debug("Updating user", extra={'user_id': user_id, 'fields': sorted(updates)})
             
             # Using self.db directly since that's your session object
             user = self.db.query(User).filter(User.id == user_id).first()
             
             if not user:
-                print(f"User {user_id} not found")
+                logger.debug("User not found for update", extra={'user_id': user_id})
                 return None
                 
-            print(f"Found user: {user.username}, {user.email}")
-            
             # Update fields - include phone in allowed fields
-            allowed_fields = ['username', 'email', 'password_hash', 'is_admin', 'phone']
+            allowed_fields = ['username', 'email', 'password', 'is_admin', 'phone']
             for field, value in updates.items():
                 if field in allowed_fields and hasattr(user, field):
-                    print(f"Updating {field} from {getattr(user, field)} to {value}")
                     setattr(user, field, value)
                 else:
-                    print(f"Field {field} not allowed or doesn't exist on User model")
+                    logger.debug("Ignoring update of disallowed field", extra={'user_id': user_id, 'field': field})
                     
             self.db.commit()
-            print("Changes committed to database")
             self.db.refresh(user)
-            print(f"User after update: {user.username}, {user.email}")
             return user
             
-        except SQLAlchemyError as e:
+        except SQLAlchemyError:
             self.db.rollback()
-            print(f"SQL error during update: {e}")
+            logger.exception("User update failed", extra={'user_id': user_id})
             raise
 
     def delete(self, user_id: int):
@@ -72,13 +76,19 @@ class UserRepository:
             if user:
                 self.db.delete(user)
                 self.db.commit()
+                loader = get_request_loader(self.db)
+                if loader is not None:
+                    loader.forget_user(user_id)
                 return True
             return False
         except SQLAlchemyError:
             self.db.rollback()
             return False
 
-    def find_all(self):
+    def find_all(self, as_rows: bool = False):
+        # as_rows returns untracked UserRow DTOs (id, username, email)
+        if as_rows:
+            return fetch_rows(self.db, select(*USER_COLUMNS), UserRow)
         return self.db.query(User).all()
 
     def count(self):
@@ -1,10 +1,10 @@
-import re
 from flask import Blueprint, request, jsonify
 from app.utils import helpers
 from app.utils.auth import admin_required, token_required
 from app.utils.validator_schemas import validate_required_fields
 from app.services.account import AccountService
-from app.utils.database_session_manager import db_session_manager
+from app.repositories.read_models import StatementRow
+from app.utils.database_session_manager import db_session_manager, get_db_session
 
 account_bp = Blueprint('account_bp', __name__, url_prefix='/revoubank/accounts')
 
@@ -14,9 +14,9 @@ account_bp = Blueprint('account_bp', __name__, url_prefix='/revoubank/accounts')
 def get_all_accounts_all_users():
     with db_session_manager.session_scope():
         account_service = AccountService()
-        accounts = account_service.get_all_accounts()
-        account_list = [account.to_dict() for account in accounts]
-        return jsonify(account_list), 200
+        # Rows are encoded directly by the JSON provider
+        accounts = account_service.get_all_accounts(as_rows=True)
+        return jsonify(accounts), 200
 
 @account_bp.route('/<string:user_id>', methods=['GET'])
 @token_required
@@ -26,15 +26,14 @@ def get_all_accounts_by_user(user_id):
         return error_response, status_code
     with db_session_manager.session_scope():
         account_service = AccountService()
-        accounts = account_service.get_user_accounts(user_id)
-        account_list = [account.to_dict() for account in accounts]
-        return jsonify(account_list), 200
+        accounts = account_service.get_user_accounts(user_id, as_rows=True)
+        return jsonify(accounts), 200
 
 @account_bp.route('/<string:identifier>/info', methods=['GET'])
 @token_required
 def get_account_details_by_identifier(identifier):
     # Check if it's an account number or account id
-    is_account_number = bool(re.fullmatch(r"ACC-\d+-\d+", identifier))
+    is_account_number = helpers.is_account_number_format(identifier)
     is_owner, error_response, status_code = helpers.check_account_owner_by_identifier(
         identifier, is_account_number=is_account_number,)
     if not is_owner:
@@ -45,10 +44,38 @@ def get_account_details_by_identifier(identifier):
             identifier, is_account_number=is_account_number)
         return jsonify(response_data), status_code
 
+@account_bp.route('/<string:identifier>/statement', methods=['GET'])
+@token_required
+def get_account_statement(identifier):
+    is_account_number = helpers.is_account_number_format(identifier)
+    is_owner, error_response, status_code = helpers.check_account_owner_by_identifier(
+        identifier, is_account_number=is_account_number)
+    if not is_owner:
+        return error_response, status_code
+    export_format = request.args.get('format', 'csv')
+    if export_format not in ('csv', 'ndjson'):
+        return jsonify({'message': 'Format must be csv or ndjson!'}), 400
+
+    start_date = request.args.get('start_date')
+    end_date = request.args.get('end_date')
+    # The session stays open until the last row is streamed
+    db_session = get_db_session()
+    account_service = AccountService(db_session)
+    success, result, status_code = account_service.get_statement(
+        identifier, is_account_number=is_account_number, start_date=start_date, end_date=end_date)
+    if not success:
+        db_session.close()
+        return jsonify(result), status_code
+
+    if export_format == 'ndjson':
+        return helpers.ndjson_response(result['rows'], db_session)
+    filename = f"statement-{result['account_number']}-{start_date or 'start'}-{end_date or 'today'}.csv"
+    return helpers.csv_response(result['rows'], StatementRow, db_session, filename=filename)
+
 @account_bp.route('/<string:identifier>', methods=['PUT'])
 @token_required
 def update_account_by_identifier(identifier):
-    is_account_number = bool(re.fullmatch(r"ACC-\d+-\d+", identifier))
+    is_account_number = helpers.is_account_number_format(identifier)
     is_owner, error_response, status_code = helpers.check_account_owner_by_identifier(
         identifier, is_account_number=is_account_number)
     if not is_owner:
@@ -65,7 +92,7 @@ def update_account_by_identifier(identifier):
 @account_bp.route('/<string:identifier>', methods=['DELETE'])
 @token_required
 def delete_account_by_identifier(identifier):
-    is_account_number = bool(re.fullmatch(r"ACC-\d+-\d+", identifier))
+    is_account_number = helpers.is_account_number_format(identifier)
     is_owner, error_response, status_code = helpers.check_account_owner_by_identifier(
         identifier, is_account_number=is_account_number)
     if not is_owner:
@@ -77,14 +104,6 @@ def delete_account_by_identifier(identifier):
         if not success:
             return response, status_code
         return response, status_code
-    
-def generate_account_number():
-    import random
-    import time
-    timestamp = int(time.time())
-    random_num = random.randint(1000, 9999)
-    return f"ACC-{timestamp}-{random_num}"
-
 
 @account_bp.route('/<string:user_id>/create', methods=['POST'])
 @token_required
@@ -96,9 +115,8 @@ def create_account_in_user(user_id):
     valid, message = validate_required_fields(data, ['account_type', 'account_name', 'currency'])
     if not valid:
         return jsonify({'message': message}), 400
+    # Generated by the service when not provided
     account_number = data.get('account_number')
-    if not account_number:
-        account_number = generate_account_number()
     with db_session_manager.session_scope():
         account_service = AccountService()
         success, message, account_id = account_service.create_account(
@@ -1,6 +1,10 @@
 from flask import Blueprint, request, jsonify
 from app.services.auth import AuthService
-from app.utils.database_session_manager import get_db_session
+from app.utils.auth import admin_required, token_required
+from app.utils.cache import principal_cache
+from app.utils.logging_config import logging_manager
+from app.utils.password_hasher import password_hasher
+from app.utils.database_session_manager import get_db_session, db_session_manager
 
 auth_bp = Blueprint('auth_bp', __name__, url_prefix='/revoubank')
 
@@ -48,3 +52,27 @@ def register():
 @auth_bp.route('/ping', methods=['GET'])
 def ping():
     return jsonify({'message': 'pong'}), 200
+
+@auth_bp.route('/pool-stats', methods=['GET'])
+@token_required
+@admin_required
+def pool_stats():
+    return jsonify(db_session_manager.pool_status()), 200
+
+@auth_bp.route('/cache-stats', methods=['GET'])
+@token_required
+@admin_required
+def cache_stats():
+    return jsonify(principal_cache.stats()), 200
+
+@auth_bp.route('/hash-stats', methods=['GET'])
+@token_required
+@admin_required
+def hash_stats():
+    return jsonify(password_hasher.stats()), 200
+
+@auth_bp.route('/log-stats', methods=['GET'])
+@token_required
+@admin_required
+def log_stats():
+    return jsonify(logging_manager.stats()), 200
@@ -1,10 +1,11 @@
 from datetime import datetime
-import re
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, g, request, jsonify
 from app.services.account import AccountService
 from app.utils import helpers
 from app.utils.auth import admin_required, token_required
 from app.utils.database_session_manager import get_db_session
+from app.utils.idempotency import idempotent
+from app.utils.metrics import record_transaction_failure
 from app.services.transaction import TransactionService
 
 transaction_bp = Blueprint('transaction_bp', __name__, url_prefix='/revoubank/transactions')
@@ -17,6 +18,12 @@ def get_all_transactions_all_users():
     transaction_service = TransactionService(db_session)
     start_date_str = request.args.get('start_date')
     end_date_str = request.args.get('end_date')
+    streaming = False
+    try:
+        cursor, limit, stream = helpers.parse_pagination_args(request.args)
+    except ValueError as e:
+        db_session.close()
+        return jsonify({'message': str(e)}), 400
     try:
         start_date = None
         end_date = None
@@ -27,15 +34,24 @@ def get_all_transactions_all_users():
         # Get all transactions
         transactions = transaction_service.get_all_transactions_admin(
             start_date=start_date,
-            end_date=end_date
+            end_date=end_date,
+            cursor=cursor,
+            limit=limit + 1 if limit else None,
+            stream=stream
         )
+        if stream:
+            streaming = True
+            return helpers.ndjson_response(transactions, db_session, limit)
+        if limit:
+            return jsonify(helpers.build_page(transactions, limit))
         return jsonify(transactions)
     except ValueError as e:
         return jsonify({'message': f"Invalid date format: {str(e)}"}), 400
     except Exception as e:
         return jsonify({'message': str(e)}), 500
     finally:
-        db_session.close()
+        if not streaming:
+            db_session.close()
 
 @transaction_bp.route('/userid/<string:user_id>', methods=['GET'])
 @token_required
@@ -48,14 +64,53 @@ def get_all_transactions_by_account_id(user_id):
     account_id = request.args.get('account_id')
     start_date = request.args.get('start_date')
     end_date = request.args.get('end_date')
+    streaming = False
+    try:
+        cursor, limit, stream = helpers.parse_pagination_args(request.args)
+    except ValueError as e:
+        db_session.close()
+        return jsonify({'message': str(e)}), 400
     try:
         transactions = transaction_service.get_user_transactions(
             user_id=user_id,
             account_id=account_id,
             start_date=start_date,
-            end_date=end_date
+            end_date=end_date,
+            cursor=cursor,
+            limit=limit + 1 if limit else None,
+            stream=stream
         )
-        return jsonify([transaction.to_dict() for transaction in transactions])
+        if stream:
+            streaming = True
+            return helpers.ndjson_response(transactions, db_session, limit)
+        if limit:
+            return jsonify(helpers.build_page(transactions, limit))
+        return jsonify(transactions)
+    except Exception as e:
+        return jsonify({'message': str(e)}), 500
+    finally:
+        if not streaming:
+            db_session.close()
+
+@transaction_bp.route('/summary', methods=['GET'])
+@token_required
+def get_transaction_summary():
+    user_id = request.args.get('user_id') or g.current_user['id']
+    authorized, error_message, status_code = helpers.check_user_owner(user_id)
+    if not authorized:
+        return error_message, status_code
+    db_session = get_db_session()
+    transaction_service = TransactionService(db_session)
+    try:
+        summary = transaction_service.get_transaction_summary(
+            user_id=user_id,
+            account_id=request.args.get('account_id'),
+            start_date=request.args.get('start_date'),
+            end_date=request.args.get('end_date')
+        )
+        return jsonify(summary), 200
+    except ValueError as e:
+        return jsonify({'message': str(e)}), 400
     except Exception as e:
         return jsonify({'message': str(e)}), 500
     finally:
@@ -63,6 +118,7 @@ def get_all_transactions_by_account_id(user_id):
 
 @transaction_bp.route('/create', methods=['POST'])
 @token_required
+@idempotent
 def create_transaction():
     db_session = get_db_session()
     transaction_service = TransactionService(db_session)
@@ -74,6 +130,7 @@ def create_transaction():
         else:
             db_session.rollback()
         if not success:
+            record_transaction_failure(status_code, result)
             return jsonify({'message': str(result)}), status_code
         # Make sure result is JSON serializable
         if isinstance(result, dict):
@@ -83,6 +140,32 @@ def create_transaction():
         return jsonify(result), status_code
     except Exception as e:
         db_session.rollback()
+        record_transaction_failure(500, e)
+        return jsonify({'message': str(e)}), 500
+    finally:
+        db_session.close()
+
+@transaction_bp.route('/batch', methods=['POST'])
+@token_required
+@idempotent
+def create_transactions_batch():
+    db_session = get_db_session()
+    transaction_service = TransactionService(db_session)
+    data = request.json
+    items = data.get('transactions') if isinstance(data, dict) else data
+    try:
+        success, result, status_code = transaction_service.create_transactions_batch(items)
+        if not success:
+            db_session.rollback()
+            record_transaction_failure(status_code, result)
+            return jsonify({'message': str(result)}), status_code
+        for item in result.get('results', []) if isinstance(result, dict) else result:
+            if not item.get('success'):
+                record_transaction_failure(400, item.get('message'))
+        return jsonify(result), status_code
+    except Exception as e:
+        db_session.rollback()
+        record_transaction_failure(500, e)
         return jsonify({'message': str(e)}), 500
     finally:
         db_session.close()
@@ -93,16 +176,13 @@ def get_transaction_info_by_identifier(identifier):
     is_transaction_number = helpers.is_valid_transaction_number(identifier)
     db_session = get_db_session()
     transaction_service = TransactionService(db_session)
-    auth, error_response, status_code = transaction_service.check_transaction_auth_by_identifier(
-        identifier, is_transaction_number=is_transaction_number)
-    if not auth:
-        return error_response, status_code
     try:
-        success, response_data, status_code = transaction_service.get_transaction_by_identifier(
+        # Existence and ownership are checked in the same query that loads the row
+        transaction, error_response, status_code = transaction_service.find_authorized_transaction(
             identifier, is_transaction_number=is_transaction_number)
-        if not success:
-            return jsonify({'message': response_data}), status_code
-        return jsonify(response_data), status_code
+        if transaction is None:
+            return error_response, status_code
+        return jsonify(transaction.to_dict()), 200
     except Exception as e:
         return jsonify({'message': str(e)}), 500
     finally:
@@ -115,7 +195,7 @@ def get_transactions_by_account_identifier(account_identifier):
     db_session = get_db_session()
     transaction_service = TransactionService(db_session)
     
-    is_account_number = bool(re.fullmatch(r"ACC-\d+-\d+", account_identifier))
+    is_account_number = helpers.is_account_number_format(account_identifier)
     is_owner, error_response, status_code = helpers.check_account_owner_by_identifier(
         account_identifier, is_account_number=is_account_number)
     if not is_owner:
@@ -123,20 +203,31 @@ def get_transactions_by_account_identifier(account_identifier):
     # Parse query parameters
     start_date_str = request.args.get('start_date')
     end_date_str = request.args.get('end_date')
+    streaming = False
     
     try:
+        cursor, limit, stream = helpers.parse_pagination_args(request.args)
         # Get transactions
         transactions = transaction_service.get_transactions_by_account_identifier(
             identifier=account_identifier,
             is_account_number=is_account_number,
             start_date=start_date_str,
-            end_date=end_date_str
+            end_date=end_date_str,
+            cursor=cursor,
+            limit=limit + 1 if limit else None,
+            stream=stream
         )
+        if stream:
+            streaming = True
+            return helpers.ndjson_response(transactions, db_session, limit)
         
-        return jsonify([transaction.to_dict() for transaction in transactions])
+        if limit:
+            return jsonify(helpers.build_page(transactions, limit))
+        return jsonify(transactions)
     except ValueError as e:
         return jsonify({'message': str(e)}), 400
     except Exception as e:
         return jsonify({'message': str(e)}), 500
     finally:
-        db_session.close()
\ No newline at end of file
+        if not streaming:
+            db_session.close()
\ No newline at end of file
@@ -48,13 +48,8 @@ def get_all_users():
     db_session = get_db_session()
     try:
         user_service = UserService(db_session)
-        users = user_service.get_all_users()
-        users_list = [{
-            'id': user.id,
-            'username': user.username,
-            'email': user.email
-        } for user in users]
-        return jsonify({"users": users_list})
+        users = user_service.get_all_users(as_rows=True)
+        return jsonify({"users": users})
     except Exception as e:
         return jsonify({'message': str(e)}), 500
     finally:
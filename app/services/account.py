@@ -1,9 +1,11 @@
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Tuple, List, Dict, Any, Optional
 from flask import g, request, jsonify
 from sqlalchemy.orm import Session
 
 from app.repositories.account import AccountRepository
+from app.repositories.transaction import TransactionRepository
+from app.utils import helpers
 from app.utils.database_session_manager import get_db_session
 
 class AccountService:
@@ -12,10 +14,15 @@ class AccountService:
         self.repository = AccountRepository(self.db_session)
     
     def create_account(self, user_id: str, account_name: str, account_type: str, 
-                    account_number: str, currency: str, initial_balance: float = 0) -> Tuple[bool, str, Optional[str]]:
+                    account_number: Optional[str], currency: str, initial_balance: float = 0) -> Tuple[bool, str, Optional[str]]:
         valid_types = ['checking', 'savings', 'investment','deposit']
         if account_type not in valid_types:
             return False, f"Invalid account type. Must be one of: {', '.join(valid_types)}", None
+        if not account_number:
+            account_number = self.repository.next_account_number()
+        elif not helpers.is_account_number_format(account_number):
+            # It could never be looked up by number
+            return False, "Invalid account number", None
         return self.repository.create(
             user_id, 
             account_name,
@@ -25,13 +32,13 @@ class AccountService:
             initial_balance
         )
     
-    def get_user_accounts(self, user_id: str) -> List[Any]:
+    def get_user_accounts(self, user_id: str, as_rows: bool = False) -> List[Any]:
         # Convert user_id to integer if passed as string
         user_id_int = int(user_id) if isinstance(user_id, str) else user_id
-        return self.repository.find_by_user_id(user_id_int)
+        return self.repository.find_by_user_id(user_id_int, as_rows=as_rows)
     
-    def get_all_accounts(self) -> List[Any]:
-        return self.repository.find_all_accounts()
+    def get_all_accounts(self, as_rows: bool = False) -> List[Any]:
+        return self.repository.find_all_accounts(as_rows=as_rows)
     
     def get_account_by_identifier(self, identifier: str, is_account_number: bool = False) -> Optional[Any]:
         """Get account by either account_id or account_number"""
@@ -42,14 +49,28 @@ class AccountService:
             
     def get_account_info_by_identifier(self, identifier: str, is_account_number: bool = False) -> Tuple[bool, Dict[str, Any], int]:
         """Get account info by either account_id or account_number"""
-        if is_account_number:
-            account = self.repository.find_by_account_number(identifier)
-            if not account:
-                return False, {'message': 'Account not found!'}, 404
-            return True, account.to_dict(), 200
-        else:
-            return self.get_account_info(identifier)
+        # Resolved through the request loader, so the ownership check's row is reused
+        account = self.get_account_by_identifier(identifier, is_account_number)
+        if not account:
+            return False, {'message': 'Account not found!'}, 404
+        return True, account.to_dict(), 200
             
+    def get_statement(self, identifier: str, is_account_number: bool = False,
+                      start_date: Optional[str] = None, end_date: Optional[str] = None) -> Tuple[bool, Any, int]:
+        """Lazy statement rows for an account between YYYY-MM-DD dates (both inclusive)."""
+        account = self.get_account_by_identifier(identifier, is_account_number)
+        if not account:
+            return False, {'message': 'Account not found!'}, 404
+        try:
+            parsed_start = datetime.strptime(start_date, "%Y-%m-%d") if start_date else None
+            # Add 1 day to include the entire end date
+            parsed_end = datetime.strptime(end_date, "%Y-%m-%d") + timedelta(days=1) if end_date else None
+        except ValueError:
+            return False, {'message': 'Invalid date format! Use YYYY-MM-DD.'}, 400
+        rows = TransactionRepository(self.db_session).find_statement_rows(
+            account.id, parsed_start, parsed_end)
+        return True, {'account_number': account.account_number, 'rows': rows}, 200
+
     def delete_account_by_identifier(self, identifier: str, is_account_number: bool = False) -> Tuple[bool, Any, int]:
         """Delete account by either account_id or account_number"""
         account = self.get_account_by_identifier(identifier, is_account_number)
@@ -1,8 +1,16 @@
+import logging
 from sqlalchemy.orm import Session
 from app.utils.auth import generate_token, verify_password, hash_password
+from app.utils.database_session_manager import db_session_manager
+from app.utils.password_hasher import PasswordHasherBusy, password_hasher
 from app.utils.validator_schemas import validate_email, validate_password, validate_required_fields
 from app.repositories.auth import AuthRepository
 
+logger = logging.getLogger(__name__)
+
+# Returned instead of queueing more work on a saturated hashing pool
+BUSY_RESPONSE = {'message': 'Server is busy, please retry shortly.'}
+
 class AuthService:
     def __init__(self, db: Session):
         self.repository = AuthRepository(db)
@@ -13,8 +21,13 @@ class AuthService:
         user = self.repository.find_user_by_email(email)
         if not user:
             return False, {'message': 'Invalid credentials!'}, 401
-        if not verify_password(user.password, password):
-            return False, {'message': "Invalid credentials!"}, 401
+        try:
+            if not verify_password(user.password, password):
+                return False, {'message': "Invalid credentials!"}, 401
+        except PasswordHasherBusy:
+            return False, BUSY_RESPONSE, 503
+        if password_hasher.needs_rehash(user.password):
+            self._schedule_rehash(user.id, user.password, password)
         token = generate_token(str(user.id))
         return True, {
             'message': 'Login successful!',
@@ -25,7 +38,7 @@ class AuthService:
         }, 200
 
     def register(self, user_data: dict):
-        print("REGISTER STARTED")
+        logger.debug("Registration started")
         if 'is_admin' in user_data:
             return False, {'message': 'Forbidden: Only admins can set "is_admin" field.'}, 403
         valid, message = validate_required_fields(user_data, ['username', 'email', 'password'])
@@ -38,7 +51,10 @@ class AuthService:
             return False, {'message': pwd_message}, 400
         if self.repository.user_exists(user_data.get('email')):
             return False, {'message': 'User already exists!'}, 409
-        hashed_password = hash_password(user_data.get('password'))
+        try:
+            hashed_password = hash_password(user_data.get('password'))
+        except PasswordHasherBusy:
+            return False, BUSY_RESPONSE, 503
         success, result = self.repository.create_user(user_data, hashed_password)
         if success:
             user_info = user_data.copy()
@@ -50,3 +66,15 @@ class AuthService:
             }, 201
         else:
             return False, {'message': f'Registration failed: {result}'}, 500
+
+    def _schedule_rehash(self, user_id: int, old_hash: str, password: str):
+        """Upgrade a hash made with old parameters without delaying the login."""
+        def save(new_hash):
+            # Runs on the rehash thread, so it needs its own session
+            session = db_session_manager.SessionLocal()
+            try:
+                AuthRepository(session).replace_password_hash(user_id, old_hash, new_hash)
+            finally:
+                session.close()
+
+        password_hasher.rehash_in_background(password, save)
@@ -1,14 +1,19 @@
+import logging
 from datetime import datetime, timedelta
+from decimal import Decimal
 from typing import Optional, List, Tuple
 from flask import g, jsonify
 from sqlalchemy.orm import Session
 from app.models.transaction import TransactionType
 from app.repositories.account import AccountRepository
-from app.repositories.transaction import TransactionRepository
+from app.repositories.transaction import BALANCE_EFFECTS, TransactionRepository
 from app.utils import helpers
 from sqlalchemy.exc import SQLAlchemyError
 
-from app.utils.database_session_manager import DatabaseSessionManager, get_db_session
+logger = logging.getLogger(__name__)
+
+# Upper bound on items accepted by a single batch request
+MAX_BATCH_SIZE = 1000
 
 class TransactionService:
     def __init__(self, db_session: Session):
@@ -18,53 +23,31 @@ class TransactionService:
     def check_transaction_auth(self, transaction_id: str):
         if not transaction_id:
             return False, jsonify({'message': 'Transaction ID is required!'}), 400
-        # Convert transaction_id to int if it's a string
-        try:
-            transaction_id_int = int(transaction_id) if isinstance(transaction_id, str) else transaction_id
-        except ValueError:
-            return False, jsonify({'message': 'Invalid Transaction ID format!'}), 400
-        # Use the session_scope context manager
-        db_session_manager = DatabaseSessionManager()
-        with db_session_manager.session_scope():
-            # Get the current database session
-            session = get_db_session()
-            # Properly initialize the repository with the session
-            transaction_repository = TransactionRepository(db=session)
-            transaction = transaction_repository.find_by_id(transaction_id_int)
-            if not transaction:
-                return False, jsonify({'message': 'Transaction not found!'}), 404
-            current_user = g.current_user
-            # Check if user is admin
-            if current_user.get('is_admin', False):
-                return True, None, None  # Admin users can access any transaction
-            # Convert current user ID to int for comparison if needed
-            current_user_id = int(current_user['id']) if isinstance(current_user['id'], str) else current_user['id']
-            # Get the account repository to check ownership
-            account_repository = AccountRepository(db=session)
-            # Check if user owns either the source or destination account
-            if transaction.from_account_id:
-                from_account = account_repository.find_by_id(transaction.from_account_id)
-                if from_account and from_account.user_id == current_user_id:
-                    return True, None, None
-            if transaction.to_account_id:
-                to_account = account_repository.find_by_id(transaction.to_account_id)
-                if to_account and to_account.user_id == current_user_id:
-                    return True, None, None
-            return False, jsonify({'message': 'Unauthorized access to this transaction!'}), 403
+        return self.check_transaction_auth_by_identifier(transaction_id)
     
     def get_all_transactions_admin(
         self,
         start_date: Optional[datetime] = None,
-        end_date: Optional[datetime] = None
-    ) -> List[dict]:
-        """Get all transactions in the system (admin only)."""
-        return [transaction.to_dict() for transaction in 
-                self.transaction_repository.get_all_transactions(
-                    start_date, 
-                    end_date
-                )]
+        end_date: Optional[datetime] = None,
+        cursor: Optional[Tuple[datetime, int]] = None,
+        limit: Optional[int] = None,
+        stream: bool = False
+    ):
+        """Get all transactions in the system (admin only).
+
+        Returns JSON-ready rows, lazily fetched when streaming.
+        """
+        return self.transaction_repository.get_all_transactions(
+            start_date,
+            end_date,
+            cursor=cursor,
+            limit=limit,
+            stream=stream,
+            as_rows=True
+        )
 
-    def get_user_transactions(self, user_id, account_id=None, start_date=None, end_date=None):
+    def get_user_transactions(self, user_id, account_id=None, start_date=None, end_date=None,
+                              cursor=None, limit=None, stream=False):
         try:
             # Parse dates if they're strings
             parsed_start_date = None
@@ -85,12 +68,42 @@ class TransactionService:
                 user_id=user_id,
                 account_id=account_id,
                 start_date=parsed_start_date,
-                end_date=parsed_end_date
+                end_date=parsed_end_date,
+                cursor=cursor,
+                limit=limit,
+                stream=stream,
+                as_rows=True
             )
-        except Exception as e:
-            print(f"Error getting user transactions: {str(e)}")
+        except Exception:
+            logger.exception("Error getting user transactions", extra={'user_id': user_id})
             raise
 
+    def get_transaction_summary(self, user_id, account_id=None, start_date=None, end_date=None) -> dict:
+        """Summarize a user's transactions by type over an inclusive date range."""
+        parsed_start_date = None
+        parsed_end_date = None
+        if start_date:
+            try:
+                parsed_start_date = datetime.strptime(start_date, "%Y-%m-%d").date()
+            except ValueError:
+                raise ValueError(f"Invalid start date format: {start_date}")
+        if end_date:
+            try:
+                parsed_end_date = datetime.strptime(end_date, "%Y-%m-%d").date()
+            except ValueError:
+                raise ValueError(f"Invalid end date format: {end_date}")
+        if account_id:
+            try:
+                account_id = int(account_id)
+            except ValueError:
+                raise ValueError('Invalid Account ID format!')
+        return self.transaction_repository.get_transaction_summary(
+            user_id=int(user_id),
+            start_date=parsed_start_date,
+            end_date=parsed_end_date,
+            account_id=account_id
+        )
+
     def get_transaction_by_id(self, transaction_id: str) -> Tuple[bool, dict, int]:
         transaction_info = self.transaction_repository.find_transaction_info(transaction_id)
         if not transaction_info:
@@ -107,6 +120,10 @@ class TransactionService:
             # Check both from and to account formats
             from_is_acc_num = from_account_identifier and helpers.is_account_number_format(from_account_identifier)
             to_is_acc_num = to_account_identifier and helpers.is_account_number_format(to_account_identifier)
+            # A mistyped check digit makes the identifier neither an account number nor an id
+            for identifier in (from_account_identifier, to_account_identifier):
+                if isinstance(identifier, str) and identifier.startswith('ACC-') and not helpers.is_account_number_format(identifier):
+                    return False, 'Invalid account number!', 400
             # Only use account numbers if BOTH are account numbers (or only one exists and it's valid)
             use_account_numbers = (from_is_acc_num if from_account_identifier else True) and \
                                 (to_is_acc_num if to_account_identifier else True)
@@ -258,61 +275,171 @@ class TransactionService:
                 
         except ValueError as e:
             # Handle validation errors like insufficient funds
+            logger.debug("Transaction rejected", extra={'reason': str(e)})
             return False, str(e), 400
         except SQLAlchemyError as e:
             # Handle database errors
+            logger.exception("Transaction create failed on the database")
             return False, f'Database error: {str(e)}', 500
         except Exception as e:
             # Handle other errors
+            logger.exception("Transaction create failed")
             return False, f'Transaction failed: {str(e)}', 500
 
-    def check_transaction_auth_by_identifier(self, identifier: str, is_transaction_number: bool = False):
+    def create_transactions_batch(self, items) -> Tuple[bool, dict, int]:
+        """Validate, authorize and create many transactions with a single commit.
+
+        Each item uses the same fields as a single create, with
+        ``from_account_id`` / ``to_account_id`` holding an account id or number.
+        Reversals are not supported in a batch.
+        """
+        if not isinstance(items, list) or not items:
+            return False, 'A non-empty list of transactions is required!', 400
+        if len(items) > MAX_BATCH_SIZE:
+            return False, f'A batch may contain at most {MAX_BATCH_SIZE} transactions!', 400
+
+        # Resolve every referenced account with one query
+        account_ids = set()
+        account_numbers = set()
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            for key in ('from_account_id', 'to_account_id'):
+                identifier = item.get(key)
+                if isinstance(identifier, str) and helpers.is_account_number_format(identifier):
+                    account_numbers.add(identifier)
+                elif identifier:
+                    try:
+                        account_ids.add(int(identifier))
+                    except (TypeError, ValueError):
+                        pass
+        accounts = AccountRepository(self.db_session).find_by_identifiers(
+            list(account_ids), list(account_numbers))
+        accounts_by_id = {account.id: account for account in accounts}
+        accounts_by_number = {account.account_number: account for account in accounts}
+
+        current_user = g.current_user
+        is_admin = current_user.get('is_admin', False)
+        current_user_id = int(current_user['id']) if isinstance(current_user['id'], str) else current_user['id']
+
+        def resolve(identifier):
+            if isinstance(identifier, str) and helpers.is_account_number_format(identifier):
+                return accounts_by_number.get(identifier)
+            try:
+                return accounts_by_id.get(int(identifier))
+            except (TypeError, ValueError):
+                return None
+
+        valid_types = [t.value for t in TransactionType if t != TransactionType.REVERSAL]
+        results = [None] * len(items)
+        resolved = []
+        for index, item in enumerate(items):
+            if not isinstance(item, dict):
+                results[index] = {'index': index, 'success': False, 'message': 'Invalid transaction data!'}
+                continue
+            transaction_type = item.get('transaction_type')
+            amount = item.get('amount')
+            if transaction_type not in valid_types:
+                results[index] = {
+                    'index': index,
+                    'success': False,
+                    'message': f'Valid transaction type is required! Must be one of: {", ".join(valid_types)}'
+                }
+                continue
+            if not amount or not isinstance(amount, (int, float)) or amount <= 0:
+                results[index] = {'index': index, 'success': False, 'message': 'Valid positive amount is required!'}
+                continue
+
+            debits_source, credits_destination, _ = BALANCE_EFFECTS[transaction_type]
+            resolved_item = {
+                'transaction_type': transaction_type,
+                'amount': Decimal(str(amount)),
+                'description': item.get('description', ''),
+                'from_account_id': None,
+                'to_account_id': None
+            }
+            error = None
+            for key, required, label in (
+                ('from_account_id', debits_source, 'Source'),
+                ('to_account_id', credits_destination, 'Destination')
+            ):
+                if not required:
+                    continue
+                if not item.get(key):
+                    error = f'{label} account identifier is required!'
+                    break
+                account = resolve(item.get(key))
+                if not account:
+                    error = f'{label} account not found!'
+                    break
+                if not is_admin and account.user_id != current_user_id:
+                    error = 'Unauthorized access to this account!'
+                    break
+                resolved_item[key] = account.id
+            if error:
+                results[index] = {'index': index, 'success': False, 'message': error}
+                continue
+            resolved.append((index, resolved_item))
+
+        try:
+            created = self.transaction_repository.create_batch([item for _, item in resolved])
+        except SQLAlchemyError as e:
+            return False, f'Database error: {str(e)}', 500
+        for (index, _), result in zip(resolved, created):
+            result['index'] = index
+            results[index] = result
+
+        succeeded = sum(1 for result in results if result['success'])
+        return True, {
+            'message': 'Batch processed',
+            'succeeded': succeeded,
+            'failed': len(results) - succeeded,
+            'results': results
+        }, 201 if succeeded else 400
+
+    def find_authorized_transaction(self, identifier: str, is_transaction_number: bool = False):
+        """Load a transaction and check the caller may see it in one query.
+
+        Returns (transaction, error_response, status_code); transaction is None
+        when the lookup or the authorization failed.
+        """
         if not identifier:
-            return False, jsonify({'message': 'Transaction identifier is required!'}), 400
+            return None, jsonify({'message': 'Transaction identifier is required!'}), 400
+        
+        current_user = g.current_user
+        
+        # Admin users can access any transaction; others must own either account
+        if current_user.get('is_admin', False):
+            visible_to_user_id = None
+        else:
+            visible_to_user_id = int(current_user['id']) if isinstance(current_user['id'], str) else current_user['id']
         
-        # Get the transaction using the appropriate method
         if is_transaction_number:
-            transaction = self.transaction_repository.find_by_transaction_number(identifier)
+            result = self.transaction_repository.find_with_visibility(
+                visible_to_user_id, transaction_number=identifier)
         else:
             # Convert transaction_id to int if it's a string
             try:
                 transaction_id_int = int(identifier) if isinstance(identifier, str) else identifier
             except ValueError:
-                return False, jsonify({'message': 'Invalidxx Transaction ID format!'}), 400
-            
-            transaction = self.transaction_repository.find_by_id(transaction_id_int)
+                return None, jsonify({'message': 'Invalidxx Transaction ID format!'}), 400
+            result = self.transaction_repository.find_with_visibility(
+                visible_to_user_id, transaction_id=transaction_id_int)
         
-        if not transaction:
-            return False, jsonify({'message': 'Transaction not found!'}), 404
+        if not result:
+            return None, jsonify({'message': 'Transaction not found!'}), 404
         
-        current_user = g.current_user
-        
-        # Check if user is admin
-        if current_user.get('is_admin', False):
-            return True, None, None  # Admin users can access any transaction
-        
-        # Convert current user ID to int for comparison if needed
-        current_user_id = int(current_user['id']) if isinstance(current_user['id'], str) else current_user['id']
-        
-        # Get the account repository to check ownership
-        db_session_manager = DatabaseSessionManager()
-        with db_session_manager.session_scope():
-            session = get_db_session()
-            account_repository = AccountRepository(db=session)
-            
-            # Check if user owns either the source or destination account
-            if transaction.from_account_id:
-                from_account = account_repository.find_by_id(transaction.from_account_id)
-                if from_account and from_account.user_id == current_user_id:
-                    return True, None, None
-                    
-            if transaction.to_account_id:
-                to_account = account_repository.find_by_id(transaction.to_account_id)
-                if to_account and to_account.user_id == current_user_id:
-                    return True, None, None
-            
-        # If we reach here, the user doesn't own either account
-        return False, jsonify({'message': 'Unauthorized access to this transaction!'}), 403 
+        transaction, visible = result
+        if not visible:
+            return None, jsonify({'message': 'Unauthorized access to this transaction!'}), 403
+        return transaction, None, None
+
+    def check_transaction_auth_by_identifier(self, identifier: str, is_transaction_number: bool = False):
+        transaction, error_response, status_code = self.find_authorized_transaction(
+            identifier, is_transaction_number=is_transaction_number)
+        if transaction is None:
+            return False, error_response, status_code
+        return True, None, None
     
     def get_transaction_by_identifier(self, identifier: str, is_transaction_number: bool = False) -> Tuple[bool, dict, int]:
         if is_transaction_number:
@@ -324,7 +451,8 @@ class TransactionService:
             return self.get_transaction_by_id(identifier)
     
     
-    def get_transactions_by_account_identifier(self, identifier: str, is_account_number: bool = False, start_date=None, end_date=None):
+    def get_transactions_by_account_identifier(self, identifier: str, is_account_number: bool = False, start_date=None, end_date=None,
+                                               cursor=None, limit=None, stream=False):
         try:
             # Get the account ID
             account_repository = AccountRepository(self.db_session)
@@ -367,8 +495,12 @@ class TransactionService:
             return self.transaction_repository.find_by_account_id(
                 account_id=account.id,
                 start_date=parsed_start_date,
-                end_date=parsed_end_date
+                end_date=parsed_end_date,
+                cursor=cursor,
+                limit=limit,
+                stream=stream,
+                as_rows=True
             )
-        except Exception as e:
-            print(f"Error getting account transactions: {str(e)}")
+        except Exception:
+            logger.exception("Error getting account transactions", extra={'account_identifier': identifier})
             raise
\ No newline at end of file
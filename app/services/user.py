@@ -1,17 +1,22 @@
+import logging
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 from app.utils import helpers
 from app.utils.auth import hash_password
+from app.utils.cache import principal_cache
+from app.utils.password_hasher import PasswordHasherBusy
 from app.repositories.user import UserRepository
 from app.utils.validator_schemas import validate_email, validate_password
 
+logger = logging.getLogger(__name__)
+
 class UserService:
     def __init__(self, db: Session):
         self.user_repository = UserRepository(db)
     
-    def get_all_users(self):
+    def get_all_users(self, as_rows: bool = False):
         try:
-            users = self.user_repository.find_all()
+            users = self.user_repository.find_all(as_rows=as_rows)
             return users if users is not None else []
         except SQLAlchemyError:
             return []
@@ -33,7 +38,6 @@ class UserService:
         }, 200
     
     def update_user(self, user_id: int, data: dict):
-        print(f"data {data}")
         is_owner, error_response, status_code = helpers.check_user_owner(user_id)
         if not is_owner:
             return False, error_response, status_code
@@ -79,15 +83,16 @@ class UserService:
             if not valid_password:
                 return False, pwd_message, {}
             
-            # IMPORTANT: Use password_hash here, not password
-            updates['password_hash'] = hash_password(data['password'])
+            # The hash is stored in the User.password column
+            try:
+                updates['password'] = hash_password(data['password'])
+            except PasswordHasherBusy:
+                return False, "Server is busy, please retry shortly.", {}
             changes['password'] = {
                 'from': '********',
                 'to': '********'
             }
         
-        print(f"Final updates to apply: {updates}")
-        
         # Return early if nothing to update
         if not updates:
             return True, "No changes to update", {}
@@ -97,10 +102,11 @@ class UserService:
             if not updated_user:
                 return False, "Failed to update user", {}
             
-            print(f"User updated successfully: {updated_user.username}")
+            principal_cache.invalidate(user_id)
+            logger.info("User updated", extra={'user_id': user_id, 'fields': sorted(updates)})
             return True, "User updated successfully", changes
-        except SQLAlchemyError as e:
-            print(f"SQL error during update: {e}")
+        except SQLAlchemyError:
+            logger.exception("User update failed", extra={'user_id': user_id})
             return False, "An error occurred while updating the user", {}
     
     def delete_user(self, user_id: int):
@@ -112,4 +118,5 @@ class UserService:
         if not success:
             return False, "Failed to delete user"
         
+        principal_cache.invalidate(user_id)
         return True, "User deleted successfully"
\ No newline at end of file
@@ -1,16 +1,20 @@
 import os
+import time
 from datetime import datetime, timedelta
 from functools import wraps
 
 import jwt
 from flask import request, jsonify, current_app, g
-from werkzeug.security import check_password_hash, generate_password_hash
 from app.repositories.user import UserRepository
+from app.utils.cache import principal_cache
+from app.utils.password_hasher import password_hasher
 
 def generate_token(user_id):
-    expiration = datetime.utcnow() + timedelta(minutes=current_app.config.get('JWT_EXPIRATION_MINUTES', 60))
+    issued_at = datetime.utcnow()
+    expiration = issued_at + timedelta(minutes=current_app.config.get('JWT_EXPIRATION_MINUTES', 60))
     payload = {
         'user_id': user_id,
+        'iat': issued_at,
         'exp': expiration
     }
     secret_key = os.getenv('SECRET_KEY')
@@ -24,11 +28,18 @@ def generate_token(user_id):
     )
     return token
 
+def decode_token(token):
+    secret_key = os.getenv('SECRET_KEY')
+    if not secret_key:
+        raise ValueError("No SECRET_KEY set for JWT encoding")
+    return jwt.decode(token, str(secret_key), algorithms=["HS256"])
+
+# Hashing runs on the bounded process pool; both raise PasswordHasherBusy when it is saturated
 def hash_password(password):
-    return generate_password_hash(password)
+    return password_hasher.hash(password)
 
 def verify_password(stored_password, provided_password):
-    return check_password_hash(stored_password, provided_password)
+    return password_hasher.verify(stored_password, provided_password)
 
 def token_required(f):
     @wraps(f)
@@ -43,21 +54,26 @@ def token_required(f):
             return jsonify({'message': 'Token is missing!'}), 401
         
         try:
-            secret_key = os.getenv('SECRET_KEY')
-            if not secret_key:
-                raise ValueError("No SECRET_KEY set for JWT encoding")
-            
             # Decode the token
-            data = jwt.decode(token, str(secret_key), algorithms=["HS256"])
-            
-            # Fetch the current user
-            user_repo = UserRepository()
-            current_user = user_repo.find_by_id(data['user_id'])
+            data = decode_token(token)
             
-            if not current_user:
-                return jsonify({'message': 'User not foundxxxx!'}), 401
+            # Fetch the current user, from the principal cache when possible
+            cache_key = (str(data['user_id']), data.get('iat'))
+            current_user = principal_cache.get(cache_key)
+            if current_user is None:
+                # Taken before the read, so an invalidation racing with it still wins
+                loaded_at = time.time()
+                user_repo = UserRepository()
+                user = user_repo.find_by_id(data['user_id'])
+                
+                if not user:
+                    return jsonify({'message': 'User not foundxxxx!'}), 401
+                
+                current_user = user.to_dict()
+                principal_cache.set(cache_key, current_user, loaded_at)
             
-            g.current_user = current_user.to_dict() 
+            # Copy so handlers cannot mutate the cached entry
+            g.current_user = dict(current_user)
         
         except jwt.ExpiredSignatureError:
             return jsonify({'message': 'Token has expired!'}), 401
@@ -0,0 +1,99 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from app.utils.shared_timestamps import SharedTimestamps
+
+class PrincipalCache:
+    """Bounded LRU cache with a TTL for authenticated user dicts.
+
+    Entries are keyed by (user_id, token issue time) and live in each worker,
+    but invalidations do not: ``invalidate`` records the time in a table shared
+    by every worker on the host, and an entry loaded before the latest
+    invalidation of its user is treated as a miss in all of them.
+    """
+    def __init__(self, max_size: int = 1024, ttl: float = 60.0, invalidations_path: str = None):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.invalidations = SharedTimestamps('principal-invalidations', path=invalidations_path)
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._keys_by_user = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            value, expires_at, loaded_at = entry
+            if expires_at < time.monotonic():
+                self._remove(key)
+                self.evictions += 1
+                self.misses += 1
+                return None
+            # Another worker may have changed or deleted the user since it was loaded
+            if self.invalidations.read(key[0]) >= loaded_at:
+                self._remove(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key, value, loaded_at: float = None):
+        """Cache a principal; ``loaded_at`` is the wall time its database read started."""
+        if loaded_at is None:
+            loaded_at = time.time()
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (value, time.monotonic() + self.ttl, loaded_at)
+            self._keys_by_user.setdefault(key[0], set()).add(key)
+            while len(self._entries) > self.max_size:
+                oldest_key = next(iter(self._entries))
+                self._remove(oldest_key)
+                self.evictions += 1
+
+    def invalidate(self, user_id):
+        """Drop every cached principal for a user, whatever token it came from, in every worker."""
+        self.invalidations.raise_to(str(user_id), time.time())
+        with self._lock:
+            for key in list(self._keys_by_user.get(str(user_id), ())):
+                self._remove(key)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_user.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._entries),
+                'max_size': self.max_size,
+                'ttl_seconds': self.ttl,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_ratio': round(self.hits / lookups, 4) if lookups else 0.0
+            }
+
+    def _remove(self, key):
+        self._entries.pop(key, None)
+        user_keys = self._keys_by_user.get(key[0])
+        if user_keys is not None:
+            user_keys.discard(key)
+            if not user_keys:
+                del self._keys_by_user[key[0]]
+
+# Create a global instance
+principal_cache = PrincipalCache(
+    max_size=int(os.getenv('PRINCIPAL_CACHE_SIZE', 1024)),
+    ttl=float(os.getenv('PRINCIPAL_CACHE_TTL', 60)),
+    invalidations_path=os.getenv('PRINCIPAL_INVALIDATIONS_FILE')
+)
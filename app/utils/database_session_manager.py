@@ -1,45 +1,233 @@
-from flask import Flask, g
+import os
+import random
+import threading
+import time
+from flask import Flask, g, has_request_context, request
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.pool import QueuePool
 from contextlib import contextmanager
+from app.utils.metrics import POOL_CHECKOUT_TIMEOUTS, POOL_CHECKOUT_WAIT
+from app.utils.shared_timestamps import SharedTimestamps
+
+class PoolStats:
+    """Thread-safe counters for connection checkout wait time."""
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.timeouts = 0
+
+    def record_wait(self, seconds: float, timed_out: bool = False):
+        if timed_out:
+            POOL_CHECKOUT_TIMEOUTS.inc()
+        else:
+            POOL_CHECKOUT_WAIT.observe(seconds)
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.total_wait += seconds
+            self.max_wait = max(self.max_wait, seconds)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                'checkouts': self.checkouts,
+                'checkout_timeouts': self.timeouts,
+                'total_wait_seconds': round(self.total_wait, 6),
+                'max_wait_seconds': round(self.max_wait, 6),
+                'avg_wait_seconds': round(self.total_wait / self.checkouts, 6) if self.checkouts else 0.0
+            }
+
+pool_stats = PoolStats()
+
+def pool_options_from_env() -> dict:
+    """Pool sizing shared by the sync and async engines (DB_POOL_* variables)."""
+    return {
+        'pool_size': int(os.getenv('DB_POOL_SIZE', 5)),
+        'max_overflow': int(os.getenv('DB_MAX_OVERFLOW', 10)),
+        'pool_recycle': int(os.getenv('DB_POOL_RECYCLE', 1800)),
+        'pool_pre_ping': os.getenv('DB_POOL_PRE_PING', 'true').lower() == 'true',
+        'pool_timeout': float(os.getenv('DB_POOL_TIMEOUT', 30)),
+    }
+
+class TimedQueuePool(QueuePool):
+    """QueuePool that records how long each checkout waited for a connection."""
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except Exception:
+            pool_stats.record_wait(time.perf_counter() - start, timed_out=True)
+            raise
+        pool_stats.record_wait(time.perf_counter() - start)
+        return connection
+
+# HTTP methods whose sessions may read from a replica
+READ_METHODS = ('GET', 'HEAD')
+# Carries the read-your-writes deadline to other hosts behind the same load balancer
+READ_PRIMARY_COOKIE = 'rw_until'
+
+class RecentWrites(SharedTimestamps):
+    """Users who wrote recently and must read from the primary, shared by every worker on the host.
+
+    Each user's slot holds a read-your-writes deadline, so a write in one
+    gunicorn worker is seen by all the others, whatever the client does with
+    cookies. Two users sharing a slot only means one of them also reads from
+    the primary for a few seconds.
+    """
+    def __init__(self, window: float = 5.0, slots: int = 65536, path: str = None):
+        super().__init__('recent-writes', slots, path)
+        self.window = window
+
+    def mark(self, user_id: str) -> float:
+        until = time.time() + self.window
+        # Deadlines are absolute, so stale values from an earlier run are simply expired
+        self.raise_to(user_id, until)
+        return until
+
+    def is_recent(self, user_id: str) -> bool:
+        return self.read(user_id) > time.time()
+
+class RoutingSession(Session):
+    """Session that sends reads of a read-only session to a replica engine.
+
+    Anything that writes (flushes, INSERT/UPDATE/DELETE, SELECT ... FOR UPDATE)
+    always uses the primary, as do reads once the current user has written
+    within the read-your-writes window.
+    """
+    def __init__(self, *args, manager=None, read_only=False, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.manager = manager
+        self.read_only = read_only
+        # One replica per session so all of its reads see the same server
+        self.replica = manager.pick_replica() if manager is not None and read_only else None
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if (
+            self.replica is not None
+            and not self._flushing
+            and not _is_write(clause)
+            and not self.manager.reads_from_primary()
+        ):
+            return self.replica
+        return super().get_bind(mapper, clause=clause, **kwargs)
+
+def _is_write(clause) -> bool:
+    if clause is None:
+        return False
+    return getattr(clause, 'is_dml', False) or getattr(clause, '_for_update_arg', None) is not None
 
 class DatabaseSessionManager:
     def __init__(self, app: Flask = None):
         self.engine = None
+        self.read_engines = []
         self.SessionLocal = None
-        
+        self.recent_writes = RecentWrites()
+
         if app is not None:
             self.init_app(app)
-    
+
     def init_app(self, app: Flask):
         # Get database connection string from app configuration
         database_uri = app.config.get('SQLALCHEMY_DATABASE_URI')
         if not database_uri:
             raise ValueError("SQLALCHEMY_DATABASE_URI must be set in app configuration")
-        
-        # Create engine
-        self.engine = create_engine(database_uri)
-        
+
+        # Reuse the Flask-SQLAlchemy engine so each process holds a single pool
+        from app import db
+        with app.app_context():
+            self.engine = db.engine
+
+        # Optional read replicas (comma-separated URLs), each with its own pool
+        replica_urls = app.config.get('SQLALCHEMY_REPLICA_URIS') or []
+        self.read_engines = [
+            create_engine(url, poolclass=TimedQueuePool, **pool_options_from_env())
+            for url in replica_urls
+        ]
+        self.recent_writes.window = float(app.config.get('READ_YOUR_WRITES_SECONDS', 5))
+        if app.config.get('READ_YOUR_WRITES_FILE'):
+            self.recent_writes.path = app.config['READ_YOUR_WRITES_FILE']
+
         # Create session factory
-        self.SessionLocal = sessionmaker(bind=self.engine)
-        
+        self.SessionLocal = sessionmaker(bind=self.engine, class_=RoutingSession, manager=self)
+
         # Register teardown handler
         app.teardown_appcontext(self.teardown_session)
-    
+        app.after_request(self.track_writes)
+
+    def pick_replica(self):
+        return random.choice(self.read_engines) if self.read_engines else None
+
+    def reads_from_primary(self) -> bool:
+        """True when the current user wrote within the read-your-writes window."""
+        if not has_request_context():
+            return False
+        cached = g.get('read_primary')
+        if cached is not None:
+            return cached
+        current_user = g.get('current_user')
+        if current_user is None:
+            # Not authenticated yet; decide again once the user is known
+            return False
+        user_id = str(current_user['id'])
+        read_primary = self.recent_writes.is_recent(user_id) or self._cookie_is_recent(user_id)
+        g.read_primary = read_primary
+        return read_primary
+
+    def _cookie_is_recent(self, user_id: str) -> bool:
+        cookie_user, _, until = request.cookies.get(READ_PRIMARY_COOKIE, '').partition(':')
+        try:
+            return cookie_user == user_id and float(until) > time.time()
+        except ValueError:
+            return False
+
+    def track_writes(self, response):
+        """After a successful write, pin the user's reads to the primary for a while."""
+        if not self.read_engines or request.method in READ_METHODS or response.status_code >= 400:
+            return response
+        current_user = g.get('current_user')
+        if current_user is None:
+            return response
+        user_id = str(current_user['id'])
+        until = self.recent_writes.mark(user_id)
+        response.set_cookie(READ_PRIMARY_COOKIE, f"{user_id}:{until:.3f}",
+                            max_age=int(self.recent_writes.window) + 1, httponly=True)
+        return response
+
+    @contextmanager
+    def replica_session(self):
+        """Read-only session on a replica (or the primary when none is configured) for jobs and reports."""
+        session = self.SessionLocal(read_only=True)
+        try:
+            yield session
+        finally:
+            session.close()
+
+    def dispose(self, close: bool = True):
+        for engine in [self.engine, *self.read_engines]:
+            if engine is not None:
+                engine.dispose(close=close)
+
     def get_session(self) -> Session:
         """Get or create a database session."""
         if not hasattr(g, 'db_session'):
             if self.SessionLocal is None:
                 raise RuntimeError("Database session not initialized. Call init_app first.")
-            g.db_session = self.SessionLocal()
+            # GET/HEAD requests read from a replica when one is configured
+            read_only = has_request_context() and request.method in READ_METHODS
+            g.db_session = self.SessionLocal(read_only=read_only)
         return g.db_session
-    
+
     def teardown_session(self, exception=None):
         """Close the database session."""
         db_session = g.pop('db_session', None)
         if db_session is not None:
             db_session.close()
-    
+
     @contextmanager
     def session_scope(self):
         """Provide a transactional scope around a series of operations."""
@@ -53,9 +241,30 @@ class DatabaseSessionManager:
         finally:
             session.close()
 
+    def pool_status(self) -> dict:
+        """Report checked-out connections, overflow and checkout wait time."""
+        if self.engine is None:
+            raise RuntimeError("Database session not initialized. Call init_app first.")
+        pool = self.engine.pool
+        status = {'pool_class': type(pool).__name__}
+        if isinstance(pool, QueuePool):
+            status.update({
+                'size': pool.size(),
+                'checked_in': pool.checkedin(),
+                'checked_out': pool.checkedout(),
+                'overflow': max(pool.overflow(), 0),
+                'max_overflow': pool._max_overflow,
+            })
+        status.update(pool_stats.snapshot())
+        status['replicas'] = [
+            {'checked_out': engine.pool.checkedout(), 'overflow': max(engine.pool.overflow(), 0)}
+            for engine in self.read_engines if isinstance(engine.pool, QueuePool)
+        ]
+        return status
+
 # Create a global instance
 db_session_manager = DatabaseSessionManager()
 
 # Utility function to get current session
 def get_db_session() -> Session:
-    return db_session_manager.get_session()
\ No newline at end of file
+    return db_session_manager.get_session()
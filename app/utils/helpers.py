@@ -1,9 +1,13 @@
+import base64
+import csv
+import dataclasses
+import io
 from datetime import datetime
 import re
-from flask import g, jsonify
-from app.repositories.account import AccountRepository
+from flask import Response, current_app, g, jsonify, stream_with_context
+from app.repositories.account import AccountRepository, luhn_check_digit
 from app.repositories.user import UserRepository
-from app.utils.database_session_manager import DatabaseSessionManager, get_db_session, db_session_manager
+from app.utils.database_session_manager import get_db_session
 
 def check_account_owner(account_id):
     if not account_id:
@@ -15,36 +19,33 @@ def check_account_owner(account_id):
     except ValueError:
         return False, jsonify({'message': 'Invalid Account ID format!'}), 400
     
-    # Use the session_scope context manager
-    db_session_manager = DatabaseSessionManager()
-    with db_session_manager.session_scope():
-        # Get the current database session
-        session = get_db_session()
-        
-        # Properly initialize the repository with the session
-        account_repository = AccountRepository(db=session)
-        account = account_repository.find_by_id(account_id_int)
-        
-        if not account:
-            return False, jsonify({'message': 'Account not found!'}), 404
-        
-        current_user = g.current_user
-        
-        # Check if user is admin
-        if current_user.get('is_admin', False):
-            return True, None, None  # Admin users can access any account
-        
-        # Convert current user ID to int for comparison if needed
-        current_user_id = int(current_user['id']) if isinstance(current_user['id'], str) else current_user['id']
-        
-        # Get account user_id
-        account_user_id = account.user_id
-        
-        # Compare IDs
-        if account_user_id != current_user_id:
-            return False, jsonify({'message': 'Unauthorized access to this account!'}), 403
-        
-        return True, None, None
+    # Read-only check on the request session; no commit needed
+    session = get_db_session()
+    
+    # Properly initialize the repository with the session
+    account_repository = AccountRepository(db=session)
+    account = account_repository.find_by_id(account_id_int)
+    
+    if not account:
+        return False, jsonify({'message': 'Account not found!'}), 404
+    
+    current_user = g.current_user
+    
+    # Check if user is admin
+    if current_user.get('is_admin', False):
+        return True, None, None  # Admin users can access any account
+    
+    # Convert current user ID to int for comparison if needed
+    current_user_id = int(current_user['id']) if isinstance(current_user['id'], str) else current_user['id']
+    
+    # Get account user_id
+    account_user_id = account.user_id
+    
+    # Compare IDs
+    if account_user_id != current_user_id:
+        return False, jsonify({'message': 'Unauthorized access to this account!'}), 403
+    
+    return True, None, None
 
 def check_user_owner(user_id):
     if not user_id:
@@ -56,32 +57,38 @@ def check_user_owner(user_id):
     except ValueError:
         return False, jsonify({'message': 'Invalid User ID format!'}), 400
     
-    # Use the session_scope context manager correctly
-    db_session_manager = DatabaseSessionManager()
-    with db_session_manager.session_scope():
-        user_repository = UserRepository()  # Use without passing session
-        user = user_repository.find_by_id(user_id_int)
-        
-        if not user:
-            return False, "User not found!", 404
-        
-        current_user = g.current_user
-        
-        # Check if user is admin
-        if current_user.get('is_admin', False):
-            return True, None, None  # Admin users can access any user account
-        
-        # Convert current user ID to int for comparison if needed
-        current_user_id = int(current_user['id']) if isinstance(current_user['id'], str) else current_user['id']
-        
-        # Compare IDs
-        if current_user_id != user_id_int:
-            return False, "Unauthorized access to this user account!", 403
-        
-        return True, None, None
+    # Read-only check on the request session; no commit needed
+    user_repository = UserRepository()  # Use without passing session
+    user = user_repository.find_by_id(user_id_int)
+    
+    if not user:
+        return False, "User not found!", 404
+    
+    current_user = g.current_user
     
+    # Check if user is admin
+    if current_user.get('is_admin', False):
+        return True, None, None  # Admin users can access any user account
+    
+    # Convert current user ID to int for comparison if needed
+    current_user_id = int(current_user['id']) if isinstance(current_user['id'], str) else current_user['id']
+    
+    # Compare IDs
+    if current_user_id != user_id_int:
+        return False, "Unauthorized access to this user account!", 403
+    
+    return True, None, None
+    
+# Numbers from AccountRepository.next_account_number: date, 10-digit sequence, check digit
+ISSUED_ACCOUNT_NUMBER = re.compile(r"ACC-\d{8}-(\d{10})(\d)")
+
 def is_account_number_format(identifier: str) -> bool:
-    return bool(re.fullmatch(r"ACC-\d+-\d+", identifier))
+    """Account numbers look like ACC-<digits>-<digits>; issued ones must also pass the Luhn check."""
+    if not re.fullmatch(r"ACC-\d+-\d+", identifier):
+        return False
+    # Numbers created before the check digit existed, or supplied by the client, carry none
+    issued = ISSUED_ACCOUNT_NUMBER.fullmatch(identifier)
+    return issued is None or luhn_check_digit(issued.group(1)) == int(issued.group(2))
 
 def is_valid_transaction_number(txn_number: str) -> bool:
     """Validate a transaction number against expected pattern and known prefixes."""
@@ -112,18 +119,10 @@ def check_account_owner_by_identifier(identifier, is_account_number=False, sessi
     if not identifier:
         return False, jsonify({'message': 'Account identifier is required!'}), 400
     
-    # If no session provided, create a new one
+    # If no session provided, use the request session (read-only check)
     if session is None:
-        # Use the session_scope context manager
-        db_session_manager = DatabaseSessionManager()
-        with db_session_manager.session_scope():
-            # Get the current database session
-            session = get_db_session()
-            # Call the function with the new session
-            return _perform_account_ownership_check(identifier, is_account_number, session)
-    else:
-        # Use the provided session directly
-        return _perform_account_ownership_check(identifier, is_account_number, session)
+        session = get_db_session()
+    return _perform_account_ownership_check(identifier, is_account_number, session)
 
 def _perform_account_ownership_check(identifier, is_account_number, session):
     """Helper function to perform the actual ownership check with a given session"""
@@ -161,4 +160,117 @@ def _perform_account_ownership_check(identifier, is_account_number, session):
     if account_user_id != current_user_id:
         return False, jsonify({'message': 'Unauthorized access to this account!'}), 403
     
-    return True, None, None
\ No newline at end of file
+    return True, None, None
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+def encode_cursor(created_at, record_id) -> str:
+    """Encode the (created_at, id) keyset of the last returned row as an opaque token."""
+    if isinstance(created_at, datetime):
+        created_at = created_at.isoformat()
+    raw = f"{created_at}|{record_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+def decode_cursor(cursor: str):
+    """Decode a token produced by encode_cursor back into (created_at, id)."""
+    try:
+        created_at, record_id = base64.urlsafe_b64decode(cursor.encode()).decode().split('|')
+        return datetime.fromisoformat(created_at), int(record_id)
+    except (ValueError, UnicodeDecodeError):
+        raise ValueError("Invalid cursor!")
+
+def parse_pagination_args(args):
+    """Read cursor, limit and format query parameters.
+
+    Returns (cursor, limit, stream). ``limit`` is None when the client asked
+    for neither a page size nor a cursor, so legacy callers keep getting the
+    full list.
+    """
+    stream = args.get('format') == 'ndjson'
+    cursor_str = args.get('cursor')
+    limit_str = args.get('limit')
+    cursor = decode_cursor(cursor_str) if cursor_str else None
+    limit = None
+    if limit_str or cursor_str:
+        try:
+            limit = int(limit_str) if limit_str else DEFAULT_PAGE_SIZE
+        except ValueError:
+            raise ValueError("Invalid limit!")
+        if limit <= 0:
+            raise ValueError("Limit must be positive!")
+        limit = min(limit, MAX_PAGE_SIZE)
+    return cursor, limit, stream
+
+def row_cursor(row) -> str:
+    """Cursor pointing just past ``row`` (a dict, Row, DTO or model)."""
+    if isinstance(row, dict):
+        return encode_cursor(row['created_at'], row['id'])
+    return encode_cursor(row.created_at, row.id)
+
+def build_page(items, limit):
+    """Trim a result fetched with limit + 1 rows (dicts or Row objects) and attach the next cursor."""
+    has_more = len(items) > limit
+    items = items[:limit]
+    next_cursor = None
+    if has_more and items:
+        next_cursor = row_cursor(items[-1])
+    return {
+        'transactions': items,
+        'next_cursor': next_cursor
+    }
+
+def ndjson_response(rows, session=None, limit=None):
+    """Stream rows as newline-delimited JSON while they are read from the database.
+
+    With ``limit`` the rows were fetched with limit + 1: at most ``limit`` rows
+    are sent, and when the extra row exists a final ``{"next_cursor": ...}``
+    line tells the client where the next page starts.
+    """
+    def generate():
+        try:
+            last = None
+            for count, row in enumerate(rows):
+                if limit is not None and count == limit:
+                    yield current_app.json.dumps({'next_cursor': row_cursor(last)}) + "\n"
+                    break
+                yield current_app.json.dumps(row) + "\n"
+                last = row
+        finally:
+            if session is not None:
+                session.close()
+    return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+
+# Leading characters that make spreadsheet tools evaluate a cell as a formula
+CSV_FORMULA_PREFIXES = ('=', '+', '-', '@', '\t', '\r')
+
+def _csv_cell(value):
+    # Text cells (e.g. user-supplied descriptions) are defused with a leading quote;
+    # numbers such as negative amounts are left as they are
+    if isinstance(value, str) and value.startswith(CSV_FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+def csv_response(rows, row_type, session=None, filename=None):
+    """Stream dataclass rows as CSV, one flushed line per row, header from the row type."""
+    columns = [field.name for field in dataclasses.fields(row_type)]
+
+    def generate():
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        try:
+            writer.writerow(columns)
+            for row in rows:
+                writer.writerow([_csv_cell(getattr(row, column)) for column in columns])
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+            # Only the header when there were no rows
+            if buffer.tell():
+                yield buffer.getvalue()
+        finally:
+            if session is not None:
+                session.close()
+
+    headers = {'Content-Disposition': f'attachment; filename="{filename}"'} if filename else None
+    return Response(stream_with_context(generate()), mimetype='text/csv', headers=headers)
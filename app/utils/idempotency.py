@@ -0,0 +1,93 @@
+import hashlib
+import logging
+import os
+from functools import wraps
+
+from flask import Response, g, jsonify, make_response, request
+from sqlalchemy.exc import OperationalError, SQLAlchemyError
+from app.repositories.idempotency import idempotency_store
+from app.utils.database_session_manager import get_db_session
+
+logger = logging.getLogger(__name__)
+
+# How long a duplicate waits for the first request before giving up with 409
+WAIT_TIMEOUT = float(os.getenv('IDEMPOTENCY_WAIT_TIMEOUT', 10))
+MAX_KEY_LENGTH = 255
+
+def _request_hash() -> str:
+    digest = hashlib.sha256()
+    digest.update(f"{request.method} {request.path}\n".encode())
+    digest.update(request.get_data())
+    return digest.hexdigest()
+
+def _replay(row) -> Response:
+    response = Response(row['response_body'], status=row['response_status'], mimetype='application/json')
+    response.headers['Idempotent-Replayed'] = 'true'
+    return response
+
+def _duplicate(session, user_id: int, key: str, request_hash: str):
+    """Answer a request whose key is already committed by an earlier request."""
+    row = idempotency_store.get(session, user_id, key)
+    session.rollback()
+    if row is not None and row['request_hash'] != request_hash:
+        return jsonify({'message': 'Idempotency-Key was already used with a different request!'}), 422
+    if row is not None and row['status'] != 'completed':
+        row = idempotency_store.wait_for_completion(session, user_id, key, WAIT_TIMEOUT)
+    if row is None:
+        # Expired and purged in the meantime; let the client retry
+        return jsonify({'message': 'A request with this Idempotency-Key failed, please retry.'}), 409
+    if row['status'] != 'completed':
+        # The write committed but its response was not stored; never run it again
+        return jsonify({'message': 'A request with this Idempotency-Key was already processed.'}), 409
+    return _replay(row)
+
+def idempotent(f):
+    """Honour an ``Idempotency-Key`` header on a write endpoint (use after token_required).
+
+    The key is inserted in the request session's transaction, so it commits
+    together with the handler's writes or disappears with their rollback.
+    Repeats of a committed key get the stored response back without running
+    the handler again; a repeat that arrives while the first request is still
+    running waits for it. A request that wrote nothing (rolled back, or 5xx
+    before commit) leaves no key, so a retry runs again.
+    """
+    @wraps(f)
+    def decorated(*args, **kwargs):
+        key = request.headers.get('Idempotency-Key')
+        if not key:
+            return f(*args, **kwargs)
+        if len(key) > MAX_KEY_LENGTH:
+            return jsonify({'message': f'Idempotency-Key must be at most {MAX_KEY_LENGTH} characters!'}), 400
+
+        session = get_db_session()
+        current_user = g.current_user
+        user_id = int(current_user['id']) if isinstance(current_user['id'], str) else current_user['id']
+        request_hash = _request_hash()
+
+        try:
+            claimed = idempotency_store.claim(session, user_id, key, request_hash, lock_timeout=WAIT_TIMEOUT)
+        except OperationalError:
+            # Timed out waiting for the first request's transaction
+            session.rollback()
+            return jsonify({'message': 'A request with this Idempotency-Key is still in progress.'}), 409
+        if not claimed:
+            return _duplicate(session, user_id, key, request_hash)
+
+        try:
+            response = make_response(f(*args, **kwargs))
+        except Exception:
+            session.rollback()
+            raise
+        if response.status_code >= 500:
+            # Drops the key unless the handler already committed its write with it
+            session.rollback()
+            return response
+        try:
+            idempotency_store.complete(session, user_id, key, response.status_code,
+                                       response.get_data(as_text=True))
+        except SQLAlchemyError:
+            # The write (if any) is committed with the key, so retries get 409, not a second run
+            session.rollback()
+            logger.exception("Could not store the idempotent response", extra={'user_id': user_id})
+        return response
+    return decorated
@@ -0,0 +1,61 @@
+import dataclasses
+import datetime
+import decimal
+from flask.json.provider import DefaultJSONProvider
+from sqlalchemy.engine import Row
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - falls back to the stdlib encoder
+    orjson = None
+
+def _default(obj):
+    """Types the encoder does not handle natively."""
+    if isinstance(obj, decimal.Decimal):
+        # Matches the float(...) conversion done by the models' to_dict()
+        return float(obj)
+    if isinstance(obj, Row):
+        return obj._asdict()
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    if isinstance(obj, (datetime.date, datetime.datetime)):
+        # ISO 8601 like orjson and to_dict(), not Flask's HTTP-date default
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+class FastJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson.
+
+    datetime/date/UUID/dataclasses are encoded natively, Decimal as float and
+    SQLAlchemy Row objects as objects keyed by column label, so list endpoints
+    can hand query rows to jsonify without calling to_dict() per row. Falls back
+    to Flask's default provider when orjson is not installed.
+    """
+    OPTIONS = orjson.OPT_NON_STR_KEYS if orjson else 0
+
+    @staticmethod
+    def default(obj):
+        try:
+            return _default(obj)
+        except TypeError:
+            return DefaultJSONProvider.default(obj)
+
+    def dumps(self, obj, **kwargs):
+        if orjson is None or kwargs:
+            return super().dumps(obj, **kwargs)
+        return orjson.dumps(obj, default=_default, option=self.OPTIONS).decode()
+
+    def dumpb(self, obj) -> bytes:
+        """Encode straight to bytes (no intermediate str)."""
+        if orjson is None:
+            return super().dumps(obj).encode()
+        return orjson.dumps(obj, default=_default, option=self.OPTIONS)
+
+    def loads(self, s, **kwargs):
+        if orjson is None or kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(self.dumpb(obj), mimetype=self.mimetype)
@@ -0,0 +1,93 @@
+from typing import Optional
+from flask import g, has_request_context
+from sqlalchemy import inspect
+from sqlalchemy.orm import Session
+
+from app.models.account import Account
+from app.models.user import User
+
+# Marks a lookup that already ran and found nothing
+_MISSING = object()
+
+class RequestLoader:
+    """Per-request identity map for accounts and users.
+
+    Ownership helpers, services and repositories all resolve rows through the
+    same loader, so each distinct account or user is fetched at most once per
+    request. Misses are remembered too.
+    """
+    def __init__(self, session: Session):
+        self.session = session
+        self._accounts = {}
+        self._account_ids_by_number = {}
+        self._users = {}
+
+    def account(self, account_id) -> Optional[Account]:
+        try:
+            account_id = int(account_id)
+        except (TypeError, ValueError):
+            return None
+        account = self._cached(self._accounts, account_id)
+        if account is None:
+            account = self.session.get(Account, account_id)
+            self._remember_account(account, account_id=account_id)
+        return None if account is _MISSING else account
+
+    def account_by_number(self, account_number: str) -> Optional[Account]:
+        account_id = self._account_ids_by_number.get(account_number)
+        if account_id is _MISSING:
+            return None
+        if account_id is not None:
+            account = self.account(account_id)
+            if account is not None:
+                return account
+        account = self.session.query(Account).filter(Account.account_number == account_number).first()
+        self._remember_account(account, account_number=account_number)
+        return account
+
+    def user(self, user_id) -> Optional[User]:
+        try:
+            user_id = int(user_id)
+        except (TypeError, ValueError):
+            return None
+        user = self._cached(self._users, user_id)
+        if user is None:
+            user = self.session.get(User, user_id)
+            self._users[user_id] = user if user is not None else _MISSING
+        return None if user is _MISSING else user
+
+    def forget_account(self, account_id):
+        self._accounts.pop(int(account_id), None)
+
+    def forget_user(self, user_id):
+        self._users.pop(int(user_id), None)
+
+    def _remember_account(self, account, account_id=None, account_number=None):
+        if account is None:
+            if account_id is not None:
+                self._accounts[account_id] = _MISSING
+            if account_number is not None:
+                self._account_ids_by_number[account_number] = _MISSING
+            return
+        self._accounts[account.id] = account
+        self._account_ids_by_number[account.account_number] = account.id
+
+    def _cached(self, entries: dict, key):
+        entry = entries.get(key)
+        if entry is None or entry is _MISSING:
+            return entry
+        # A closed session detaches its objects; load them again in that case
+        if inspect(entry).detached:
+            del entries[key]
+            return None
+        return entry
+
+def get_request_loader(session: Session) -> Optional[RequestLoader]:
+    """Return the loader for the current request and session, or None outside a request."""
+    if not has_request_context():
+        return None
+    loader = g.get('request_loader')
+    if loader is None or loader.session is not session:
+        loader = RequestLoader(session)
+        g.request_loader = loader
+    return loader
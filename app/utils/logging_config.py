@@ -0,0 +1,135 @@
+import atexit
+import json
+import logging
+import os
+import queue
+import random
+import sys
+import threading
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+
+# Attributes every LogRecord has; anything else was passed through ``extra=``
+_RECORD_ATTRIBUTES = set(vars(logging.makeLogRecord({}))) | {'message', 'asctime', 'taskName'}
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line: timestamp, level, logger, message, extras, traceback."""
+    def format(self, record):
+        entry = {
+            'ts': datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+            'thread': record.threadName,
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRIBUTES:
+                entry[key] = value
+        if record.exc_text:
+            entry['exc_info'] = record.exc_text
+        return json.dumps(entry, default=str)
+
+class DebugSampler(logging.Filter):
+    """Pass only a ``rate`` fraction of DEBUG records; higher levels always pass."""
+    def __init__(self, rate: float):
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record):
+        return record.levelno > logging.DEBUG or self.rate >= 1.0 or random.random() < self.rate
+
+class NonBlockingQueueHandler(QueueHandler):
+    """QueueHandler that drops records (and counts them) instead of blocking on a full queue."""
+    def __init__(self, log_queue):
+        super().__init__(log_queue)
+        self._dropped = 0
+        self._dropped_lock = threading.Lock()
+
+    def prepare(self, record):
+        # Render the message and traceback now; the listener thread formats the rest
+        record = logging.makeLogRecord(vars(record))
+        record.message = record.getMessage()
+        record.msg, record.args = record.message, None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            # Any logging thread can land here; += on an int is not atomic
+            with self._dropped_lock:
+                self._dropped += 1
+
+    @property
+    def dropped(self) -> int:
+        with self._dropped_lock:
+            return self._dropped
+
+class LoggingManager:
+    """Routes all logging through a bounded queue drained by one background thread.
+
+    Request threads only enqueue; formatting and stream writes happen on the
+    listener thread. Configuration comes from the environment:
+
+    LOG_LEVEL              root level (default INFO)
+    LOG_LEVELS             per-logger levels, e.g. "app.repositories=DEBUG,sqlalchemy.engine=WARNING"
+    LOG_FORMAT             json (default) or text
+    LOG_DEBUG_SAMPLE_RATE  fraction of DEBUG records kept (default 1.0)
+    LOG_QUEUE_SIZE         records buffered before new ones are dropped (default 10000)
+    """
+    def __init__(self):
+        self.handler = None
+        self.listener = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def configure(self, force: bool = False):
+        """Install the queue handler; safe to call repeatedly, and again after fork with force=True."""
+        with self._lock:
+            if self.listener is not None and self._pid == os.getpid() and not force:
+                return
+            self._stop_listener()
+
+            log_queue = queue.Queue(maxsize=int(os.getenv('LOG_QUEUE_SIZE', 10000)))
+            output = logging.StreamHandler(sys.stdout)
+            if os.getenv('LOG_FORMAT', 'json').lower() == 'json':
+                output.setFormatter(JsonFormatter())
+            else:
+                output.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(name)s: %(message)s'))
+
+            self.handler = NonBlockingQueueHandler(log_queue)
+            self.handler.addFilter(DebugSampler(float(os.getenv('LOG_DEBUG_SAMPLE_RATE', 1.0))))
+
+            root = logging.getLogger()
+            root.handlers = [self.handler]
+            root.setLevel(os.getenv('LOG_LEVEL', 'INFO').upper())
+            for item in filter(None, os.getenv('LOG_LEVELS', '').split(',')):
+                name, _, level = item.partition('=')
+                logging.getLogger(name.strip()).setLevel(level.strip().upper())
+
+            self.listener = QueueListener(log_queue, output, respect_handler_level=True)
+            self.listener.start()
+            self._pid = os.getpid()
+
+    def _stop_listener(self):
+        # A listener inherited through fork has no thread in this process
+        if self.listener is not None and self._pid == os.getpid():
+            self.listener.stop()
+        self.listener = None
+
+    def stop(self):
+        with self._lock:
+            self._stop_listener()
+
+    def stats(self) -> dict:
+        return {
+            'queued': self.handler.queue.qsize() if self.handler else 0,
+            'dropped': self.handler.dropped if self.handler else 0,
+        }
+
+# Create a global instance
+logging_manager = LoggingManager()
+atexit.register(logging_manager.stop)
@@ -0,0 +1,127 @@
+import os
+import time
+from flask import Flask, Response, g, request
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from sqlalchemy import event
+
+# With gunicorn, set PROMETHEUS_MULTIPROC_DIR (an empty directory) before the
+# app is imported. Every worker then writes its samples there and /metrics
+# aggregates all live workers, whichever worker serves the scrape.
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+REQUEST_LATENCY = Histogram(
+    'http_request_duration_seconds', 'Request latency by route',
+    ['blueprint', 'route', 'method'], buckets=LATENCY_BUCKETS
+)
+REQUESTS = Counter(
+    'http_requests_total', 'Requests by route and status',
+    ['blueprint', 'route', 'method', 'status']
+)
+IN_FLIGHT = Gauge(
+    'http_requests_in_flight', 'Requests currently being handled',
+    ['blueprint'], multiprocess_mode='livesum'
+)
+POOL_CHECKOUT_WAIT = Histogram(
+    'db_pool_checkout_wait_seconds', 'Time spent waiting for a pooled connection',
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0)
+)
+POOL_CHECKOUT_TIMEOUTS = Counter(
+    'db_pool_checkout_timeouts_total', 'Checkouts that gave up waiting for a connection'
+)
+POOL_CHECKED_OUT = Gauge(
+    'db_pool_checked_out_connections', 'Connections currently checked out',
+    ['pool'], multiprocess_mode='livesum'
+)
+POOL_OVERFLOW = Gauge(
+    'db_pool_overflow_connections', 'Connections open beyond pool_size',
+    ['pool'], multiprocess_mode='livesum'
+)
+TRANSACTION_FAILURES = Counter(
+    'transactions_failed_total', 'Rejected or failed transaction creates by reason',
+    ['reason']
+)
+
+def failure_reason(status_code: int, message) -> str:
+    """Map a failed create (status, message) onto a bounded set of reasons."""
+    text = str(message).lower()
+    if 'insufficient' in text:
+        return 'insufficient_funds'
+    if status_code == 404 or 'not found' in text:
+        return 'not_found'
+    if status_code in (401, 403) or 'unauthorized' in text:
+        return 'unauthorized'
+    if status_code >= 500:
+        return 'error'
+    return 'invalid'
+
+def record_transaction_failure(status_code: int, message):
+    TRANSACTION_FAILURES.labels(reason=failure_reason(status_code, message)).inc()
+
+def record_pool_checkout(pool, name: str = 'primary'):
+    """Refresh this process's gauges for one pool after a checkout or checkin."""
+    if not hasattr(pool, 'overflow'):
+        return
+    POOL_CHECKED_OUT.labels(pool=name).set(pool.checkedout())
+    # QueuePool.overflow() counts up from -pool_size
+    POOL_OVERFLOW.labels(pool=name).set(max(pool.overflow(), 0))
+
+def _labels():
+    rule = request.url_rule.rule if request.url_rule else 'unmatched'
+    return request.blueprint or 'app', rule
+
+def _start_request():
+    blueprint, _ = _labels()
+    g.metrics_started = time.perf_counter()
+    IN_FLIGHT.labels(blueprint=blueprint).inc()
+
+def _record_status(response):
+    blueprint, route = _labels()
+    REQUESTS.labels(blueprint=blueprint, route=route, method=request.method,
+                    status=str(response.status_code)).inc()
+    return response
+
+def _finish_request(exc):
+    started = g.pop('metrics_started', None)
+    if started is None:
+        return
+    blueprint, route = _labels()
+    IN_FLIGHT.labels(blueprint=blueprint).dec()
+    REQUEST_LATENCY.labels(blueprint=blueprint, route=route, method=request.method).observe(
+        time.perf_counter() - started
+    )
+
+def metrics_view():
+    if os.getenv('PROMETHEUS_MULTIPROC_DIR'):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return Response(generate_latest(registry), mimetype=CONTENT_TYPE_LATEST)
+
+def _watch_pool(engine, name: str):
+    event.listen(engine, 'checkout', lambda *args: record_pool_checkout(engine.pool, name))
+    event.listen(engine, 'checkin', lambda *args: record_pool_checkout(engine.pool, name))
+
+def init_metrics(app: Flask, engine, read_engines=()):
+    """Register request instrumentation, pool gauges and the /metrics endpoint.
+
+    Pool gauges are labelled ``primary`` or ``replica<N>``.
+    """
+    app.before_request(_start_request)
+    app.after_request(_record_status)
+    app.teardown_request(_finish_request)
+    app.add_url_rule('/metrics', 'metrics', metrics_view, methods=['GET'])
+
+    _watch_pool(engine, 'primary')
+    for index, read_engine in enumerate(read_engines):
+        _watch_pool(read_engine, f"replica{index}")
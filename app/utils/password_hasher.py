@@ -0,0 +1,122 @@
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from werkzeug.security import check_password_hash, generate_password_hash
+
+logger = logging.getLogger(__name__)
+
+# werkzeug method string, cost parameters included (scrypt:N:r:p or pbkdf2:sha256:iterations)
+DEFAULT_HASH_METHOD = 'scrypt:32768:8:1'
+
+class PasswordHasherBusy(RuntimeError):
+    """Raised when the hashing queue stays full for longer than the queue timeout."""
+
+class PasswordHasher:
+    """Runs password hashing/verification on a bounded process pool.
+
+    At most ``max_pending`` jobs may be queued or running; callers beyond that
+    wait up to ``queue_timeout`` seconds and then get PasswordHasherBusy, so a
+    login storm is shed instead of starving the request threads. The pool is
+    created lazily and per pid, so a preloaded gunicorn master never hands its
+    pool to forked workers. ``workers=0`` hashes inline on the calling thread.
+    """
+    def __init__(self, method: str = DEFAULT_HASH_METHOD, workers: int = 2,
+                 max_pending: int = 64, queue_timeout: float = 5.0):
+        self.method = method
+        self.workers = workers
+        self.max_pending = max_pending
+        self.queue_timeout = queue_timeout
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._lock = threading.Lock()
+        self._executor = None
+        self._rehash_executor = None
+        self._pid = None
+        self.pending = 0
+        self.peak_pending = 0
+        self.completed = 0
+        self.rejected = 0
+        self.rehashed = 0
+        self.total_wait = 0.0
+
+    def _pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None or self._pid != os.getpid():
+                # spawn: forking a multi-threaded worker process is not safe
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context('spawn')
+                )
+                self._rehash_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='rehash')
+                self._pid = os.getpid()
+            return self._executor
+
+    def _run(self, fn, *args):
+        if self.workers <= 0:
+            return fn(*args)
+        started = time.monotonic()
+        if not self._slots.acquire(timeout=self.queue_timeout):
+            with self._lock:
+                self.rejected += 1
+            raise PasswordHasherBusy("Password hashing queue is full")
+        with self._lock:
+            self.pending += 1
+            self.peak_pending = max(self.peak_pending, self.pending)
+        try:
+            return self._pool().submit(fn, *args).result()
+        finally:
+            self._slots.release()
+            with self._lock:
+                self.pending -= 1
+                self.completed += 1
+                self.total_wait += time.monotonic() - started
+
+    def hash(self, password: str) -> str:
+        return self._run(generate_password_hash, password, self.method)
+
+    def verify(self, stored_password: str, provided_password: str) -> bool:
+        return self._run(check_password_hash, stored_password, provided_password)
+
+    def needs_rehash(self, stored_password: str) -> bool:
+        """True when the stored hash was made with other parameters than ``method``."""
+        return stored_password.split('$', 1)[0] != self.method
+
+    def rehash_in_background(self, password: str, save):
+        """Hash ``password`` with the current method off the request path, then call ``save(new_hash)``."""
+        def job():
+            try:
+                save(self.hash(password))
+                with self._lock:
+                    self.rehashed += 1
+            except Exception:
+                logger.exception("Background password rehash failed")
+
+        if self.workers <= 0:
+            job()
+            return
+        self._pool()
+        self._rehash_executor.submit(job)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                'method': self.method,
+                'workers': self.workers,
+                'max_pending': self.max_pending,
+                'pending': self.pending,
+                'peak_pending': self.peak_pending,
+                'completed': self.completed,
+                'rejected': self.rejected,
+                'rehashed': self.rehashed,
+                'avg_wait_ms': round(self.total_wait / self.completed * 1000, 2) if self.completed else 0.0,
+            }
+
+# Create a global instance
+password_hasher = PasswordHasher(
+    method=os.getenv('PASSWORD_HASH_METHOD', DEFAULT_HASH_METHOD),
+    workers=int(os.getenv('PASSWORD_HASH_WORKERS', 2)),
+    max_pending=int(os.getenv('PASSWORD_HASH_MAX_PENDING', 64)),
+    queue_timeout=float(os.getenv('PASSWORD_HASH_QUEUE_TIMEOUT', 5.0))
+)
@@ -0,0 +1,87 @@
+import logging
+import os
+import time
+from contextlib import contextmanager
+from flask import Flask, g, has_request_context, request
+from sqlalchemy import event
+
+logger = logging.getLogger(__name__)
+
+class QueryStats:
+    """Counts SQL statements and database time per request.
+
+    Cursor-execute events on the engines add to counters on flask.g. After each
+    request the totals are sent as ``X-DB-Queries`` and ``Server-Timing``
+    headers and logged with the route. count_queries() / assert_max_queries()
+    reuse the same hooks to put a query budget on a block of code.
+    """
+    def __init__(self):
+        self.enabled = os.getenv('QUERY_STATS_ENABLED', 'true').lower() == 'true'
+        self._collectors = []
+
+    def init_app(self, app: Flask, *engines):
+        """Hook every engine a request can use (the primary and any read replicas)."""
+        if not self.enabled:
+            return
+        for engine in engines:
+            event.listen(engine, 'before_cursor_execute', self._before_cursor_execute)
+            event.listen(engine, 'after_cursor_execute', self._after_cursor_execute)
+        app.before_request(self._start_request)
+        app.after_request(self._finish_request)
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        if context is not None:
+            context._query_started = time.perf_counter()
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        started = getattr(context, '_query_started', None)
+        elapsed = time.perf_counter() - started if started is not None else 0.0
+        if has_request_context():
+            g.db_query_count = g.get('db_query_count', 0) + 1
+            g.db_query_time = g.get('db_query_time', 0.0) + elapsed
+        for collector in self._collectors:
+            collector.append(statement)
+
+    def _start_request(self):
+        g.db_query_count = 0
+        g.db_query_time = 0.0
+        g.request_started = time.perf_counter()
+
+    def _finish_request(self, response):
+        count = g.get('db_query_count', 0)
+        db_ms = g.get('db_query_time', 0.0) * 1000
+        total_ms = (time.perf_counter() - g.get('request_started', time.perf_counter())) * 1000
+        response.headers['X-DB-Queries'] = str(count)
+        response.headers['Server-Timing'] = (
+            f'db;dur={db_ms:.2f};desc="{count} queries", app;dur={total_ms:.2f}'
+        )
+        logger.info(
+            "%s %s %s queries=%d db_ms=%.2f total_ms=%.2f",
+            request.method, request.url_rule.rule if request.url_rule else request.path,
+            response.status_code, count, db_ms, total_ms
+        )
+        return response
+
+    @contextmanager
+    def count_queries(self):
+        """Collect the SQL statements executed inside the block into the yielded list."""
+        statements = []
+        self._collectors.append(statements)
+        try:
+            yield statements
+        finally:
+            self._collectors.remove(statements)
+
+    @contextmanager
+    def assert_max_queries(self, max_queries: int, label: str = 'block'):
+        """Fail with AssertionError when the block runs more than ``max_queries`` statements."""
+        with self.count_queries() as statements:
+            yield statements
+        if len(statements) > max_queries:
+            listing = "\n".join(f"  {index + 1}. {sql}" for index, sql in enumerate(statements))
+            raise AssertionError(
+                f"{label} ran {len(statements)} queries, budget is {max_queries}:\n{listing}"
+            )
+
+# Create a global instance
+query_stats = QueryStats()
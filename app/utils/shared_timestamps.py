@@ -0,0 +1,55 @@
+import mmap
+import os
+import struct
+import tempfile
+import threading
+import zlib
+
+# One timestamp (epoch seconds) per table slot
+_SLOT = struct.Struct('d')
+
+class SharedTimestamps:
+    """Per-user timestamps shared by every worker process on the host.
+
+    Values live in a file-backed shared memory table of ``slots`` doubles,
+    indexed by a stable hash of the user id, so a value written in one
+    gunicorn worker is read by all the others. Two users can share a slot;
+    callers must treat that as harmless (an extra primary read, an extra
+    cache miss).
+    """
+    def __init__(self, name: str, slots: int = 65536, path: str = None):
+        self.slots = slots
+        self.path = path or os.path.join(tempfile.gettempdir(), f"velvetaire-{name}-{os.getuid()}")
+        self._lock = threading.Lock()
+        self._table = None
+        self._pid = None
+        self._mapped_path = None
+
+    def _open(self) -> mmap.mmap:
+        # One mapping per process; MAP_SHARED makes every write visible to all of them.
+        # The owner may point path at another file after a mapping was made
+        with self._lock:
+            if self._table is None or self._pid != os.getpid() or self._mapped_path != self.path:
+                size = self.slots * _SLOT.size
+                fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+                try:
+                    if os.fstat(fd).st_size < size:
+                        os.ftruncate(fd, size)
+                    self._table = mmap.mmap(fd, size)
+                finally:
+                    os.close(fd)
+                self._pid = os.getpid()
+                self._mapped_path = self.path
+            return self._table
+
+    def _offset(self, user_id: str) -> int:
+        return zlib.crc32(user_id.encode()) % self.slots * _SLOT.size
+
+    def read(self, user_id: str) -> float:
+        return _SLOT.unpack_from(self._open(), self._offset(user_id))[0]
+
+    def raise_to(self, user_id: str, value: float):
+        """Store ``value`` unless the slot already holds a later one."""
+        table, offset = self._open(), self._offset(user_id)
+        if _SLOT.unpack_from(table, offset)[0] < value:
+            _SLOT.pack_into(table, offset, value)
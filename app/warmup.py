@@ -0,0 +1,51 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from sqlalchemy.pool import QueuePool
+
+from app.repositories.account import AccountRepository
+from app.repositories.transaction import TransactionRepository
+from app.repositories.user import UserRepository
+from app.utils.database_session_manager import db_session_manager
+
+logger = logging.getLogger(__name__)
+
+def open_pool_connections():
+    """Check out pool_size connections at once so they are all established."""
+    engine = db_session_manager.engine
+    size = engine.pool.size() if isinstance(engine.pool, QueuePool) else 1
+
+    def ping(_):
+        with engine.connect() as connection:
+            connection.exec_driver_sql("SELECT 1")
+
+    # Connections must be held concurrently, otherwise the pool hands back the same one
+    with ThreadPoolExecutor(max_workers=size) as executor:
+        list(executor.map(ping, range(size)))
+    return size
+
+def exercise_hot_queries(app):
+    """Run each hot repository read once to fill SQLAlchemy's compiled-statement cache."""
+    with app.app_context():
+        session = db_session_manager.SessionLocal()
+        try:
+            user = UserRepository(session).find_by_id(1)
+            user_id = user.id if user else 1
+            AccountRepository(session).find_by_user_id(user_id)
+            AccountRepository(session).find_by_id(1)
+            transactions = TransactionRepository(session)
+            transactions.get_all_transactions(limit=1)
+            transactions.find_by_user_id(user_id, limit=1)
+            transactions.find_by_account_id(1, limit=1)
+            transactions.find_with_visibility(user_id, transaction_id=1)
+        finally:
+            session.close()
+
+def warm_up(app):
+    """Prepare a freshly forked worker before it accepts traffic."""
+    try:
+        connections = open_pool_connections()
+        exercise_hot_queries(app)
+        logger.info("Worker warm-up complete (%d pooled connections)", connections)
+    except Exception:
+        # A cold worker is still better than no worker
+        logger.exception("Worker warm-up failed")
@@ -0,0 +1,5 @@
+from app.aio import create_asgi_app
+
+# Serve with an ASGI server, e.g.:
+#   hypercorn asgi:application --bind 0.0.0.0:7777
+application = create_asgi_app()
\ No newline at end of file
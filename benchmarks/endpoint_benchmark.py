@@ -0,0 +1,255 @@
+"""Endpoint latency benchmark against a local stand-in database.
+
+Boots create_app() on a throwaway SQLite file (or --database-url) and seeds
+users, accounts and transactions. It then drives login, account info,
+transaction create and every list endpoint through the Flask test client,
+recording p50/p99 latency and throughput per endpoint. Results are written
+as JSON and compared with a saved baseline. Any non-2xx response fails the
+run, so a broken scenario is never timed as if it were the real path.
+
+    python -m benchmarks.endpoint_benchmark --requests 200 --output results.json
+    python -m benchmarks.endpoint_benchmark --save-baseline
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), 'endpoint_baseline.json')
+PASSWORD = 'Benchmark123!'
+
+
+def configure_environment(database_url):
+    # Must run before the app package is imported: several singletons read env at import time
+    os.environ['DATABASE_URL'] = database_url
+    os.environ.setdefault('SECRET_KEY', 'benchmark-secret')
+    # Hash inline; the benchmark measures request handling, not pool start-up
+    os.environ.setdefault('PASSWORD_HASH_WORKERS', '0')
+    # Per-request INFO logs go to stdout, where the JSON results are printed
+    os.environ.setdefault('LOG_LEVEL', 'WARNING')
+
+
+def seed(users: int, accounts_per_user: int, transactions: int):
+    """Insert the dataset in bulk and return the ids the scenarios need."""
+    from sqlalchemy import insert, select
+
+    from app import db
+    from app.models.account import Account
+    from app.models.transaction import Transaction
+    from app.models.user import User
+    from app.utils.auth import hash_password
+
+    password_hash = hash_password(PASSWORD)
+    db.session.execute(insert(User), [
+        {'username': f"bench{i}", 'email': f"bench{i}@example.com", 'password': password_hash,
+         'phone': '0', 'is_admin': i == 0}
+        for i in range(users)
+    ])
+    user_ids = [row.id for row in db.session.execute(select(User.id).order_by(User.id))]
+    db.session.execute(insert(Account), [
+        {'user_id': user_id, 'account_name': f"bench-{n}", 'account_type': 'checking',
+         'account_number': f"ACC-{user_id}-{n}", 'currency': 'USD', 'balance': 1000000}
+        for user_id in user_ids
+        for n in range(accounts_per_user)
+    ])
+    accounts = db.session.execute(select(Account.id, Account.account_number).order_by(Account.id)).all()
+    account_ids = [account.id for account in accounts]
+
+    started = datetime.now(timezone.utc) - timedelta(days=365)
+    db.session.execute(insert(Transaction), [
+        {
+            'transaction_number': f"TRF-{(started + timedelta(days=i // 999999)):%Y%m%d}-{i % 999999 + 1:06d}",
+            'from_account_id': account_ids[i % len(account_ids)],
+            'to_account_id': account_ids[(i * 7 + 1) % len(account_ids)],
+            'amount': (i % 500) + 1,
+            'transaction_type': 'transfer',
+            'description': 'benchmark seed',
+            'created_at': started + timedelta(seconds=i * 60),
+        }
+        for i in range(transactions)
+    ])
+    db.session.commit()
+    return {
+        'admin': {'email': 'bench0@example.com', 'id': user_ids[0]},
+        'user': {'email': 'bench1@example.com', 'id': user_ids[1]},
+        # Accounts owned by the regular user (ids are assigned in insert order)
+        'accounts': account_ids[accounts_per_user:2 * accounts_per_user],
+        'account_numbers': [account.account_number
+                            for account in accounts[accounts_per_user:2 * accounts_per_user]],
+    }
+
+
+def login(client, email):
+    response = client.post('/revoubank/login', json={'email': email, 'password': PASSWORD})
+    return response.get_json()['token']
+
+
+def scenarios(fixtures, admin_token, user_token):
+    """(name, method, path, json body, token) per endpoint under test."""
+    user_id = fixtures['user']['id']
+    from_account = fixtures['accounts'][0]
+    # create_transaction reads the from_account/to_account keys; account numbers pass its format check
+    from_number, to_number = fixtures['account_numbers'][:2]
+    transfer = {'transaction_type': 'transfer', 'amount': 1, 'description': 'benchmark',
+                'from_account': from_number, 'to_account': to_number}
+    return [
+        ('login', 'POST', '/revoubank/login',
+         {'email': fixtures['user']['email'], 'password': PASSWORD}, None),
+        ('account_info', 'GET', f"/revoubank/accounts/{from_account}/info", None, user_token),
+        ('transaction_create', 'POST', '/revoubank/transactions/create', transfer, user_token),
+        ('accounts_all', 'GET', '/revoubank/accounts/all', None, admin_token),
+        ('accounts_by_user', 'GET', f"/revoubank/accounts/{user_id}", None, user_token),
+        ('users_all', 'GET', '/revoubank/users/all', None, admin_token),
+        ('transactions_all_page', 'GET', '/revoubank/transactions/all?limit=100', None, admin_token),
+        ('transactions_by_user_page', 'GET',
+         f"/revoubank/transactions/userid/{user_id}?limit=100", None, user_token),
+        ('transactions_by_account_page', 'GET',
+         f"/revoubank/transactions/account/{from_account}?limit=100", None, user_token),
+        ('transactions_by_account_all', 'GET',
+         f"/revoubank/transactions/account/{from_account}", None, user_token),
+        ('account_statement_csv', 'GET',
+         f"/revoubank/accounts/{from_account}/statement", None, user_token),
+    ]
+
+
+def percentile(sorted_values, fraction):
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def measure(client, method, path, body, token, requests, warmup):
+    headers = {'Authorization': f"Bearer {token}"} if token else {}
+    for _ in range(warmup):
+        client.open(path, method=method, json=body, headers=headers).get_data()
+    latencies = []
+    errors = 0
+    started = time.perf_counter()
+    for _ in range(requests):
+        request_started = time.perf_counter()
+        response = client.open(path, method=method, json=body, headers=headers)
+        # Drain streamed bodies so their cost is included
+        response.get_data()
+        latencies.append(time.perf_counter() - request_started)
+        if not 200 <= response.status_code < 300:
+            errors += 1
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    return {
+        'requests': requests,
+        'errors': errors,
+        'p50_ms': round(percentile(latencies, 0.50) * 1000, 3),
+        'p99_ms': round(percentile(latencies, 0.99) * 1000, 3),
+        'mean_ms': round(sum(latencies) / len(latencies) * 1000, 3),
+        'throughput_rps': round(requests / elapsed, 1) if elapsed else 0.0,
+    }
+
+
+def compare(results, baseline, threshold):
+    """Per-endpoint p50/p99 change against the baseline; returns (report, regressed names)."""
+    report, regressions = {}, []
+    for name, current in results['endpoints'].items():
+        previous = baseline.get('endpoints', {}).get(name)
+        if not previous:
+            continue
+        change = {
+            metric: round((current[metric] - previous[metric]) / previous[metric] * 100, 1)
+            if previous[metric] else None
+            for metric in ('p50_ms', 'p99_ms', 'throughput_rps')
+        }
+        report[name] = change
+        if change['p50_ms'] is not None and change['p50_ms'] > threshold * 100:
+            regressions.append(name)
+    return report, regressions
+
+
+def git_revision():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(args) -> dict:
+    workdir = None
+    database_url = args.database_url
+    if not database_url:
+        workdir = tempfile.mkdtemp(prefix='velvetaire-bench-')
+        database_url = f"sqlite:///{os.path.join(workdir, 'bench.db')}"
+    configure_environment(database_url)
+
+    from app import create_app, db
+
+    app = create_app()
+    with app.app_context():
+        db.create_all()
+        fixtures = seed(args.users, args.accounts_per_user, args.transactions)
+
+    client = app.test_client()
+    admin_token = login(client, fixtures['admin']['email'])
+    user_token = login(client, fixtures['user']['email'])
+
+    endpoints = {}
+    for name, method, path, body, token in scenarios(fixtures, admin_token, user_token):
+        if args.only and name not in args.only:
+            continue
+        endpoints[name] = measure(client, method, path, body, token, args.requests, args.warmup)
+        print(f"{name:32} p50 {endpoints[name]['p50_ms']:9.3f} ms  "
+              f"p99 {endpoints[name]['p99_ms']:9.3f} ms  "
+              f"{endpoints[name]['throughput_rps']:9.1f} req/s", file=sys.stderr)
+
+    return {
+        'meta': {
+            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'git_revision': git_revision(),
+            'python': platform.python_version(),
+            'database': database_url.split(':', 1)[0],
+            'users': args.users,
+            'accounts_per_user': args.accounts_per_user,
+            'transactions': args.transactions,
+            'requests': args.requests,
+        },
+        'endpoints': endpoints,
+    }
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--database-url', help='defaults to a temporary SQLite file')
+    parser.add_argument('--users', type=int, default=200)
+    parser.add_argument('--accounts-per-user', type=int, default=3)
+    parser.add_argument('--transactions', type=int, default=50000)
+    parser.add_argument('--requests', type=int, default=200, help='timed requests per endpoint')
+    parser.add_argument('--warmup', type=int, default=10)
+    parser.add_argument('--only', nargs='*', help='endpoint names to run')
+    parser.add_argument('--output', help='write the JSON results here (default: stdout)')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE)
+    parser.add_argument('--save-baseline', action='store_true', help='store these results as the baseline')
+    parser.add_argument('--threshold', type=float, default=0.20,
+                        help='p50 slowdown that counts as a regression (0.20 = 20%%)')
+    args = parser.parse_args()
+
+    results = run(args)
+    failed = [name for name, endpoint in results['endpoints'].items() if endpoint['errors']]
+    results['failed'] = failed
+    exit_code = 1 if failed else 0
+    if args.save_baseline and not failed:
+        with open(args.baseline, 'w') as baseline_file:
+            json.dump(results, baseline_file, indent=2)
+    elif os.path.exists(args.baseline):
+        with open(args.baseline) as baseline_file:
+            results['baseline_change_pct'], regressions = compare(results, json.load(baseline_file), args.threshold)
+        results['regressions'] = regressions
+        exit_code = 1 if regressions or failed else 0
+
+    output = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, 'w') as output_file:
+            output_file.write(output)
+    else:
+        print(output)
+    sys.exit(exit_code)
@@ -0,0 +1,101 @@
+"""ORM vs Core/DTO read path benchmark for the list endpoints.
+
+Seeds N transactions inside a transaction that is rolled back afterwards,
+then times fetching them through TransactionRepository.get_all_transactions
+as tracked ORM instances + to_dict() against the untracked TransactionRow
+path (as_rows=True), including JSON encoding with the app's provider.
+
+    DATABASE_URL=postgresql://... python -m benchmarks.read_path_benchmark --rows 100000
+"""
+import argparse
+import gc
+import json
+import statistics
+import time
+import uuid
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app import create_app, db
+from app.repositories.transaction import TransactionRepository
+
+
+def seed(connection, rows: int):
+    tag = uuid.uuid4().hex[:8]
+    user_id = connection.execute(text("""
+        INSERT INTO users (username, email, password, phone, is_admin)
+        VALUES (:name, :name || '@example.com', 'x', '0', false) RETURNING id
+    """), {'name': f"readbench_{tag}"}).scalar()
+    account_ids = connection.execute(text("""
+        INSERT INTO accounts (user_id, account_name, account_type, account_number, currency, balance)
+        SELECT :user_id, 'readbench', 'checking', 'ACC-' || :tag || '-' || g, 'USD', 0
+        FROM generate_series(1, 2) g RETURNING id
+    """), {'user_id': user_id, 'tag': tag}).scalars().all()
+    connection.execute(text("""
+        INSERT INTO transactions (transaction_number, from_account_id, to_account_id,
+                                  amount, transaction_type, description, created_at)
+        SELECT 'RB-' || :tag || '-' || g, :a, :b, (g % 500) + 0.25, 'transfer',
+               'read benchmark', now() - (g || ' seconds')::interval
+        FROM generate_series(1, :rows) g
+    """), {'tag': tag, 'a': account_ids[0], 'b': account_ids[1], 'rows': rows})
+    connection.execute(text("ANALYZE transactions"))
+
+
+def time_path(session, app, rows: int, as_rows: bool, repeat: int) -> dict:
+    fetch_times, encode_times = [], []
+    for _ in range(repeat):
+        session.expunge_all()
+        gc.collect()
+        repository = TransactionRepository(session)
+
+        started = time.perf_counter()
+        items = repository.get_all_transactions(limit=rows, as_rows=as_rows)
+        if not as_rows:
+            items = [item.to_dict() for item in items]
+        fetched = time.perf_counter()
+        body = app.json.dumps(items)
+        encoded = time.perf_counter()
+
+        fetch_times.append(fetched - started)
+        encode_times.append(encoded - fetched)
+    return {
+        'rows': len(items),
+        'fetch_seconds': round(statistics.median(fetch_times), 4),
+        'encode_seconds': round(statistics.median(encode_times), 4),
+        'total_seconds': round(statistics.median(fetch_times) + statistics.median(encode_times), 4),
+        'tracked_in_session': len(session.identity_map),
+        'body_bytes': len(body),
+    }
+
+
+def run(rows: int, repeat: int) -> dict:
+    app = create_app()
+    with app.app_context():
+        connection = db.engine.connect()
+        outer = connection.begin()
+        try:
+            seed(connection, rows)
+            session = Session(bind=connection)
+            orm = time_path(session, app, rows, as_rows=False, repeat=repeat)
+            core = time_path(session, app, rows, as_rows=True, repeat=repeat)
+            session.close()
+        finally:
+            outer.rollback()
+            connection.close()
+
+    return {
+        'rows': rows,
+        'repeat': repeat,
+        'orm': orm,
+        'core_dto': core,
+        'speedup': round(orm['total_seconds'] / core['total_seconds'], 2) if core['total_seconds'] else None,
+    }
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=100000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+    print(json.dumps(run(args.rows, args.repeat), indent=2))
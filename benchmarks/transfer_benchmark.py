@@ -0,0 +1,135 @@
+"""Concurrent transfer benchmark for TransactionRepository.create.
+
+Seeds a throwaway user with N accounts, runs random transfers between them
+from several threads, then reports throughput and checks that the sum of
+all balances is unchanged.
+
+    DATABASE_URL=postgresql://... python -m benchmarks.transfer_benchmark --threads 16
+"""
+import argparse
+import json
+import random
+import threading
+import time
+import uuid
+from decimal import Decimal
+
+from sqlalchemy import func
+
+from app import create_app
+from app.models.account import Account
+from app.models.transaction import Transaction
+from app.models.transaction_summary import TransactionDailySummary
+from app.models.user import User
+from app.repositories.transaction import TransactionRepository
+from app.utils.database_session_manager import db_session_manager
+
+
+def seed(session, accounts: int, balance: Decimal):
+    tag = uuid.uuid4().hex[:8]
+    user = User(username=f"bench_{tag}", email=f"bench_{tag}@example.com",
+                password="x", phone="0", is_admin=False)
+    session.add(user)
+    session.flush()
+    rows = [
+        Account(user_id=user.id, account_name=f"bench-{i}", account_type="checking",
+                account_number=f"ACC-{int(tag, 16)}-{i}",
+                currency="USD", balance=balance, opening_balance=balance)
+        for i in range(accounts)
+    ]
+    session.add_all(rows)
+    session.commit()
+    return user.id, [row.id for row in rows]
+
+
+def total_balance(session, account_ids):
+    return session.query(func.sum(Account.balance)).filter(Account.id.in_(account_ids)).scalar()
+
+
+def cleanup(session, user_id, account_ids):
+    # Rollup rows reference the accounts, so they go before them in the same transaction
+    session.query(TransactionDailySummary).filter(
+        TransactionDailySummary.account_id.in_(account_ids)
+    ).delete(synchronize_session=False)
+    session.query(Transaction).filter(
+        Transaction.from_account_id.in_(account_ids) | Transaction.to_account_id.in_(account_ids)
+    ).delete(synchronize_session=False)
+    session.query(Account).filter(Account.id.in_(account_ids)).delete(synchronize_session=False)
+    session.query(User).filter(User.id == user_id).delete(synchronize_session=False)
+    session.commit()
+
+
+def worker(account_ids, transfers, results, lock):
+    session = db_session_manager.SessionLocal()
+    repository = TransactionRepository(session)
+    ok = failed = 0
+    try:
+        for _ in range(transfers):
+            from_id, to_id = random.sample(account_ids, 2)
+            try:
+                repository.create(
+                    from_account_id=from_id,
+                    to_account_id=to_id,
+                    amount=random.randint(1, 50),
+                    transaction_type="transfer",
+                    description="benchmark"
+                )
+                ok += 1
+            except ValueError:
+                # Insufficient funds is an expected outcome under contention
+                failed += 1
+    finally:
+        session.close()
+    with lock:
+        results['ok'] += ok
+        results['insufficient_funds'] += failed
+
+
+def run(threads: int, transfers: int, accounts: int, keep: bool) -> dict:
+    create_app()
+    session = db_session_manager.SessionLocal()
+    user_id, account_ids = seed(session, accounts, Decimal("1000.00"))
+    before = total_balance(session, account_ids)
+
+    results = {'ok': 0, 'insufficient_funds': 0}
+    lock = threading.Lock()
+    pool = [
+        threading.Thread(target=worker, args=(account_ids, transfers, results, lock))
+        for _ in range(threads)
+    ]
+    started = time.perf_counter()
+    for thread in pool:
+        thread.start()
+    for thread in pool:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    session.expire_all()
+    after = total_balance(session, account_ids)
+    if not keep:
+        cleanup(session, user_id, account_ids)
+    session.close()
+
+    return {
+        'threads': threads,
+        'accounts': accounts,
+        'transfers_committed': results['ok'],
+        'transfers_rejected': results['insufficient_funds'],
+        'elapsed_seconds': round(elapsed, 3),
+        'tps': round(results['ok'] / elapsed, 1) if elapsed else 0.0,
+        'total_before': str(before),
+        'total_after': str(after),
+        'balance_conserved': before == after
+    }
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--threads', type=int, default=8)
+    parser.add_argument('--transfers', type=int, default=200, help='transfers per thread')
+    parser.add_argument('--accounts', type=int, default=20)
+    parser.add_argument('--keep', action='store_true', help='keep the seeded rows')
+    args = parser.parse_args()
+    report = run(args.threads, args.transfers, args.accounts, args.keep)
+    print(json.dumps(report, indent=2))
+    raise SystemExit(0 if report['balance_conserved'] else 1)
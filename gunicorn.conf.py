@@ -0,0 +1,58 @@
+import gc
+import multiprocessing
+import os
+
+# Production server settings; override with GUNICORN_* environment variables
+bind = os.getenv('GUNICORN_BIND', '0.0.0.0:7777')
+workers = int(os.getenv('GUNICORN_WORKERS', multiprocessing.cpu_count() * 2 + 1))
+worker_class = os.getenv('GUNICORN_WORKER_CLASS', 'gthread')
+threads = int(os.getenv('GUNICORN_THREADS', 4))
+timeout = int(os.getenv('GUNICORN_TIMEOUT', 30))
+graceful_timeout = int(os.getenv('GUNICORN_GRACEFUL_TIMEOUT', 30))
+keepalive = int(os.getenv('GUNICORN_KEEPALIVE', 5))
+max_requests = int(os.getenv('GUNICORN_MAX_REQUESTS', 10000))
+max_requests_jitter = int(os.getenv('GUNICORN_MAX_REQUESTS_JITTER', 1000))
+
+# Import create_app() once in the master so workers share its pages copy-on-write
+preload_app = True
+
+
+def on_starting(server):
+    # Samples left by a previous run would be aggregated into /metrics
+    multiproc_dir = os.getenv('PROMETHEUS_MULTIPROC_DIR')
+    if multiproc_dir and os.path.isdir(multiproc_dir):
+        for name in os.listdir(multiproc_dir):
+            os.remove(os.path.join(multiproc_dir, name))
+
+
+def pre_fork(server, worker):
+    # Move everything allocated so far into the permanent generation. The
+    # collector then never touches (and so never copies) those pages in the workers.
+    gc.freeze()
+
+
+def post_fork(server, worker):
+    from app.utils.database_session_manager import db_session_manager
+    from app.utils.logging_config import logging_manager
+
+    # The master's log listener thread does not survive the fork
+    logging_manager.configure(force=True)
+
+    # Connections inherited from the master (primary and replicas) must not be shared between processes.
+    # close=False leaves the parent's sockets alone and just drops the references.
+    db_session_manager.dispose(close=False)
+
+
+def post_worker_init(worker):
+    from app.warmup import warm_up
+
+    # Runs before the worker starts accepting requests
+    warm_up(worker.wsgi)
+
+
+def child_exit(server, worker):
+    if os.getenv('PROMETHEUS_MULTIPROC_DIR'):
+        from prometheus_client import multiprocess
+
+        # Drop the dead worker's live gauges from the aggregate
+        multiprocess.mark_process_dead(worker.pid)
@@ -0,0 +1,86 @@
+"""create base schema
+
+Revision ID: 0d4b6f8a2c1e
+Revises:
+Create Date: 2026-10-17 08:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0d4b6f8a2c1e'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Databases created by app/create_tables.py before migrations existed already
+    # have these tables; they are left as they are and the later revisions apply
+    existing = set() if op.get_context().as_sql else set(sa.inspect(op.get_bind()).get_table_names())
+
+    if 'users' not in existing:
+        op.create_table(
+            'users',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('username', sa.String(length=255), nullable=False),
+            sa.Column('email', sa.String(length=255), nullable=False),
+            sa.Column('password', sa.String(length=255), nullable=False),
+            sa.Column('phone', sa.String(length=255), nullable=False),
+            sa.Column('is_admin', sa.Boolean(), nullable=False),
+            sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+            sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+            sa.PrimaryKeyConstraint('id')
+        )
+        op.create_index('ix_users_id', 'users', ['id'])
+        op.create_index('ix_users_username', 'users', ['username'], unique=True)
+        op.create_index('ix_users_email', 'users', ['email'], unique=True)
+
+    if 'accounts' not in existing:
+        op.create_table(
+            'accounts',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('user_id', sa.Integer(), nullable=False),
+            sa.Column('account_name', sa.String(length=255), nullable=False),
+            sa.Column('account_type', sa.String(length=255), nullable=False),
+            sa.Column('account_number', sa.String(length=255), nullable=False),
+            sa.Column('currency', sa.String(length=255), nullable=False),
+            sa.Column('balance', sa.Numeric(precision=10, scale=2), nullable=True),
+            sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+            sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+            sa.ForeignKeyConstraint(['user_id'], ['users.id']),
+            sa.PrimaryKeyConstraint('id'),
+            sa.UniqueConstraint('account_number')
+        )
+        op.create_index('ix_accounts_id', 'accounts', ['id'])
+
+    if 'transactions' not in existing:
+        op.create_table(
+            'transactions',
+            sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+            sa.Column('transaction_number', sa.String(length=50), nullable=False),
+            sa.Column('from_account_id', sa.Integer(), nullable=True),
+            sa.Column('to_account_id', sa.Integer(), nullable=True),
+            sa.Column('amount', sa.Numeric(precision=10, scale=2), nullable=False),
+            sa.Column('transaction_type', sa.String(length=50), nullable=False),
+            sa.Column('description', sa.String(length=255), nullable=True),
+            sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+            sa.ForeignKeyConstraint(['from_account_id'], ['accounts.id']),
+            sa.ForeignKeyConstraint(['to_account_id'], ['accounts.id']),
+            sa.PrimaryKeyConstraint('id')
+        )
+        op.create_index('ix_transactions_id', 'transactions', ['id'])
+        op.create_index('ix_transactions_transaction_number', 'transactions',
+                        ['transaction_number'], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('transactions')
+    op.drop_table('accounts')
+    op.drop_table('users')
@@ -0,0 +1,45 @@
+"""add account number counters
+
+Revision ID: 1b7d3f9a5c2e
+Revises: f2a8c4e6b1d7
+Create Date: 2026-10-17 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1b7d3f9a5c2e'
+down_revision: Union[str, None] = 'f2a8c4e6b1d7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Only used where account_number_seq is unavailable; kept so the schema matches the models
+    op.create_table(
+        'account_number_counters',
+        sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column('last_value', sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint('id')
+    )
+    # Account numbers used to be counted in a ('ACC', '') transaction number counter row
+    op.execute("""
+        INSERT INTO account_number_counters (id, last_value)
+        SELECT 1, last_value FROM transaction_number_counters
+        WHERE prefix = 'ACC' AND day = ''
+    """)
+    op.execute("DELETE FROM transaction_number_counters WHERE prefix = 'ACC' AND day = ''")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("""
+        INSERT INTO transaction_number_counters (prefix, day, last_value)
+        SELECT 'ACC', '', last_value FROM account_number_counters WHERE id = 1
+    """)
+    op.drop_table('account_number_counters')
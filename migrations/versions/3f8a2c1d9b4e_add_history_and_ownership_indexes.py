@@ -0,0 +1,53 @@
+"""add history and ownership indexes
+
+Revision ID: 3f8a2c1d9b4e
+Revises: 0d4b6f8a2c1e
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f8a2c1d9b4e'
+down_revision: Union[str, None] = '0d4b6f8a2c1e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (index name, table, columns) -- built CONCURRENTLY so writes are not blocked
+INDEXES = [
+    ('ix_transactions_from_account_id_created_at', 'transactions',
+     ['from_account_id', sa.text('created_at DESC'), sa.text('id DESC')]),
+    ('ix_transactions_to_account_id_created_at', 'transactions',
+     ['to_account_id', sa.text('created_at DESC'), sa.text('id DESC')]),
+    ('ix_transactions_created_at_id', 'transactions',
+     [sa.text('created_at DESC'), sa.text('id DESC')]),
+    ('ix_accounts_user_id_id', 'accounts', ['user_id', 'id']),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(
+                name, table, columns,
+                postgresql_concurrently=True,
+                if_not_exists=True
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(
+                name, table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True
+            )
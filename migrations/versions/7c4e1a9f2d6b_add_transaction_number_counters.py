@@ -0,0 +1,44 @@
+"""add transaction number counters
+
+Revision ID: 7c4e1a9f2d6b
+Revises: 3f8a2c1d9b4e
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c4e1a9f2d6b'
+down_revision: Union[str, None] = '3f8a2c1d9b4e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'transaction_number_counters',
+        sa.Column('prefix', sa.String(length=10), nullable=False),
+        sa.Column('day', sa.String(length=8), nullable=False),
+        sa.Column('last_value', sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint('prefix', 'day')
+    )
+    # Continue from the numbers already issued so existing ones are never reused
+    op.execute("""
+        INSERT INTO transaction_number_counters (prefix, day, last_value)
+        SELECT split_part(transaction_number, '-', 1),
+               split_part(transaction_number, '-', 2),
+               max(split_part(transaction_number, '-', 3)::bigint)
+        FROM transactions
+        WHERE transaction_number ~ '^[A-Z]{3}-[0-9]{8}-[0-9]+$'
+        GROUP BY 1, 2
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('transaction_number_counters')
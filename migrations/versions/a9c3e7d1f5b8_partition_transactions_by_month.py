@@ -0,0 +1,134 @@
+"""partition transactions by month
+
+Revision ID: a9c3e7d1f5b8
+Revises: e8b4f2a6c1d3
+Create Date: 2026-10-17 13:00:00.000000
+
+Unique constraints on a partitioned table must include the partition key, so
+the primary key becomes (id, created_at) and transaction_number is only
+unique together with created_at. The database no longer rejects a repeated
+transaction_number; TransactionNumberAllocator is the only guard.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a9c3e7d1f5b8'
+down_revision: Union[str, None] = 'e8b4f2a6c1d3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Months created past the current one; app.partitions keeps this window filled
+MONTHS_AHEAD = 3
+
+COLUMNS = ('id, transaction_number, from_account_id, to_account_id, amount, '
+           'transaction_type, description, created_at')
+
+# (index name, columns) -- built on the parent, which builds one per partition
+INDEXES = [
+    ('ix_transactions_id', ['id']),
+    ('ix_transactions_from_account_id_created_at',
+     ['from_account_id', sa.text('created_at DESC'), sa.text('id DESC')]),
+    ('ix_transactions_to_account_id_created_at',
+     ['to_account_id', sa.text('created_at DESC'), sa.text('id DESC')]),
+    ('ix_transactions_created_at_id', [sa.text('created_at DESC'), sa.text('id DESC')]),
+]
+
+
+# Creates one partition per UTC month from the oldest row in transactions_old
+# through MONTHS_AHEAD months past the current one. Computed in SQL so the
+# revision also renders in offline (--sql) mode.
+CREATE_PARTITIONS_SQL = f"""
+DO $$
+DECLARE
+    first_month date;
+    last_month date := (date_trunc('month', now() AT TIME ZONE 'UTC') + interval '{MONTHS_AHEAD} months')::date;
+BEGIN
+    SELECT date_trunc('month', coalesce(min(created_at), now()) AT TIME ZONE 'UTC')::date
+    INTO first_month FROM transactions_old;
+    WHILE first_month <= last_month LOOP
+        EXECUTE format(
+            'CREATE TABLE %I PARTITION OF transactions FOR VALUES FROM (%L) TO (%L)',
+            'transactions_p' || to_char(first_month, 'YYYY_MM'),
+            to_char(first_month, 'YYYY-MM-DD') || ' 00:00:00+00',
+            to_char(first_month + interval '1 month', 'YYYY-MM-DD') || ' 00:00:00+00'
+        );
+        first_month := (first_month + interval '1 month')::date;
+    END LOOP;
+END
+$$
+"""
+
+
+def _transaction_columns(partitioned: bool) -> list:
+    # Unique constraints on a partitioned table must include the partition key,
+    # so created_at becomes NOT NULL and joins the primary key
+    return [
+        sa.Column('id', sa.Integer(), nullable=False,
+                  server_default=sa.text("nextval('transactions_id_seq'::regclass)")),
+        sa.Column('transaction_number', sa.String(length=50), nullable=False),
+        sa.Column('from_account_id', sa.Integer(), nullable=True),
+        sa.Column('to_account_id', sa.Integer(), nullable=True),
+        sa.Column('amount', sa.Numeric(precision=10, scale=2), nullable=False),
+        sa.Column('transaction_type', sa.String(length=50), nullable=False),
+        sa.Column('description', sa.String(length=255), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=not partitioned,
+                  server_default=sa.text('now()')),
+    ]
+
+
+def _swap_tables(partitioned: bool) -> None:
+    """Copy ``transactions`` into a new table of the other shape and take over its name."""
+    op.rename_table('transactions', 'transactions_old')
+    op.create_table(
+        'transactions',
+        *_transaction_columns(partitioned),
+        **({'postgresql_partition_by': 'RANGE (created_at)'} if partitioned else {})
+    )
+
+    if partitioned:
+        op.execute(CREATE_PARTITIONS_SQL)
+        copy_columns = COLUMNS.replace('created_at', 'coalesce(created_at, now())')
+    else:
+        copy_columns = COLUMNS
+
+    op.execute(f"INSERT INTO transactions ({COLUMNS}) SELECT {copy_columns} FROM transactions_old")
+
+    # The id sequence moves with the data; dropping the old table then frees its
+    # index and constraint names
+    op.execute("ALTER SEQUENCE transactions_id_seq OWNED BY NONE")
+    op.drop_table('transactions_old')
+    op.execute("ALTER SEQUENCE transactions_id_seq OWNED BY transactions.id")
+
+    if partitioned:
+        op.create_primary_key('transactions_pkey', 'transactions', ['id', 'created_at'])
+        op.create_unique_constraint(
+            'uq_transactions_transaction_number_created_at', 'transactions',
+            ['transaction_number', 'created_at']
+        )
+    else:
+        op.create_primary_key('transactions_pkey', 'transactions', ['id'])
+        op.create_index('ix_transactions_transaction_number', 'transactions',
+                        ['transaction_number'], unique=True)
+    for column in ('from_account_id', 'to_account_id'):
+        op.create_foreign_key(f'transactions_{column}_fkey', 'transactions', 'accounts', [column], ['id'])
+    for name, columns in INDEXES:
+        op.create_index(name, 'transactions', columns)
+    op.execute("ANALYZE transactions")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Runs in one transaction and holds an exclusive lock on transactions while
+    # the rows are copied; schedule it in a maintenance window.
+    _swap_tables(partitioned=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Detached partitions are standalone tables and are not copied back
+    _swap_tables(partitioned=False)
@@ -0,0 +1,33 @@
+"""use database identity for accounts and add account number sequence
+
+Revision ID: b2d9e5f1c3a7
+Revises: 7c4e1a9f2d6b
+Create Date: 2026-10-17 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b2d9e5f1c3a7'
+down_revision: Union[str, None] = '7c4e1a9f2d6b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Ids used to be assigned as max(id) + 1, so the serial sequence never moved
+    op.execute("""
+        SELECT setval(pg_get_serial_sequence('accounts', 'id'),
+                      COALESCE((SELECT max(id) FROM accounts), 0) + 1, false)
+    """)
+    op.execute(sa.schema.CreateSequence(sa.Sequence('account_number_seq')))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute(sa.schema.DropSequence(sa.Sequence('account_number_seq')))
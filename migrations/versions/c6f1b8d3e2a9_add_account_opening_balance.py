@@ -0,0 +1,57 @@
+"""add account opening balance
+
+Revision ID: c6f1b8d3e2a9
+Revises: a9c3e7d1f5b8
+Create Date: 2026-10-17 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c6f1b8d3e2a9'
+down_revision: Union[str, None] = 'a9c3e7d1f5b8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# BALANCE_EFFECTS in app.repositories.transaction as of this revision; a migration
+# must not import the application, which keeps changing after it
+DEBIT_TYPES = ('withdrawal', 'transfer', 'payment', 'fee', 'reversal')
+CREDIT_TYPES = ('deposit', 'transfer', 'refund', 'interest', 'reversal')
+
+
+def _in_list(types):
+    return ', '.join(f"'{transaction_type}'" for transaction_type in types)
+
+
+# Whatever the transactions do not explain must have been there when the account was
+# opened. Nothing has been carried forward yet, so every transaction counts.
+BACKFILL_SQL = f"""
+    UPDATE accounts SET opening_balance = accounts.balance
+        - COALESCE((
+            SELECT sum(amount) FROM transactions
+            WHERE to_account_id = accounts.id AND transaction_type IN ({_in_list(CREDIT_TYPES)})
+        ), 0)
+        + COALESCE((
+            SELECT sum(amount) FROM transactions
+            WHERE from_account_id = accounts.id AND transaction_type IN ({_in_list(DEBIT_TYPES)})
+        ), 0)
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('accounts', sa.Column(
+        'opening_balance', sa.Numeric(precision=10, scale=2), nullable=False, server_default='0'
+    ))
+    # Existing accounts never recorded their initial balance; derive it so that
+    # reconciliation does not report every one of them
+    op.execute(BACKFILL_SQL)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('accounts', 'opening_balance')
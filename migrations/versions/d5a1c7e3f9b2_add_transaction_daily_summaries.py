@@ -0,0 +1,54 @@
+"""add transaction daily summaries
+
+Revision ID: d5a1c7e3f9b2
+Revises: b2d9e5f1c3a7
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5a1c7e3f9b2'
+down_revision: Union[str, None] = 'b2d9e5f1c3a7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'transaction_daily_summaries',
+        sa.Column('account_id', sa.Integer(), nullable=False),
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('transaction_type', sa.String(length=50), nullable=False),
+        sa.Column('direction', sa.String(length=3), nullable=False),
+        sa.Column('transaction_count', sa.BigInteger(), nullable=False),
+        sa.Column('total_amount', sa.Numeric(precision=18, scale=2), nullable=False),
+        sa.ForeignKeyConstraint(['account_id'], ['accounts.id']),
+        sa.PrimaryKeyConstraint('account_id', 'day', 'transaction_type', 'direction')
+    )
+    # Backfill from existing transactions; new writes maintain it incrementally
+    op.execute("""
+        INSERT INTO transaction_daily_summaries
+            (account_id, day, transaction_type, direction, transaction_count, total_amount)
+        SELECT account_id, day, transaction_type, direction, count(*), sum(amount)
+        FROM (
+            SELECT from_account_id AS account_id, (created_at AT TIME ZONE 'UTC')::date AS day,
+                   transaction_type, 'out' AS direction, amount
+            FROM transactions WHERE from_account_id IS NOT NULL
+            UNION ALL
+            SELECT to_account_id, (created_at AT TIME ZONE 'UTC')::date,
+                   transaction_type, 'in', amount
+            FROM transactions WHERE to_account_id IS NOT NULL
+        ) legs
+        GROUP BY account_id, day, transaction_type, direction
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('transaction_daily_summaries')
@@ -0,0 +1,35 @@
+"""add partition carry forwards
+
+Revision ID: f2a8c4e6b1d7
+Revises: c6f1b8d3e2a9
+Create Date: 2026-10-17 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2a8c4e6b1d7'
+down_revision: Union[str, None] = 'c6f1b8d3e2a9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'partition_carry_forwards',
+        sa.Column('partition_name', sa.String(length=63), nullable=False),
+        sa.Column('carried_through', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False,
+                  server_default=sa.text('now()')),
+        sa.PrimaryKeyConstraint('partition_name')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('partition_carry_forwards')
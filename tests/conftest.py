@@ -0,0 +1,45 @@
+"""Shared fixtures: each test module runs the app on its own SQLite files."""
+import os
+
+import pytest
+
+# Read once per process, when the password hasher and logging are set up
+os.environ.setdefault('PASSWORD_HASH_WORKERS', '0')
+os.environ.setdefault('LOG_LEVEL', 'WARNING')
+os.environ.setdefault('SECRET_KEY', 'velvetaire-test-secret-key-32-bytes')
+
+from tests.helpers import PASSWORD
+
+
+@pytest.fixture(scope='module')
+def make_app(tmp_path_factory):
+    """Build the Flask app on fresh SQLite files; keyword arguments override environment variables."""
+    from app import create_app
+    from app.repositories.transaction_number import transaction_number_allocator
+    from app.utils.cache import principal_cache
+
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        def make(**env):
+            directory = tmp_path_factory.mktemp('app')
+            settings = {
+                'DATABASE_URL': f"sqlite:///{directory / 'primary.db'}",
+                'DATABASE_REPLICA_URLS': '',
+                'READ_YOUR_WRITES_FILE': str(directory / 'recent-writes'),
+                **env,
+            }
+            for name, value in settings.items():
+                monkeypatch.setenv(name, value)
+            # Process-wide caches must not carry users or number blocks over
+            # from another module's database
+            principal_cache.clear()
+            principal_cache.invalidations.path = str(directory / 'principal-invalidations')
+            transaction_number_allocator._blocks.clear()
+            return create_app()
+        yield make
+
+
+@pytest.fixture(scope='module')
+def password_hash():
+    from app.utils.auth import hash_password
+    return hash_password(PASSWORD)
+
@@ -0,0 +1,11 @@
+PASSWORD = 'Tests123!'
+
+
+def login(client, email) -> str:
+    response = client.post('/revoubank/login', json={'email': email, 'password': PASSWORD})
+    assert response.status_code == 200, response.get_data(as_text=True)
+    return response.get_json()['token']
+
+
+def bearer(token) -> dict:
+    return {'Authorization': f"Bearer {token}"} if token else {}
@@ -0,0 +1,50 @@
+"""Account number check digits and the SQLite account number counter."""
+import pytest
+
+
+@pytest.fixture(scope='module')
+def app(make_app):
+    from app import db
+    from app.utils.database_session_manager import db_session_manager
+
+    app = make_app()
+    db.metadata.create_all(db_session_manager.engine)
+    return app
+
+
+def next_numbers(app, count):
+    from app.repositories.account import AccountRepository
+    from app.utils.database_session_manager import db_session_manager
+
+    with app.app_context(), db_session_manager.session_scope() as session:
+        return [AccountRepository(session).next_account_number() for _ in range(count)]
+
+
+def test_issued_numbers_pass_the_check_digit(app):
+    from app.utils import helpers
+
+    numbers = next_numbers(app, 3)
+    assert len(set(numbers)) == 3
+    assert all(helpers.is_account_number_format(number) for number in numbers)
+
+
+def test_mistyped_check_digit_is_rejected(app):
+    from app.utils import helpers
+
+    number = next_numbers(app, 1)[0]
+    for digit in '0123456789':
+        if digit != number[-1]:
+            assert not helpers.is_account_number_format(number[:-1] + digit)
+    # Numbers from before the check digit still look like account numbers
+    assert helpers.is_account_number_format('ACC-1760000000-1234')
+
+
+def test_sqlite_counts_in_its_own_table(app):
+    from sqlalchemy import text
+
+    from app.utils.database_session_manager import db_session_manager
+
+    next_numbers(app, 1)
+    with db_session_manager.engine.connect() as connection:
+        assert connection.execute(text("SELECT count(*) FROM transaction_number_counters")).scalar() == 0
+        assert connection.execute(text("SELECT last_value FROM account_number_counters")).scalar() >= 1
@@ -0,0 +1,139 @@
+"""The asyncio GET routes (app.aio) must answer exactly like the Flask ones.
+
+Every GET served by the Quart app is sent to both the Quart and the Flask
+test clients against the same SQLite (aiosqlite) database. Status codes and
+bodies must match, including pages, cursors, NDJSON streams, date filters
+and the 403/404 paths.
+"""
+import asyncio
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from tests.helpers import bearer, login
+
+TRANSACTIONS = 60
+
+CASES = [
+    ('ping', '/revoubank/ping', None),
+    ('accounts all', '/revoubank/accounts/all', 'admin'),
+    ('accounts all (not admin)', '/revoubank/accounts/all', 'user'),
+    ('accounts by user', '/revoubank/accounts/2', 'user'),
+    ('accounts of another user', '/revoubank/accounts/1', 'user'),
+    ('account info by id', '/revoubank/accounts/3/info', 'user'),
+    ('account info by number', '/revoubank/accounts/ACC-3-1/info', 'user'),
+    ('account info not found', '/revoubank/accounts/99/info', 'user'),
+    ('users all', '/revoubank/users/all', 'admin'),
+    ('user profile', '/revoubank/users/2', 'user'),
+    ('transactions all', '/revoubank/transactions/all', 'admin'),
+    ('transactions all page', '/revoubank/transactions/all?limit=7', 'admin'),
+    ('transactions all dates', '/revoubank/transactions/all?start_date=2026-01-10&end_date=2026-02-01', 'admin'),
+    ('transactions all ndjson', '/revoubank/transactions/all?limit=5&format=ndjson', 'admin'),
+    ('transactions by account ndjson', '/revoubank/transactions/account/3?limit=4&format=ndjson', 'user'),
+    ('transactions by user', '/revoubank/transactions/userid/2', 'user'),
+    ('transactions by user page', '/revoubank/transactions/userid/2?limit=5', 'user'),
+    ('transactions by user dates',
+     '/revoubank/transactions/userid/2?start_date=2026-01-05&end_date=2026-01-20', 'user'),
+    ('transactions by user next page', None, 'user'),
+    ('transactions by account', '/revoubank/transactions/account/3?limit=4', 'user'),
+    ('transactions by account number', '/revoubank/transactions/account/ACC-4-1', 'user'),
+    ('transactions by account dates',
+     '/revoubank/transactions/account/3?start_date=2026-01-05&end_date=2026-01-31', 'user'),
+    ('transactions of another account', '/revoubank/transactions/account/1', 'user'),
+    ('transaction info by id', '/revoubank/transactions/3/info', 'user'),
+    ('transaction info by number', '/revoubank/transactions/TRF-20260103-000003/info', 'user'),
+    ('transaction info forbidden', '/revoubank/transactions/1/info', 'user'),
+    ('transaction info not found', '/revoubank/transactions/9999/info', 'admin'),
+]
+
+
+def seed(engine, password_hash):
+    """Two users (the first an admin) with two accounts each and a transaction history."""
+    from sqlalchemy import insert
+
+    from app import db
+    from app.models.account import Account
+    from app.models.transaction import Transaction
+    from app.models.user import User
+
+    db.metadata.create_all(engine)
+    started = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    with engine.begin() as connection:
+        connection.execute(insert(User), [
+            {'id': user_id, 'username': f"parity{user_id}", 'email': f"parity{user_id}@example.com",
+             'password': password_hash, 'phone': '0', 'is_admin': user_id == 1}
+            for user_id in (1, 2)
+        ])
+        connection.execute(insert(Account), [
+            {'id': account_id, 'user_id': (account_id + 1) // 2, 'account_name': f"parity-{account_id}",
+             'account_type': 'checking', 'account_number': f"ACC-{account_id}-1",
+             'currency': 'USD', 'balance': 1000}
+            for account_id in (1, 2, 3, 4)
+        ])
+        connection.execute(insert(Transaction), [
+            {'transaction_number': f"TRF-{started + timedelta(days=i):%Y%m%d}-{i + 1:06d}",
+             'from_account_id': i % 4 + 1, 'to_account_id': (i + 1) % 4 + 1,
+             'amount': i + 1, 'transaction_type': 'transfer', 'description': f"parity {i}",
+             'created_at': started + timedelta(days=i)}
+            for i in range(TRANSACTIONS)
+        ])
+
+
+def _normalise(body: bytes):
+    # Key order and whitespace differ between the two JSON encoders
+    text = body.decode()
+    try:
+        return json.loads(text)
+    except ValueError:
+        pass
+    try:
+        return [json.loads(line) for line in text.splitlines() if line]
+    except ValueError:
+        # Some error paths return plain text
+        return text
+
+
+@pytest.fixture(scope='module')
+def responses(make_app, password_hash):
+    """(flask status, flask body, async status, async body) per case label."""
+    from app.aio import create_async_app
+    from app.utils.database_session_manager import db_session_manager
+
+    flask_app = make_app()
+    seed(db_session_manager.engine, password_hash)
+    async_app = create_async_app()
+
+    flask_client = flask_app.test_client()
+    tokens = {
+        None: None,
+        'admin': login(flask_client, 'parity1@example.com'),
+        'user': login(flask_client, 'parity2@example.com'),
+    }
+    first_page = flask_client.get('/revoubank/transactions/userid/2?limit=5',
+                                  headers=bearer(tokens['user'])).get_json()
+    paths = {
+        label: path or f"/revoubank/transactions/userid/2?limit=5&cursor={first_page['next_cursor']}"
+        for label, path, _ in CASES
+    }
+
+    # One event loop for every async request: the aiosqlite pool is bound to it
+    async def compare():
+        async_client = async_app.test_client()
+        results = {}
+        for label, _, role in CASES:
+            headers = bearer(tokens[role])
+            expected = flask_client.get(paths[label], headers=headers)
+            actual = await async_client.get(paths[label], headers=headers)
+            results[label] = (expected.status_code, expected.get_data(),
+                              actual.status_code, await actual.get_data())
+        return results
+
+    return asyncio.run(compare())
+
+
+@pytest.mark.parametrize('label', [label for label, _, _ in CASES])
+def test_async_route_matches_flask(responses, label):
+    expected_status, expected_body, status, body = responses[label]
+    assert status == expected_status
+    assert _normalise(body) == _normalise(expected_body)
@@ -0,0 +1,61 @@
+"""Principal cache invalidation across worker processes."""
+import os
+import time
+
+import pytest
+
+from tests.helpers import bearer, login
+
+
+def test_invalidation_reaches_other_caches_on_the_host(tmp_path):
+    from app.utils.cache import PrincipalCache
+
+    path = str(tmp_path / 'invalidations')
+    worker_a, worker_b = PrincipalCache(invalidations_path=path), PrincipalCache(invalidations_path=path)
+    worker_a.set(('1', 0), {'is_admin': True})
+    worker_b.invalidate(1)
+    assert worker_a.get(('1', 0)) is None
+
+
+def test_principal_loaded_before_an_invalidation_is_not_served(tmp_path):
+    from app.utils.cache import PrincipalCache
+
+    path = str(tmp_path / 'invalidations')
+    worker_a, worker_b = PrincipalCache(invalidations_path=path), PrincipalCache(invalidations_path=path)
+    # worker_a read the user, then worker_b committed a change before worker_a cached it
+    loaded_at = time.time()
+    worker_b.invalidate(1)
+    worker_a.set(('1', 0), {'is_admin': True}, loaded_at)
+    assert worker_a.get(('1', 0)) is None
+    worker_a.set(('1', 0), {'is_admin': False})
+    assert worker_a.get(('1', 0)) == {'is_admin': False}
+
+
+@pytest.fixture(scope='module')
+def client(make_app, password_hash):
+    from sqlalchemy import insert
+
+    from app import db
+    from app.models.user import User
+    from app.utils.database_session_manager import db_session_manager
+
+    app = make_app()
+    db.metadata.create_all(db_session_manager.engine)
+    with db_session_manager.engine.begin() as connection:
+        connection.execute(insert(User).values(
+            id=1, username='cache-check', email='cache-check@example.com',
+            password=password_hash, phone='0', is_admin=False))
+    return app.test_client()
+
+
+def test_user_deleted_in_another_worker_is_rejected(client):
+    headers = bearer(login(client, 'cache-check@example.com'))
+    # Caches the principal in this process
+    assert client.get('/revoubank/users/1', headers=headers).status_code == 200
+    pid = os.fork()
+    if pid == 0:
+        response = client.delete('/revoubank/users/1', headers=headers)
+        os._exit(0 if response.status_code == 200 else 1)
+    _, status = os.waitpid(pid, 0)
+    assert os.waitstatus_to_exitcode(status) == 0
+    assert client.get('/revoubank/users/1', headers=headers).status_code == 401
@@ -0,0 +1,70 @@
+"""Query-count budgets per endpoint.
+
+Each endpoint of the endpoint benchmark is called once through the Flask
+test client on its seeded dataset. A test fails if the endpoint returns a
+non-2xx status or runs more SQL statements than its budget. An N+1
+regression (for example a lookup per row of a list) blows the budget
+regardless of dataset size.
+"""
+import pytest
+
+from benchmarks.endpoint_benchmark import login, scenarios, seed
+
+# Maximum statements per request, including the ownership checks. These are the
+# counts measured on a cold process (principal cache empty, no transaction
+# number block reserved yet), with the cases run in this order; any extra
+# statement is a regression.
+QUERY_BUDGETS = {
+    'login': 1,
+    'account_info': 2,
+    # principal (if not cached), 2 account lookups, number block, insert, 2 balance updates,
+    # 2 rollup upserts, refresh
+    'transaction_create': 10,
+    'accounts_all': 2,
+    'accounts_by_user': 2,
+    'users_all': 1,
+    'transactions_all_page': 1,
+    'transactions_by_user_page': 2,
+    'transactions_by_account_page': 2,
+    'transactions_by_account_all': 2,
+    'account_statement_csv': 2,
+}
+
+
+@pytest.fixture(scope='module')
+def benchmark(make_app):
+    """Test client and the benchmark scenarios keyed by name."""
+    from app import db
+
+    app = make_app()
+    with app.app_context():
+        db.create_all()
+        # Enough rows that a per-row query would exceed every budget
+        fixtures = seed(users=20, accounts_per_user=3, transactions=500)
+
+    client = app.test_client()
+    admin_token = login(client, fixtures['admin']['email'])
+    user_token = login(client, fixtures['user']['email'])
+    return client, {
+        name: (method, path, body, token)
+        for name, method, path, body, token in scenarios(fixtures, admin_token, user_token)
+    }
+
+
+def test_every_scenario_has_a_budget(benchmark):
+    _, cases = benchmark
+    assert set(cases) == set(QUERY_BUDGETS)
+
+
+@pytest.mark.parametrize('name', list(QUERY_BUDGETS))
+def test_query_budget(benchmark, name):
+    from app.utils.query_stats import query_stats
+
+    client, cases = benchmark
+    method, path, body, token = cases[name]
+    headers = {'Authorization': f"Bearer {token}"} if token else {}
+    with query_stats.assert_max_queries(QUERY_BUDGETS[name], label=name):
+        response = client.open(path, method=method, json=body, headers=headers)
+        response.get_data()
+    # A budget only means something for the successful path
+    assert 200 <= response.status_code < 300, f"{name}: HTTP {response.status_code}"
@@ -0,0 +1,91 @@
+"""Read-replica routing against two local SQLite databases.
+
+The same account exists in a "primary" and a "replica" database under
+different names, so every response shows which database served it.
+The tests run in file order and share one app.
+"""
+import os
+import time
+
+import pytest
+
+from tests.helpers import bearer, login
+
+WINDOW_SECONDS = 1.0
+
+
+def seed(engine, account_name, password_hash):
+    from sqlalchemy import insert
+
+    from app import db
+    from app.models.account import Account
+    from app.models.user import User
+
+    db.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(insert(User).values(
+            id=1, username='replica-check', email='replica-check@example.com',
+            password=password_hash, phone='0', is_admin=False))
+        connection.execute(insert(Account).values(
+            id=1, user_id=1, account_name=account_name, account_type='checking',
+            account_number='ACC-1-1', currency='USD', balance=100))
+
+
+@pytest.fixture(scope='module')
+def replica_app(make_app, password_hash, tmp_path_factory):
+    from app.utils.database_session_manager import db_session_manager
+
+    replica_url = f"sqlite:///{tmp_path_factory.mktemp('replica') / 'replica.db'}"
+    app = make_app(DATABASE_REPLICA_URLS=replica_url, READ_YOUR_WRITES_SECONDS=str(WINDOW_SECONDS))
+    seed(db_session_manager.engine, 'primary', password_hash)
+    seed(db_session_manager.read_engines[0], 'replica', password_hash)
+    client = app.test_client()
+    return app, client, bearer(login(client, 'replica-check@example.com'))
+
+
+def served_by(client, headers):
+    return client.get('/revoubank/accounts/1/info', headers=headers).get_json()['account_name']
+
+
+def create_account(client, headers, name):
+    return client.post('/revoubank/accounts/1/create', headers=headers, json={
+        'account_type': 'savings', 'account_name': name, 'currency': 'USD'
+    })
+
+
+def test_get_is_served_by_the_replica(replica_app):
+    _, client, headers = replica_app
+    assert served_by(client, headers) == 'replica'
+
+
+def test_replica_queries_are_counted(replica_app):
+    _, client, headers = replica_app
+    response = client.get('/revoubank/accounts/1/info', headers=headers)
+    assert int(response.headers.get('X-DB-Queries', 0)) > 0
+
+
+def test_replica_pool_is_reported_at_metrics(replica_app):
+    _, client, _ = replica_app
+    metrics = client.get('/metrics').get_data(as_text=True)
+    assert 'db_pool_checked_out_connections{pool="replica0"}' in metrics
+
+
+def test_reads_follow_the_users_write_to_the_primary(replica_app):
+    _, client, headers = replica_app
+    assert create_account(client, headers, 'new').status_code == 201
+    assert served_by(client, headers) == 'primary'
+    time.sleep(WINDOW_SECONDS + 0.5)
+    assert served_by(client, headers) == 'replica'
+
+
+def test_write_in_another_worker_pins_cookieless_clients(replica_app):
+    app, _, headers = replica_app
+    # The same user writes through a forked "worker"; this process never sees its response
+    cookieless = app.test_client(use_cookies=False)
+    pid = os.fork()
+    if pid == 0:
+        response = create_account(cookieless, headers, 'other-worker')
+        os._exit(0 if response.status_code == 201 else 1)
+    _, status = os.waitpid(pid, 0)
+    assert os.waitstatus_to_exitcode(status) == 0
+    assert served_by(cookieless, headers) == 'primary'
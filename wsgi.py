@@ -0,0 +1,5 @@
+from app import create_app
+
+# Production entry point, loaded once in the gunicorn master (see gunicorn.conf.py):
+#   gunicorn -c gunicorn.conf.py wsgi:application
+application = create_app()
\ No newline at end of file